@@ -15,6 +15,8 @@ from typing import Any
 import requests
 from dotenv import load_dotenv
 
+from . import http_client
+
 load_dotenv()
 
 # Backward compatibility:
@@ -343,7 +345,7 @@ def _request_llm_text(
         "stream": False,
     }
 
-    response = requests.post(endpoint, headers=headers, json=payload, timeout=timeout)
+    response = http_client.post(endpoint, headers=headers, json=payload, timeout=timeout)
     if response.status_code >= 400:
         body_preview = (response.text or "").strip().replace("\n", " ")[:600]
         raise requests.HTTPError(
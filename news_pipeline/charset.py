@@ -0,0 +1,80 @@
+"""Fast text decoding for downloaded pages.
+
+`requests.Response.text` falls back to charset detection over the whole body
+when the server sends no charset, which is slow on large pages. Pages are
+decoded here instead, in HTML5 precedence order: byte-order mark, the HTTP
+`charset=` parameter, a `<meta charset>` / `http-equiv` declaration in the
+first few KB, strict UTF-8, and only then `charset_normalizer` on a small
+prefix of the body.
+"""
+
+from __future__ import annotations
+
+import codecs
+import re
+
+try:  # Ships with requests >= 2.26; only used as the last resort.
+    from charset_normalizer import from_bytes
+except ImportError:  # pragma: no cover - depends on environment
+    from_bytes = None
+
+_SNIFF_BYTES = 4096
+_DETECT_BYTES = 8192
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_CONTENT_TYPE_CHARSET = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+_META_CHARSET = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?\s*([\w.:-]+)", re.IGNORECASE)
+
+
+def charset_from_content_type(content_type: str | None) -> str | None:
+    """Return the explicit `charset=` of a Content-Type header, if any."""
+    match = _CONTENT_TYPE_CHARSET.search(content_type or "")
+    return match.group(1).lower() if match else None
+
+
+def _known(encoding: str | None) -> str | None:
+    if not encoding:
+        return None
+    try:
+        return codecs.lookup(encoding).name
+    except LookupError:
+        return None
+
+
+def sniff_encoding(body: bytes, declared: str | None = None) -> str:
+    """Pick an encoding from BOM, declared charset, meta tag, UTF-8 or a prefix guess."""
+    for bom, name in _BOMS:
+        if body.startswith(bom):
+            return name
+    encoding = _known(declared)
+    if encoding:
+        return encoding
+    match = _META_CHARSET.search(body[:_SNIFF_BYTES])
+    encoding = _known(match.group(1).decode("ascii", "ignore")) if match else None
+    if encoding and encoding.startswith("utf-16"):
+        # A meta tag readable as ASCII cannot be UTF-16 (HTML5 treats it as UTF-8).
+        encoding = "utf-8"
+    if encoding:
+        return encoding
+    try:
+        body.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError as exc:
+        # A multi-byte sequence cut at the end of a capped download is still UTF-8.
+        if exc.start >= len(body) - 3 and exc.reason == "unexpected end of data":
+            return "utf-8"
+    if from_bytes is not None:
+        best = from_bytes(body[:_DETECT_BYTES]).best()
+        if best is not None and _known(best.encoding):
+            return best.encoding
+    return "utf-8"
+
+
+def decode_body(body: bytes, declared: str | None = None) -> str:
+    """Decode a page body; undecodable bytes are replaced, never raised."""
+    if not body:
+        return ""
+    return body.decode(sniff_encoding(body, declared), errors="replace")
@@ -0,0 +1,154 @@
+"""Per-domain circuit breaker for article downloads and URL resolution.
+
+After `CIRCUIT_FAILURE_THRESHOLD` consecutive failures (timeouts, connection
+errors, 403 / 429 / 5xx) a host is "open": requests to it are skipped
+without touching the network until its cooldown expires. The first request
+after the cooldown is a half-open probe; success closes the breaker, failure
+re-opens it with the cooldown doubled (up to `CIRCUIT_MAX_COOLDOWN_HOURS`).
+
+State lives in the local SQLite store, so a publisher that was down in one
+run is not retried by every scheduled run until its cooldown has passed.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+from . import local_store
+from .config import load_config
+from .host_scheduler import host_of
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS domain_breakers (
+    host TEXT PRIMARY KEY,
+    failures INTEGER NOT NULL DEFAULT 0,
+    trips INTEGER NOT NULL DEFAULT 0,
+    opened_at REAL NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+"""
+
+# Status codes that say "this host is unavailable or blocking us", unlike 404.
+FAILURE_STATUS_CODES = frozenset({403, 429, 500, 502, 503, 504})
+# A half-open probe that never reported back (crashed worker) is retried after this.
+_PROBE_TIMEOUT_SEC = 120.0
+
+_LOCK = threading.Lock()
+# host -> {"failures", "trips", "opened_at"}; loaded from SQLite on first use.
+_states: dict[str, dict[str, Any]] = {}
+_probes: dict[str, float] = {}
+_stats = {"short_circuited": 0, "opened": 0, "closed": 0}
+
+
+def _settings() -> tuple[bool, int, float, float]:
+    cfg = load_config()
+    return (
+        cfg.circuit_breaker_enabled,
+        max(1, cfg.circuit_failure_threshold),
+        max(0.0, cfg.circuit_cooldown_minutes) * 60.0,
+        max(0.0, cfg.circuit_max_cooldown_hours) * 3600.0,
+    )
+
+
+def _load(host: str) -> dict[str, Any]:
+    """Return the cached state for a host (caller holds _LOCK)."""
+    state = _states.get(host)
+    if state is not None:
+        return state
+    state = {"failures": 0, "trips": 0, "opened_at": 0.0}
+    try:
+        local_store.ensure_schema("domain_breakers", _SCHEMA)
+        row = local_store.fetch_one(
+            "SELECT failures, trips, opened_at FROM domain_breakers WHERE host = ?",
+            (host,),
+        )
+        if row:
+            state = {"failures": int(row[0]), "trips": int(row[1]), "opened_at": float(row[2])}
+    except Exception as exc:
+        print(f"[WARN] circuit breaker load failed | host={host} | error={exc}")
+    _states[host] = state
+    return state
+
+
+def _save(host: str, state: dict[str, Any]) -> None:
+    try:
+        local_store.ensure_schema("domain_breakers", _SCHEMA)
+        local_store.execute(
+            "INSERT OR REPLACE INTO domain_breakers (host, failures, trips, opened_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (host, state["failures"], state["trips"], state["opened_at"], time.time()),
+        )
+    except Exception as exc:
+        print(f"[WARN] circuit breaker save failed | host={host} | error={exc}")
+
+
+def _cooldown(trips: int, base: float, ceiling: float) -> float:
+    return min(base * (2 ** max(0, trips - 1)), ceiling or base)
+
+
+def allow_request(url: str) -> bool:
+    """Return False when the URL's host is open (or already being probed)."""
+    enabled, _, base_cooldown, max_cooldown = _settings()
+    host = host_of(url)
+    if not enabled or not host:
+        return True
+    now = time.time()
+    with _LOCK:
+        state = _load(host)
+        if not state["opened_at"]:
+            return True
+        if now - state["opened_at"] < _cooldown(state["trips"], base_cooldown, max_cooldown):
+            _stats["short_circuited"] += 1
+            return False
+        # Half-open: let a single probe through.
+        probe_started = _probes.get(host)
+        if probe_started is not None and now - probe_started < _PROBE_TIMEOUT_SEC:
+            _stats["short_circuited"] += 1
+            return False
+        _probes[host] = now
+        return True
+
+
+def record_success(url: str) -> None:
+    host = host_of(url)
+    if not host:
+        return
+    with _LOCK:
+        state = _load(host)
+        _probes.pop(host, None)
+        if not state["failures"] and not state["opened_at"]:
+            return
+        was_open = bool(state["opened_at"])
+        state.update(failures=0, trips=0, opened_at=0.0)
+        if was_open:
+            _stats["closed"] += 1
+            print(f"[CIRCUIT] closed | host={host}")
+        _save(host, state)
+
+
+def record_failure(url: str) -> None:
+    enabled, threshold, base_cooldown, max_cooldown = _settings()
+    host = host_of(url)
+    if not enabled or not host:
+        return
+    with _LOCK:
+        state = _load(host)
+        probing = _probes.pop(host, None) is not None
+        state["failures"] += 1
+        if probing or (not state["opened_at"] and state["failures"] >= threshold):
+            state["trips"] += 1
+            state["opened_at"] = time.time()
+            _stats["opened"] += 1
+            cooldown = _cooldown(state["trips"], base_cooldown, max_cooldown)
+            print(
+                f"[CIRCUIT] open | host={host} | failures={state['failures']} "
+                f"| cooldown={cooldown / 60:.0f}min"
+            )
+        _save(host, state)
+
+
+def get_circuit_stats() -> dict[str, int]:
+    with _LOCK:
+        return dict(_stats)
@@ -86,6 +86,54 @@ class PipelineConfig:
     max_entries_per_feed: int
     google_window_days: int
     max_google_windows: int
+    google_adaptive_windows: bool
+    google_saturation_threshold: int
+    fetch_max_workers: int
+    fetch_per_host_limit: int
+    extract_max_workers: int
+    extract_timeout: int
+    extract_per_domain_limit: int
+    extract_tiered: bool
+    extract_early_accept_score: float
+    extract_processes: int
+    extract_cpu_limit_sec: float
+    extract_wall_limit_sec: float
+    host_rate_per_sec: float
+    host_burst: int
+    host_limit_overrides: str
+    cache_dir: str
+    feed_conditional_get: bool
+    seen_index_enabled: bool
+    seen_index_retention_days: int
+    url_cache_ttl_hours: int
+    url_cache_negative_ttl_hours: int
+    url_cache_memory_size: int
+    html_cache_enabled: bool
+    download_max_bytes: int
+    download_max_decompressed_bytes: int
+    circuit_breaker_enabled: bool
+    circuit_failure_threshold: int
+    circuit_cooldown_minutes: float
+    circuit_max_cooldown_hours: float
+    ingest_batch_size: int
+    near_dup_mode: str
+    near_dup_threshold: float
+    near_dup_lookback_days: int
+    hash_filter_enabled: bool
+    hash_filter_capacity: int
+    hash_filter_fpr: float
+    hash_filter_bootstrap_max_rows: int
+    hash_filter_max_age_hours: float
+    feed_ledger_enabled: bool
+    feed_adaptive_polling: bool
+    feed_poll_floor_hours: float
+    feed_low_yield_ratio: float
+    feed_ledger_lookback_runs: int
+    http_retries: int
+    http_backoff_sec: float
+    http_pool_size_per_host: int
+    http_pool_size_overrides: str
+    http2_hosts: str
 
 
 def load_config() -> PipelineConfig:
@@ -102,6 +150,57 @@ def load_config() -> PipelineConfig:
         max_entries_per_feed=int(os.getenv("MAX_ENTRIES_PER_FEED", "80")),
         google_window_days=int(os.getenv("GOOGLE_WINDOW_DAYS", "7")),
         max_google_windows=int(os.getenv("MAX_GOOGLE_WINDOWS", "24")),
+        google_adaptive_windows=os.getenv("GOOGLE_ADAPTIVE_WINDOWS", "true").lower() == "true",
+        google_saturation_threshold=int(os.getenv("GOOGLE_SATURATION_THRESHOLD", "95")),
+        fetch_max_workers=int(os.getenv("FETCH_MAX_WORKERS", "8")),
+        fetch_per_host_limit=int(os.getenv("FETCH_PER_HOST_LIMIT", "4")),
+        extract_max_workers=int(os.getenv("EXTRACT_MAX_WORKERS", "8")),
+        extract_timeout=int(os.getenv("EXTRACT_TIMEOUT_SEC", "12")),
+        extract_per_domain_limit=int(os.getenv("EXTRACT_PER_DOMAIN_LIMIT", "2")),
+        extract_tiered=os.getenv("EXTRACT_TIERED", "true").lower() == "true",
+        extract_early_accept_score=float(os.getenv("EXTRACT_EARLY_ACCEPT_SCORE", "200")),
+        extract_processes=int(os.getenv("EXTRACT_PROCESSES", str(os.cpu_count() or 1))),
+        extract_cpu_limit_sec=float(os.getenv("EXTRACT_CPU_LIMIT_SEC", "10")),
+        extract_wall_limit_sec=float(os.getenv("EXTRACT_WALL_LIMIT_SEC", "30")),
+        host_rate_per_sec=float(os.getenv("HOST_RATE_PER_SEC", "1.0")),
+        host_burst=int(os.getenv("HOST_BURST", "2")),
+        host_limit_overrides=os.getenv(
+            "HOST_LIMIT_OVERRIDES",
+            "news.google.com=4/5,retaildive.com=1/0.5,supplychaindive.com=1/0.5,pymnts.com=1/0.5,techcrunch.com=2/1",
+        ),
+        cache_dir=os.getenv("PIPELINE_CACHE_DIR", ".cache/news_pipeline"),
+        feed_conditional_get=os.getenv("FEED_CONDITIONAL_GET", "true").lower() == "true",
+        seen_index_enabled=os.getenv("SEEN_INDEX_ENABLED", "true").lower() == "true",
+        seen_index_retention_days=int(os.getenv("SEEN_INDEX_RETENTION_DAYS", "90")),
+        url_cache_ttl_hours=int(os.getenv("URL_CACHE_TTL_HOURS", "720")),
+        url_cache_negative_ttl_hours=int(os.getenv("URL_CACHE_NEGATIVE_TTL_HOURS", "6")),
+        url_cache_memory_size=int(os.getenv("URL_CACHE_MEMORY_SIZE", "4096")),
+        html_cache_enabled=os.getenv("HTML_CACHE_ENABLED", "false").lower() == "true",
+        download_max_bytes=int(os.getenv("DOWNLOAD_MAX_BYTES", "3000000")),
+        download_max_decompressed_bytes=int(os.getenv("DOWNLOAD_MAX_DECOMPRESSED_BYTES", "8000000")),
+        circuit_breaker_enabled=os.getenv("CIRCUIT_BREAKER_ENABLED", "true").lower() == "true",
+        circuit_failure_threshold=int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "4")),
+        circuit_cooldown_minutes=float(os.getenv("CIRCUIT_COOLDOWN_MINUTES", "60")),
+        circuit_max_cooldown_hours=float(os.getenv("CIRCUIT_MAX_COOLDOWN_HOURS", "48")),
+        ingest_batch_size=int(os.getenv("INGEST_BATCH_SIZE", "50")),
+        near_dup_mode=os.getenv("NEAR_DUP_MODE", "skip").strip().lower(),
+        near_dup_threshold=float(os.getenv("NEAR_DUP_THRESHOLD", "0.9")),
+        near_dup_lookback_days=int(os.getenv("NEAR_DUP_LOOKBACK_DAYS", "14")),
+        hash_filter_enabled=os.getenv("HASH_FILTER_ENABLED", "true").lower() == "true",
+        hash_filter_capacity=int(os.getenv("HASH_FILTER_CAPACITY", "200000")),
+        hash_filter_fpr=float(os.getenv("HASH_FILTER_FPR", "0.001")),
+        hash_filter_bootstrap_max_rows=int(os.getenv("HASH_FILTER_BOOTSTRAP_MAX_ROWS", "20000")),
+        hash_filter_max_age_hours=float(os.getenv("HASH_FILTER_MAX_AGE_HOURS", "24")),
+        feed_ledger_enabled=os.getenv("FEED_LEDGER_ENABLED", "true").lower() == "true",
+        feed_adaptive_polling=os.getenv("FEED_ADAPTIVE_POLLING", "true").lower() == "true",
+        feed_poll_floor_hours=float(os.getenv("FEED_POLL_FLOOR_HOURS", "48")),
+        feed_low_yield_ratio=float(os.getenv("FEED_LOW_YIELD_RATIO", "0.05")),
+        feed_ledger_lookback_runs=int(os.getenv("FEED_LEDGER_LOOKBACK_RUNS", "8")),
+        http_retries=int(os.getenv("HTTP_RETRIES", "2")),
+        http_backoff_sec=float(os.getenv("HTTP_BACKOFF_SEC", "0.5")),
+        http_pool_size_per_host=int(os.getenv("HTTP_POOL_SIZE_PER_HOST", "10")),
+        http_pool_size_overrides=os.getenv("HTTP_POOL_SIZE_OVERRIDES", "news.google.com=16"),
+        http2_hosts=os.getenv("HTTP2_HOSTS", ""),
     )
 
 
@@ -0,0 +1,213 @@
+"""Process-pool executor for CPU-bound article extraction.
+
+Download threads hand the raw page bytes to a pool of `EXTRACT_PROCESSES`
+worker processes, which decode, parse and extract them, so extraction is not
+serialized on the GIL. Each document runs under two limits:
+
+- `EXTRACT_CPU_LIMIT_SEC`: the worker arms `RLIMIT_CPU` before every document;
+  the kernel's SIGXCPU interrupts a runaway parse inside the worker.
+- `EXTRACT_WALL_LIMIT_SEC`: the submitting thread stops waiting after this
+  long, kills the pool's processes (a parse stuck in C code never sees
+  SIGXCPU) and the pool is rebuilt for the next document. Other documents
+  that were in flight on the killed pool are retried once on the new one.
+
+Runaways are returned as `extract_runaway_cpu` / `extract_runaway_wall` stats,
+retried documents as `extract_retried`, and documents that failed on both
+attempts as `extract_worker_failed`. The shared pool is shut down at exit.
+`EXTRACT_PROCESSES=0` keeps extraction on the download threads.
+"""
+
+from __future__ import annotations
+
+import atexit
+import math
+import multiprocessing
+import signal
+import threading
+import time
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from .config import load_config
+
+try:  # POSIX only; without it the wall-clock watchdog still applies.
+    import resource
+except ImportError:  # pragma: no cover - depends on platform
+    resource = None
+
+
+class CpuLimitExceeded(BaseException):
+    """Raised in a worker by SIGXCPU.
+
+    Derives from BaseException so `except Exception` blocks inside the
+    extractors cannot swallow it.
+    """
+
+
+def _on_sigxcpu(signum: int, frame: Any) -> None:
+    raise CpuLimitExceeded()
+
+
+def _init_worker() -> None:
+    if resource is not None and hasattr(signal, "SIGXCPU"):
+        signal.signal(signal.SIGXCPU, _on_sigxcpu)
+    # Ctrl-C is handled by the parent, which tears the pool down.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _set_cpu_soft_limit(limit_sec: float | None) -> None:
+    """Cap this process' total CPU time at `now + limit_sec` (None lifts the cap)."""
+    if resource is None:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if limit_sec is None:
+        soft = hard
+    else:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        soft = math.ceil(usage.ru_utime + usage.ru_stime + limit_sec)
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _extract_in_worker(
+    body: bytes,
+    declared_charset: str | None,
+    title: str,
+    early_accept_score: float | None,
+    cpu_limit_sec: float,
+) -> tuple[str | None, dict[str, int]]:
+    """Worker entry point: returns `(text, fetch-stat deltas)`."""
+    from .charset import decode_body
+    from .fetcher import extract_content_from_html, get_fetch_stats
+
+    before = get_fetch_stats()
+    try:
+        if cpu_limit_sec > 0:
+            _set_cpu_soft_limit(cpu_limit_sec)
+        text = extract_content_from_html(decode_body(body, declared_charset), title, early_accept_score)
+    except CpuLimitExceeded:
+        return None, {"extract_runaway_cpu": 1}
+    finally:
+        if cpu_limit_sec > 0:
+            _set_cpu_soft_limit(None)
+    after = get_fetch_stats()
+    deltas = {name: after[name] - before.get(name, 0) for name in after}
+    return text, {name: amount for name, amount in deltas.items() if amount}
+
+
+class ExtractExecutor:
+    """Bounded process pool with a per-document CPU and wall-clock watchdog."""
+
+    def __init__(self, workers: int, cpu_limit_sec: float, wall_limit_sec: float):
+        self._workers = max(1, workers)
+        self._cpu_limit_sec = cpu_limit_sec
+        self._wall_limit_sec = wall_limit_sec
+        self._lock = threading.Lock()
+        # At most one document per worker in flight, so the wall clock
+        # measures extraction time rather than time spent queued.
+        self._slots = threading.BoundedSemaphore(self._workers)
+        self._pool: ProcessPoolExecutor | None = None
+        self._generation = 0
+
+    def _get_pool(self) -> tuple[ProcessPoolExecutor, int]:
+        with self._lock:
+            if self._pool is None:
+                methods = multiprocessing.get_all_start_methods()
+                # forkserver/spawn: forking a process full of threads can deadlock.
+                context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    mp_context=context,
+                    initializer=_init_worker,
+                )
+            return self._pool, self._generation
+
+    def _restart(self, generation: int) -> None:
+        """Kill the pool's workers unless another thread already replaced it."""
+        with self._lock:
+            if generation != self._generation or self._pool is None:
+                return
+            pool = self._pool
+            self._pool = None
+            self._generation += 1
+        for process in list(getattr(pool, "_processes", {}).values()):
+            process.kill()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def extract(
+        self,
+        body: bytes,
+        declared_charset: str | None,
+        title: str = "",
+        early_accept_score: float | None = None,
+        url: str = "",
+    ) -> tuple[str | None, dict[str, int]]:
+        """Extract one page in a worker; returns `(text, fetch-stat deltas)`."""
+        with self._slots:
+            # A second attempt covers pools killed by another document's watchdog.
+            for attempt in range(2):
+                pool, generation = self._get_pool()
+                started = time.monotonic()
+                try:
+                    future = pool.submit(
+                        _extract_in_worker,
+                        body,
+                        declared_charset,
+                        title,
+                        early_accept_score,
+                        self._cpu_limit_sec,
+                    )
+                    result = future.result(timeout=self._wall_limit_sec or None)
+                except FutureTimeoutError:
+                    print(
+                        f"[EXTRACT-RUNAWAY] wall limit {self._wall_limit_sec:.0f}s exceeded, "
+                        f"restarting workers | url={url}"
+                    )
+                    self._restart(generation)
+                    return None, {"extract_runaway_wall": 1}
+                except (BrokenProcessPool, CancelledError, RuntimeError):
+                    self._restart(generation)
+                    continue
+                if result[1].get("extract_runaway_cpu"):
+                    print(
+                        f"[EXTRACT-RUNAWAY] cpu limit {self._cpu_limit_sec:.0f}s exceeded "
+                        f"after {time.monotonic() - started:.1f}s | url={url}"
+                    )
+                if attempt:
+                    return result[0], {**result[1], "extract_retried": 1}
+                return result
+        return None, {"extract_retried": 1, "extract_worker_failed": 1}
+
+    def shutdown(self) -> None:
+        """Stop the worker processes (the next `extract` starts a new pool)."""
+        with self._lock:
+            pool = self._pool
+            self._pool = None
+            self._generation += 1
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+_EXECUTOR_LOCK = threading.Lock()
+_executor: ExtractExecutor | None = None
+_configured = False
+
+
+def get_executor() -> ExtractExecutor | None:
+    """Return the shared executor, or None when `EXTRACT_PROCESSES=0`."""
+    global _executor, _configured
+    with _EXECUTOR_LOCK:
+        if not _configured:
+            cfg = load_config()
+            if cfg.extract_processes > 0:
+                _executor = ExtractExecutor(
+                    workers=cfg.extract_processes,
+                    cpu_limit_sec=cfg.extract_cpu_limit_sec,
+                    wall_limit_sec=cfg.extract_wall_limit_sec,
+                )
+                atexit.register(_executor.shutdown)
+            _configured = True
+        return _executor
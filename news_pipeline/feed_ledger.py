@@ -0,0 +1,247 @@
+"""Per-feed yield ledger and adaptive polling.
+
+Every run records, per feed: entries fetched (new since the run's start time
+and not already seen in another window of the run or in the seen-entry index,
+so each of them can reach the relevance filter), items extracted, items that
+passed the relevance filter, rows inserted, bytes downloaded (feed XML +
+article pages) and seconds spent. Counters accumulate in
+memory while the fetcher and processor work and are written by `flush_run()`.
+
+Feeds whose recent relevant yield is below `FEED_LOW_YIELD_RATIO` are polled
+less often, down to once every `FEED_POLL_FLOOR_HOURS`. When a throttled feed
+is polled again, its start time reaches back to its previous poll so the
+skipped runs are not lost.
+
+Print the ledger with:
+
+    python -m news_pipeline.feed_ledger [--runs 8] [--history]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from . import local_store
+from .config import load_config
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS feed_ledger (
+    run_id TEXT NOT NULL,
+    feed_url TEXT NOT NULL,
+    feed_name TEXT NOT NULL DEFAULT '',
+    run_at REAL NOT NULL,
+    fetched INTEGER NOT NULL DEFAULT 0,
+    extracted INTEGER NOT NULL DEFAULT 0,
+    relevant INTEGER NOT NULL DEFAULT 0,
+    inserted INTEGER NOT NULL DEFAULT 0,
+    bytes INTEGER NOT NULL DEFAULT 0,
+    seconds REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (run_id, feed_url)
+);
+CREATE INDEX IF NOT EXISTS idx_feed_ledger_feed_run ON feed_ledger (feed_url, run_at);
+"""
+
+_COUNTERS = ("fetched", "extracted", "relevant", "inserted", "bytes", "seconds")
+# Too little history says nothing about a feed's yield; keep polling it.
+_MIN_RUNS_BEFORE_THROTTLE = 4
+# Reach back a little further than the last poll to absorb publish-time skew.
+_CATCH_UP_BUFFER = timedelta(hours=1)
+
+_LOCK = threading.Lock()
+_run_counts: dict[str, Counter] = {}
+_run_names: dict[str, str] = {}
+
+
+def _ensure_schema() -> None:
+    local_store.ensure_schema("feed_ledger", _SCHEMA)
+
+
+def record(feed_url: str | None, feed_name: str | None = None, **counts: float) -> None:
+    """Add counts (fetched / extracted / relevant / inserted / bytes / seconds) for this run."""
+    if not feed_url:
+        return
+    with _LOCK:
+        counter = _run_counts.setdefault(feed_url, Counter())
+        for name, amount in counts.items():
+            if amount:
+                counter[name] += amount
+        if feed_name:
+            _run_names[feed_url] = feed_name
+
+
+def flush_run() -> None:
+    """Persist this run's counters (one row per polled feed) and reset them."""
+    with _LOCK:
+        rows = dict(_run_counts)
+        names = dict(_run_names)
+        _run_counts.clear()
+        _run_names.clear()
+    if not rows or not load_config().feed_ledger_enabled:
+        return
+    run_id = uuid.uuid4().hex
+    run_at = time.time()
+    try:
+        _ensure_schema()
+        local_store.executemany(
+            "INSERT OR REPLACE INTO feed_ledger "
+            "(run_id, feed_url, feed_name, run_at, fetched, extracted, relevant, inserted, bytes, seconds) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    run_id,
+                    feed_url,
+                    names.get(feed_url, ""),
+                    run_at,
+                    int(counts["fetched"]),
+                    int(counts["extracted"]),
+                    int(counts["relevant"]),
+                    int(counts["inserted"]),
+                    int(counts["bytes"]),
+                    float(counts["seconds"]),
+                )
+                for feed_url, counts in rows.items()
+            ],
+        )
+    except Exception as exc:
+        print(f"[WARN] feed ledger flush failed | error={exc}")
+
+
+def _recent_rows(feed_url: str, runs: int) -> list[tuple[float, int, int]]:
+    """Return `(run_at, fetched, relevant)` for a feed's latest polled runs."""
+    _ensure_schema()
+    return local_store.fetch_all(
+        "SELECT run_at, fetched, relevant FROM feed_ledger WHERE feed_url = ? ORDER BY run_at DESC LIMIT ?",
+        (feed_url, max(1, runs)),
+    )
+
+
+def poll_interval_hours(feed_url: str) -> float:
+    """Hours to wait between polls of a feed, from its recent relevant yield.
+
+    Yield at or above `FEED_LOW_YIELD_RATIO` polls every run (0h); zero yield
+    waits the full `FEED_POLL_FLOOR_HOURS`; in between scales linearly.
+    """
+    cfg = load_config()
+    if not (cfg.feed_ledger_enabled and cfg.feed_adaptive_polling):
+        return 0.0
+    try:
+        rows = _recent_rows(feed_url, cfg.feed_ledger_lookback_runs)
+    except Exception as exc:
+        print(f"[WARN] feed ledger lookup failed | url={feed_url} | error={exc}")
+        return 0.0
+    if len(rows) < _MIN_RUNS_BEFORE_THROTTLE:
+        return 0.0
+    fetched = sum(row[1] for row in rows)
+    relevant = sum(row[2] for row in rows)
+    ratio = relevant / fetched if fetched else 0.0
+    threshold = max(cfg.feed_low_yield_ratio, 1e-9)
+    return max(0.0, cfg.feed_poll_floor_hours * (1.0 - min(1.0, ratio / threshold)))
+
+
+def last_polled_at(feed_url: str) -> datetime | None:
+    try:
+        rows = _recent_rows(feed_url, 1)
+    except Exception:
+        return None
+    return datetime.fromtimestamp(rows[0][0], tz=timezone.utc) if rows else None
+
+
+def should_poll(feed_url: str, now: datetime | None = None) -> tuple[bool, float]:
+    """Return `(due, interval_hours)` for a feed under adaptive polling."""
+    interval = poll_interval_hours(feed_url)
+    if interval <= 0:
+        return True, interval
+    last = last_polled_at(feed_url)
+    if last is None:
+        return True, interval
+    now = now or datetime.now(timezone.utc)
+    return now - last >= timedelta(hours=interval), interval
+
+
+def catch_up_since(feed_url: str, min_publish_time: datetime | None) -> datetime | None:
+    """Widen a run's start time back to the feed's last poll if it skipped runs."""
+    if min_publish_time is None:
+        return None
+    last = last_polled_at(feed_url)
+    if last is None:
+        return min_publish_time
+    try:
+        row = local_store.fetch_one("SELECT MAX(run_at) FROM feed_ledger")
+    except Exception:
+        return min_publish_time
+    if not row or row[0] is None or row[0] <= last.timestamp():
+        return min_publish_time
+    return min(min_publish_time, last - _CATCH_UP_BUFFER)
+
+
+def ledger_table(runs: int = 8, history: bool = False) -> list[dict[str, object]]:
+    """Aggregate the latest `runs` polls of every feed (or list them with `history`)."""
+    _ensure_schema()
+    rows = local_store.fetch_all(
+        "SELECT feed_url, feed_name, run_at, fetched, extracted, relevant, inserted, bytes, seconds "
+        "FROM feed_ledger ORDER BY feed_url, run_at DESC"
+    )
+    table: list[dict[str, object]] = []
+    per_feed: Counter = Counter()
+    for feed_url, feed_name, run_at, *counts in rows:
+        per_feed[feed_url] += 1
+        if per_feed[feed_url] > runs:
+            continue
+        entry = {"feed": feed_name or feed_url, "url": feed_url, "runs": 1, "last_run": run_at}
+        entry.update(zip(_COUNTERS, counts))
+        if history or not table or table[-1]["url"] != feed_url:
+            table.append(entry)
+            continue
+        merged = table[-1]
+        merged["runs"] += 1
+        for name in _COUNTERS:
+            merged[name] += entry[name]
+    for entry in table:
+        entry["yield"] = entry["relevant"] / entry["fetched"] if entry["fetched"] else 0.0
+        if not history:
+            entry["interval_h"] = poll_interval_hours(entry["url"])
+    return table
+
+
+def _print_table(table: list[dict[str, object]], history: bool) -> None:
+    last_col = "run_at" if history else "interval_h"
+    header = (
+        f"{'feed':<48} {'runs':>4} {'fetched':>7} {'extract':>7} {'relev':>5} {'insert':>6} "
+        f"{'yield':>6} {'KB':>8} {'sec':>7} {last_col:>16}"
+    )
+    print(header)
+    print("-" * len(header))
+    for entry in table:
+        if history:
+            tail = datetime.fromtimestamp(entry["last_run"], tz=timezone.utc).strftime("%Y-%m-%d %H:%M")
+        else:
+            tail = f"{entry['interval_h']:.1f}"
+        print(
+            f"{str(entry['feed'])[:48]:<48} {entry['runs']:>4} {entry['fetched']:>7} {entry['extracted']:>7} "
+            f"{entry['relevant']:>5} {entry['inserted']:>6} {entry['yield']:>6.1%} "
+            f"{entry['bytes'] / 1024:>8.0f} {entry['seconds']:>7.1f} {tail:>16}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Print the per-feed yield ledger.")
+    parser.add_argument("--runs", type=int, default=8, help="latest polls per feed to include")
+    parser.add_argument("--history", action="store_true", help="one row per feed per run instead of totals")
+    args = parser.parse_args(argv)
+
+    table = ledger_table(runs=args.runs, history=args.history)
+    if not table:
+        print("Feed ledger is empty.")
+        return 0
+    _print_table(table, args.history)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
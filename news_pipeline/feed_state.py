@@ -0,0 +1,133 @@
+"""Conditional GET state (ETag / Last-Modified) for RSS feed URLs.
+
+Validators from a 200 response are only staged in memory (`stage_feed_state`).
+`flush_run()` saves them once the run has processed the feed's items, and
+skips feeds with failed hash lookups or inserts (`mark_feed_failed`). A crashed
+or timed-out run saves nothing. Without this, the next run would get a 304 for
+entries that were never stored, and the advancing incremental start time would
+never fetch them again.
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timezone
+from typing import Any
+
+from . import local_store
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS feed_http_state (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    body_bytes INTEGER NOT NULL DEFAULT 0,
+    fetch_seconds REAL NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL
+);
+"""
+
+
+def get_feed_state(url: str) -> dict[str, Any] | None:
+    """Return stored validators for a feed URL, or None when never cached."""
+    try:
+        local_store.ensure_schema("feed_http_state", _SCHEMA)
+        row = local_store.fetch_one(
+            "SELECT etag, last_modified, body_bytes, fetch_seconds FROM feed_http_state WHERE url = ?",
+            (url,),
+        )
+    except Exception as exc:
+        print(f"[WARN] get_feed_state failed | url={url} | error={exc}")
+        return None
+    if not row:
+        return None
+    return {
+        "etag": row[0] or "",
+        "last_modified": row[1] or "",
+        "body_bytes": int(row[2] or 0),
+        "fetch_seconds": float(row[3] or 0.0),
+    }
+
+
+def build_conditional_headers(state: dict[str, Any] | None) -> dict[str, str]:
+    """Translate stored validators into If-None-Match / If-Modified-Since headers."""
+    if not state:
+        return {}
+    headers: dict[str, str] = {}
+    if state.get("etag"):
+        headers["If-None-Match"] = state["etag"]
+    if state.get("last_modified"):
+        headers["If-Modified-Since"] = state["last_modified"]
+    return headers
+
+
+def save_feed_state(
+    url: str,
+    *,
+    etag: str | None,
+    last_modified: str | None,
+    body_bytes: int,
+    fetch_seconds: float,
+) -> None:
+    """Store validators from a full 200 response."""
+    if not etag and not last_modified:
+        return
+    try:
+        local_store.ensure_schema("feed_http_state", _SCHEMA)
+        local_store.execute(
+            """
+            INSERT INTO feed_http_state (url, etag, last_modified, body_bytes, fetch_seconds, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(url) DO UPDATE SET
+                etag = excluded.etag,
+                last_modified = excluded.last_modified,
+                body_bytes = excluded.body_bytes,
+                fetch_seconds = excluded.fetch_seconds,
+                updated_at = excluded.updated_at
+            """,
+            (
+                url,
+                etag or "",
+                last_modified or "",
+                int(body_bytes),
+                float(fetch_seconds),
+                datetime.now(timezone.utc).isoformat(),
+            ),
+        )
+    except Exception as exc:
+        print(f"[WARN] save_feed_state failed | url={url} | error={exc}")
+
+
+_LOCK = threading.Lock()
+# feed_url -> {request url -> save_feed_state kwargs}; Google News feeds stage one entry per window.
+_staged: dict[str, dict[str, dict[str, Any]]] = {}
+_failed_feeds: set[str] = set()
+
+
+def stage_feed_state(feed_url: str, url: str, **validators: Any) -> None:
+    """Hold validators of `url` (one of `feed_url`'s requests) until `flush_run`."""
+    with _LOCK:
+        _staged.setdefault(feed_url, {})[url] = validators
+
+
+def mark_feed_failed(feed_url: str | None) -> None:
+    """Keep this run's validators of `feed_url` unsaved (some of its items were not stored)."""
+    if not feed_url:
+        return
+    with _LOCK:
+        _failed_feeds.add(feed_url)
+
+
+def flush_run() -> None:
+    """Save staged validators of feeds whose items were all processed, then reset."""
+    with _LOCK:
+        staged = dict(_staged)
+        failed = set(_failed_feeds)
+        _staged.clear()
+        _failed_feeds.clear()
+    for feed_url, requests in staged.items():
+        if feed_url in failed:
+            print(f"[FEED-STATE] not saved, items failed to store | feed={feed_url}")
+            continue
+        for url, validators in requests.items():
+            save_feed_state(url, **validators)
@@ -5,20 +5,34 @@ Responsible only for fetching and normalizing RSS news items.
 
 from __future__ import annotations
 
+import queue
 import re
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from functools import partial
 from html import unescape
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
 from email.utils import parsedate_to_datetime
-from typing import Any
-from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+from typing import Any, Iterator
 
-import certifi
 import feedparser
-import requests
 import trafilatura
 from bs4 import BeautifulSoup
 
-from .config import get_default_rss_feeds, load_config
+from . import circuit_breaker, extract_executor, feed_ledger, html_store, http_client
+from .charset import charset_from_content_type, decode_body
+from .config import PipelineConfig, get_default_rss_feeds, load_config
+from .feed_state import build_conditional_headers, get_feed_state, mark_feed_failed, stage_feed_state
+from .google_news import decode_google_news_url
+from .host_scheduler import HostLimit, HostScheduler, parse_host_limits
+from .seen_index import build_entry_keys, is_seen
+from .text_analysis import PhraseMatcher, TextAnalysis, normalize_text
+from .url_cache import get_cached_url, get_url_cache_stats, remember_url
+from .window_planner import FeedWindow, is_saturated, plan_windows, record_window_outcome, split_window
 
 REQUEST_HEADERS = {
     "User-Agent": (
@@ -50,56 +64,75 @@ PROMO_NOISE_PHRASES = [
     "注册送",
 ]
 
+NAVIGATION_NOISE_PHRASES = [
+    "skip to main content",
+    "privacy policy",
+    "terms of use",
+    "cookie policy",
+    "all rights reserved",
+    "sign in",
+    "log in",
+    "subscribe",
+    "newsletter",
+    "advertisement",
+    "menu",
+    "home",
+    "contact",
+    "about us",
+    "language",
+]
 
-def _build_google_news_windows(
-    feed_url: str,
-    min_publish_time: datetime | None,
-    window_days: int,
-    max_windows: int,
-) -> list[str]:
-    """Split a Google News RSS query into date windows to bypass 100-item cap."""
-    if "news.google.com/rss/search" not in feed_url:
-        return [feed_url]
-
-    if not min_publish_time:
-        return [feed_url]
-
-    now_utc = datetime.now(timezone.utc)
-    start = min_publish_time.astimezone(timezone.utc)
-    if start > now_utc:
-        return [feed_url]
-
-    parsed = urlparse(feed_url)
-    params = parse_qs(parsed.query, keep_blank_values=True)
-    base_q = (params.get("q", [""])[0] or "").strip()
-    if not base_q:
-        return [feed_url]
-
-    urls: list[str] = []
-    cursor = start
-    windows_count = 0
-    step = max(1, window_days)
-
-    while cursor < now_utc and windows_count < max_windows:
-        end = min(cursor + timedelta(days=step), now_utc + timedelta(days=1))
-        after_str = cursor.strftime("%Y-%m-%d")
-        before_str = end.strftime("%Y-%m-%d")
-        window_q = f"{base_q} after:{after_str} before:{before_str}"
-
-        window_params = dict(params)
-        window_params["q"] = [window_q]
-        query = urlencode(window_params, doseq=True)
-        window_url = urlunparse(
-            (parsed.scheme, parsed.netloc, parsed.path, parsed.params, query, parsed.fragment)
-        )
-        urls.append(window_url)
+# Many short language/menu tokens often means nav extraction.
+LANGUAGE_MENU_TOKENS = [
+    "english",
+    "français",
+    "deutsch",
+    "español",
+    "русский",
+    "日本語",
+    "한국어",
+    "thai",
+    "tiếng việt",
+]
+
+MARKET_DASHBOARD_PHRASES = [
+    "crypto market insights and analytics",
+    "top cryptocurrencies price list by market capitalization",
+    "live cryptocurrency prices",
+    "complete list with coin market capitalization rankings",
+    "price list by market capitalization",
+    "market data on this page is currently delayed",
+]
+
+_NOISE_MATCHER = PhraseMatcher(
+    {
+        "navigation": NAVIGATION_NOISE_PHRASES,
+        "language": LANGUAGE_MENU_TOKENS,
+        "dashboard": MARKET_DASHBOARD_PHRASES,
+        "promo": PROMO_NOISE_PHRASES,
+    }
+)
+
+_SCHEDULERS_LOCK = threading.Lock()
+_SCHEDULERS: dict[str, HostScheduler] = {}
+
+_FETCH_STATS_LOCK = threading.Lock()
+_FETCH_STATS: Counter[str] = Counter()
+
+# Extracted-but-undrained entries allowed per extract worker in `iter_rss_items`.
+_EXTRACT_QUEUE_PER_WORKER = 4
 
-        cursor = end
-        windows_count += 1
 
-    if not urls:
-        return [feed_url]
-    return urls
+def _bump_stat(name: str, amount: int = 1) -> None:
+    """Increment a fetch-side run counter (thread-safe)."""
+    with _FETCH_STATS_LOCK:
+        _FETCH_STATS[name] += amount
+
+
+def get_fetch_stats() -> dict[str, int]:
+    """Return fetch-side counters accumulated in this process."""
+    with _FETCH_STATS_LOCK:
+        return dict(_FETCH_STATS)
 
 
 def _safe_publish_time(entry: Any) -> str | None:
@@ -136,9 +169,16 @@ def _clean_html(text: str) -> str:
 
 def _normalize_text(text: str) -> str:
     """Normalize whitespace and casing for safer text comparison."""
-    if not text:
-        return ""
-    return re.sub(r"\s+", " ", text).strip().lower()
+    return normalize_text(text)
+
+
+def _analyze_candidate(text: str) -> TextAnalysis:
+    """Normalize + phrase-match a candidate; every noise heuristic reads this.
+
+    Callers that run several heuristics on one candidate build this once and
+    pass it as `analysis` (nothing is cached across documents).
+    """
+    return _NOISE_MATCHER.analyze(text)
 
 
 def _looks_like_title(candidate: str, title: str) -> bool:
@@ -154,15 +194,16 @@ def _looks_like_title(candidate: str, title: str) -> bool:
     return False
 
 
-def _is_usable_article_text(candidate: str, title: str) -> bool:
+def _is_usable_article_text(candidate: str, title: str, analysis: TextAnalysis | None = None) -> bool:
     """Heuristic to ensure extracted full text is not a title-only stub."""
     if not candidate:
         return False
     if _looks_like_title(candidate, title):
         return False
-    if _looks_like_market_dashboard_noise(candidate):
+    analysis = analysis or _analyze_candidate(candidate)
+    if _looks_like_market_dashboard_noise(candidate, analysis):
         return False
-    if _looks_like_navigation_noise(candidate):
+    if _looks_like_navigation_noise(candidate, analysis):
         return False
     # Reject heavily truncated snippets.
     if candidate.count("...") + candidate.count("…") >= 3:
@@ -170,7 +211,7 @@ def _is_usable_article_text(candidate: str, title: str) -> bool:
     return len(candidate.strip()) >= 90
 
 
-def _is_minimally_usable_text(candidate: str, title: str) -> bool:
+def _is_minimally_usable_text(candidate: str, title: str, analysis: TextAnalysis | None = None) -> bool:
     """Softer guard used when no high-quality full text is available."""
     if not candidate:
         return False
@@ -178,9 +219,10 @@ def _is_minimally_usable_text(candidate: str, title: str) -> bool:
         return False
     if _looks_like_title_suffix_stub(candidate, title):
         return False
-    if _looks_like_market_dashboard_noise(candidate):
+    analysis = analysis or _analyze_candidate(candidate)
+    if _looks_like_market_dashboard_noise(candidate, analysis):
         return False
-    if _looks_like_navigation_noise(candidate):
+    if _looks_like_navigation_noise(candidate, analysis):
         return False
     if candidate.count("...") + candidate.count("…") >= 4:
         return False
@@ -201,79 +243,28 @@ def _looks_like_title_suffix_stub(candidate: str, title: str) -> bool:
     return False
 
 
-def _looks_like_navigation_noise(candidate: str) -> bool:
+def _looks_like_navigation_noise(candidate: str, analysis: TextAnalysis | None = None) -> bool:
     """Heuristic: detect site nav/menu/cookie blobs extracted as article text."""
-    text = _normalize_text(candidate)
-    if not text:
+    analysis = analysis or _analyze_candidate(candidate)
+    if not analysis.normalized:
         return True
+    return analysis.count("navigation") >= 3 or analysis.count("language") >= 3
 
-    noisy_phrases = [
-        "skip to main content",
-        "privacy policy",
-        "terms of use",
-        "cookie policy",
-        "all rights reserved",
-        "sign in",
-        "log in",
-        "subscribe",
-        "newsletter",
-        "advertisement",
-        "menu",
-        "home",
-        "contact",
-        "about us",
-        "language",
-    ]
-    hit_count = sum(1 for phrase in noisy_phrases if phrase in text)
-    if hit_count >= 3:
-        return True
-
-    # Many short language/menu tokens often means nav extraction.
-    language_tokens = [
-        "english",
-        "français",
-        "deutsch",
-        "español",
-        "русский",
-        "日本語",
-        "한국어",
-        "thai",
-        "tiếng việt",
-    ]
-    lang_hits = sum(1 for token in language_tokens if token in text)
-    if lang_hits >= 3:
-        return True
-
-    return False
 
-
-def _looks_like_market_dashboard_noise(candidate: str) -> bool:
+def _looks_like_market_dashboard_noise(candidate: str, analysis: TextAnalysis | None = None) -> bool:
     """Detect crypto/market dashboard pages mis-identified as article body."""
-    text = _normalize_text(candidate)
-    if not text:
+    analysis = analysis or _analyze_candidate(candidate)
+    if not analysis.normalized:
         return True
-
-    noise_phrases = [
-        "crypto market insights and analytics",
-        "top cryptocurrencies price list by market capitalization",
-        "live cryptocurrency prices",
-        "complete list with coin market capitalization rankings",
-        "price list by market capitalization",
-        "market data on this page is currently delayed",
-    ]
-    hits = sum(1 for phrase in noise_phrases if phrase in text)
-    return hits >= 2
+    return analysis.count("dashboard") >= 2
 
 
-def _promo_noise_hits(text: str) -> int:
+def _promo_noise_hits(text: str, analysis: TextAnalysis | None = None) -> int:
     """Count promo/ad phrases in extracted body."""
-    lowered = _normalize_text(text)
-    if not lowered:
-        return 0
-    return sum(1 for phrase in PROMO_NOISE_PHRASES if phrase in lowered)
+    return (analysis or _analyze_candidate(text)).count("promo")
 
 
-def _score_content_candidate(text: str) -> float:
+def _score_content_candidate(text: str, analysis: TextAnalysis | None = None) -> float:
     """Rank extracted candidates by body-likeness, not only length."""
     if not text:
         return -1e9
@@ -284,9 +275,11 @@ def _score_content_candidate(text: str) -> float:
 
     paragraphs = [p for p in re.split(r"[。\n.!?]+", cleaned) if len(p.strip()) >= 20]
     paragraph_count = len(paragraphs)
-    promo_hits = _promo_noise_hits(cleaned)
+    # Analysis of the raw text, so callers can share it with the usability checks.
+    analysis = analysis or _analyze_candidate(text)
+    promo_hits = _promo_noise_hits(text, analysis)
     ellipsis_count = cleaned.count("...") + cleaned.count("…")
-    nav_penalty = 60 if _looks_like_navigation_noise(cleaned) else 0
+    nav_penalty = 60 if _looks_like_navigation_noise(text, analysis) else 0
 
     # Length still matters, but structure + low-noise matters more.
     score = (
@@ -299,9 +292,13 @@ def _score_content_candidate(text: str) -> float:
     return score
 
 
-def _pick_best_candidate(candidates: list[str]) -> str | None:
-    """Choose candidate with best quality score."""
-    scored = [(c, _score_content_candidate(c)) for c in candidates if c]
+def _pick_best_candidate(
+    candidates: list[str],
+    analyses: dict[str, TextAnalysis] | None = None,
+) -> str | None:
+    """Choose candidate with best quality score (`analyses` holds ones already built)."""
+    analyses = analyses or {}
+    scored = [(c, _score_content_candidate(c, analyses.get(c))) for c in candidates if c]
     if not scored:
         return None
     scored.sort(key=lambda item: item[1], reverse=True)
@@ -315,13 +312,15 @@ def _select_best_content(
     description: str,
 ) -> str:
     """Pick best content candidate with strict fallback guards."""
-    if full_content and _is_usable_article_text(full_content, title):
-        return full_content.strip()
+    if full_content:
+        analysis = _analyze_candidate(full_content)
+        if _is_usable_article_text(full_content, title, analysis):
+            return full_content.strip()
 
-    # If extraction got some body text but not long enough for strict quality,
-    # still prefer it over title-like RSS snippets.
-    if full_content and _is_minimally_usable_text(full_content, title):
-        return full_content.strip()
+        # If extraction got some body text but not long enough for strict quality,
+        # still prefer it over title-like RSS snippets.
+        if _is_minimally_usable_text(full_content, title, analysis):
+            return full_content.strip()
 
     if summary and _is_minimally_usable_text(summary, title):
         return summary.strip()
@@ -336,14 +335,59 @@ def _select_best_content(
     return merged
 
 
-def _extract_json_ld_article_body(html: str) -> str | None:
+def _selector_to_xpath(selector: str) -> str:
+    """Translate the simple CSS selectors used below into XPath."""
+    if selector.startswith("."):
+        class_name = selector[1:]
+        return f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+    if selector.startswith("[") and selector.endswith("]"):
+        attr, _, value = selector[1:-1].partition("=")
+        return f"//*[@{attr.strip()}={value.strip()}]"
+    return f"//{selector}"
+
+
+ARTICLE_BLOCK_SELECTORS = [
+    ".article-detail__content",
+    ".news-detail__content",
+    ".news-detail-content",
+    ".news-content",
+    ".article-body",
+    ".article-main",
+    ".news-main",
+    ".markdown-body",
+    "article",
+    "[itemprop='articleBody']",
+    ".article-content",
+    ".post-content",
+    ".entry-content",
+    ".content-area",
+    "main",
+]
+_ARTICLE_BLOCK_XPATHS = [_selector_to_xpath(selector) for selector in ARTICLE_BLOCK_SELECTORS]
+
+
+def _node_text(node: Any) -> str:
+    """Equivalent of BeautifulSoup `get_text(" ", strip=True)` for lxml nodes."""
+    return " ".join(part.strip() for part in node.itertext() if part and part.strip())
+
+
+def parse_html_document(html: str | bytes) -> Any | None:
+    """Parse a page once into an lxml tree shared by every extractor."""
+    if not html:
+        return None
+    try:
+        return trafilatura.load_html(html)
+    except Exception:
+        return None
+
+
+def _extract_json_ld_article_body(tree: Any) -> str | None:
     """Try extracting article body from JSON-LD metadata."""
     try:
-        soup = BeautifulSoup(html, "html.parser")
-        scripts = soup.find_all("script", attrs={"type": "application/ld+json"})
+        scripts = tree.xpath("//script[@type='application/ld+json']")
         candidates: list[str] = []
         for script in scripts:
-            text = script.string or script.get_text() or ""
+            text = script.text_content() or ""
             if "articleBody" not in text:
                 continue
             matches = re.findall(r'"articleBody"\s*:\s*"(.+?)"', text, flags=re.DOTALL)
@@ -359,32 +403,13 @@ def _extract_json_ld_article_body(html: str) -> str | None:
         return None
 
 
-def _extract_article_blocks(html: str) -> str | None:
+def _extract_article_blocks(tree: Any) -> str | None:
     """Fallback extractor based on visible article-like paragraph blocks."""
     try:
-        soup = BeautifulSoup(html, "html.parser")
-        selectors = [
-            ".article-detail__content",
-            ".news-detail__content",
-            ".news-detail-content",
-            ".news-content",
-            ".article-body",
-            ".article-main",
-            ".news-main",
-            ".markdown-body",
-            "article",
-            "[itemprop='articleBody']",
-            ".article-content",
-            ".post-content",
-            ".entry-content",
-            ".content-area",
-            "main",
-        ]
-
         candidates: list[str] = []
-        for selector in selectors:
-            for node in soup.select(selector):
-                paragraphs = [_clean_html(p.get_text(" ", strip=True)) for p in node.find_all("p")]
+        for xpath in _ARTICLE_BLOCK_XPATHS:
+            for node in tree.xpath(xpath):
+                paragraphs = [_clean_html(_node_text(p)) for p in node.iterdescendants("p")]
                 paragraphs = [p for p in paragraphs if len(p) > 40]
                 if not paragraphs:
                     continue
@@ -401,6 +426,66 @@ def _extract_article_blocks(html: str) -> str | None:
         return None
 
 
+def extract_content_from_html(
+    html: str | bytes,
+    title: str = "",
+    early_accept_score: float | None = None,
+) -> str | None:
+    """Extract the best article body from a downloaded page.
+
+    The page is parsed once; the JSON-LD, selector-block and trafilatura paths
+    all read the same lxml tree (trafilatura works on its own copy).
+
+    With `early_accept_score` set, extractors run cheapest-first (JSON-LD, then
+    selector blocks) and the first usable body scoring at least that much is
+    returned without running trafilatura.
+    """
+    tree = parse_html_document(html)
+    if tree is None:
+        return None
+    # One noise analysis per candidate body, shared by the early-exit checks and the final pick.
+    analyses: dict[str, TextAnalysis] = {}
+
+    json_ld_body = _clean_html(_extract_json_ld_article_body(tree) or "")
+    if early_accept_score is not None and _is_confident_body(json_ld_body, title, early_accept_score, analyses):
+        _bump_stat("extract_early_json_ld")
+        return json_ld_body
+
+    block_body = _clean_html(_extract_article_blocks(tree) or "")
+    if early_accept_score is not None and _is_confident_body(block_body, title, early_accept_score, analyses):
+        _bump_stat("extract_early_blocks")
+        return block_body
+
+    try:
+        primary = _clean_html(trafilatura.extract(tree) or "")
+    except Exception:
+        primary = ""
+    if early_accept_score is not None:
+        _bump_stat("extract_full_pass")
+
+    candidates = [body for body in (primary, json_ld_body, block_body) if body]
+    if not candidates:
+        return None
+    return _pick_best_candidate(candidates, analyses)
+
+
+def _is_confident_body(
+    candidate: str,
+    title: str,
+    min_score: float,
+    analyses: dict[str, TextAnalysis] | None = None,
+) -> bool:
+    """Early-exit guard for tiered extraction; the candidate's analysis is added to `analyses`."""
+    if not candidate:
+        return False
+    analysis = _analyze_candidate(candidate)
+    if analyses is not None:
+        analyses[candidate] = analysis
+    if not _is_usable_article_text(candidate, title, analysis):
+        return False
+    return _score_content_candidate(candidate, analysis) >= min_score
+
+
 def _extract_source_url(entry: Any) -> str | None:
     """Read source URL from RSS entry when available."""
     source = getattr(entry, "source", None)
@@ -431,11 +516,19 @@ def _extract_url_from_description(entry: Any) -> str | None:
     return None
 
 
-def resolve_article_url(rss_link: str, source_url: str | None = None) -> str:
+def resolve_article_url(
+    rss_link: str,
+    source_url: str | None = None,
+    timeout: int = 10,
+    scheduler: HostScheduler | None = None,
+) -> str:
     """Resolve RSS link to a final article URL.
 
     Google News RSS links often require redirect resolution. For other links, the
-    original link itself is usually already the final article URL.
+    original link itself is usually already the final article URL. Classic
+    Google News tokens are decoded locally first; network resolutions
+    (including failures) are cached on disk with a TTL. Requests are skipped
+    while the host's circuit breaker is open.
     """
     if not rss_link:
         return source_url or ""
@@ -443,59 +536,118 @@ def resolve_article_url(rss_link: str, source_url: str | None = None) -> str:
     if "news.google.com" not in rss_link:
         return rss_link
 
+    decoded = decode_google_news_url(rss_link)
+    if decoded:
+        _bump_stat("url_decoded_local")
+        return decoded
+
+    # Shared with recover_full_content; "" marks a cached failed resolution.
+    cached = get_cached_url(rss_link)
+    if cached is not None:
+        _bump_stat("url_resolved_cache")
+        return cached or source_url or rss_link
+
+    if not circuit_breaker.allow_request(rss_link):
+        # Not cached as a failure: the link is retried once the breaker closes.
+        _bump_stat("circuit_short_circuited")
+        return source_url or rss_link
+
+    _bump_stat("url_resolved_network")
     try:
-        response = requests.get(
-            rss_link,
-            timeout=10,
-            allow_redirects=True,
-            verify=certifi.where(),
-            headers=REQUEST_HEADERS,
-        )
+        with scheduler.slot(rss_link) if scheduler else nullcontext():
+            response = http_client.get(
+                rss_link,
+                timeout=timeout,
+                allow_redirects=True,
+                headers=REQUEST_HEADERS,
+                # One attempt: repeated failures are the circuit breaker's job.
+                retry=False,
+            )
+        if response.status_code in circuit_breaker.FAILURE_STATUS_CODES:
+            circuit_breaker.record_failure(rss_link)
+        else:
+            circuit_breaker.record_success(rss_link)
         final_url = str(response.url or "").strip()
         if final_url and "news.google.com" not in final_url:
+            remember_url(rss_link, final_url)
             return final_url
     except Exception:
-        pass
+        circuit_breaker.record_failure(rss_link)
 
+    remember_url(rss_link, None)
     return source_url or rss_link
 
 
-def extract_full_content(url: str) -> str | None:
-    """Fetch and extract full webpage content from a URL."""
+def extract_full_content(
+    url: str,
+    timeout: int = 12,
+    title: str = "",
+    early_accept_score: float | None = None,
+    download_stats: Counter | None = None,
+) -> str | None:
+    """Fetch and extract full webpage content from a URL.
+
+    Downloads are streamed with size / content-type limits (`http_client.get_bounded`);
+    aborted downloads are counted per reason as `download_aborted_<reason>` in
+    the fetch stats. Hosts whose circuit breaker is open are skipped without a
+    request, and a failed download is not retried (the breaker counts it
+    instead). When `download_stats` is given, bytes read from the wire are
+    added to its "bytes", and attempts that gave up before the page could be
+    judged (breaker open, request error, aborted download, 403/429/5xx,
+    extraction failure or runaway) are counted in its "degraded".
+
+    Parsing and extraction run in the `extract_executor` process pool when it
+    is enabled; runaway documents are counted as `extract_runaway_cpu` /
+    `extract_runaway_wall`, documents retried after a pool restart as
+    `extract_retried`.
+    """
     if not url:
         return None
+    stats: Counter = download_stats if download_stats is not None else Counter()
+    if not circuit_breaker.allow_request(url):
+        _bump_stat("circuit_short_circuited")
+        stats["degraded"] += 1
+        return None
 
     try:
-        response = requests.get(
+        response = http_client.get_bounded(
             url,
-            timeout=12,
-            verify=certifi.where(),
+            timeout=timeout,
             headers=REQUEST_HEADERS,
+            retry=False,
         )
-        if response.status_code != 200:
-            return None
-
-        html = response.text
-        candidates: list[str] = []
-
-        primary = trafilatura.extract(html)
-        if primary:
-            candidates.append(_clean_html(primary))
-
-        json_ld_body = _extract_json_ld_article_body(html)
-        if json_ld_body:
-            candidates.append(_clean_html(json_ld_body))
-
-        block_body = _extract_article_blocks(html)
-        if block_body:
-            candidates.append(_clean_html(block_body))
+    except Exception:
+        circuit_breaker.record_failure(url)
+        stats["degraded"] += 1
+        return None
+    if response.status_code in circuit_breaker.FAILURE_STATUS_CODES:
+        circuit_breaker.record_failure(url)
+        stats["degraded"] += 1
+    else:
+        circuit_breaker.record_success(url)
 
-        candidates = [c for c in candidates if c]
-        if not candidates:
+    try:
+        stats["bytes"] += response.wire_bytes
+        if response.aborted:
+            _bump_stat(f"download_aborted_{response.aborted}")
+            stats["degraded"] += 1
+            return None
+        if response.status_code != 200:
             return None
 
-        return _pick_best_candidate(candidates)
+        if html_store.is_enabled():
+            html_store.save_html(url, response.content, response.encoding)
+        executor = extract_executor.get_executor()
+        if executor is None:
+            return extract_content_from_html(decode_body(response.content, response.encoding), title, early_accept_score)
+        text, worker_stats = executor.extract(response.content, response.encoding, title, early_accept_score, url=url)
+        for name, amount in worker_stats.items():
+            _bump_stat(name, amount)
+            if name.startswith(("extract_runaway_", "extract_worker_failed")):
+                stats["degraded"] += amount
+        return text
     except Exception:
+        stats["degraded"] += 1
         return None
 
 
@@ -510,6 +662,8 @@ def recover_full_content(url: str, title: str, current_content: str = "") -> str
     candidate = extract_full_content(target_url)
     if not candidate:
         return None
+    if html_store.is_enabled():
+        html_store.alias_html(url, target_url)
 
     cleaned = _clean_html(candidate).strip()
     if not cleaned:
@@ -523,42 +677,439 @@ def recover_full_content(url: str, title: str, current_content: str = "") -> str
     return cleaned
 
 
-def _fetch_rss_entries(url: str) -> list[Any]:
-    """Fetch RSS XML and parse entries with resilient fallbacks."""
+def _get_scheduler(scope: str, default: HostLimit, overrides: str = "") -> HostScheduler:
+    """Return the process-wide host scheduler for a fetch scope ("feed" / "article")."""
+    with _SCHEDULERS_LOCK:
+        scheduler = _SCHEDULERS.get(scope)
+        if scheduler is None:
+            scheduler = HostScheduler(default, parse_host_limits(overrides, default))
+            _SCHEDULERS[scope] = scheduler
+        return scheduler
+
+
+def _article_scheduler(per_domain_limit: int) -> HostScheduler:
+    """Scheduler pacing article resolution/downloads per publisher host."""
+    cfg = load_config()
+    default = HostLimit(
+        max_concurrent=max(1, per_domain_limit),
+        rate_per_sec=cfg.host_rate_per_sec,
+        burst=max(1, cfg.host_burst),
+    )
+    return _get_scheduler("article", default, cfg.host_limit_overrides)
+
+
+def _fetch_rss_entries_limited(
+    url: str,
+    per_host_limit: int,
+    use_conditional_get: bool = False,
+    feed_url: str | None = None,
+) -> tuple[list[Any], dict[str, Any]]:
+    """Fetch one feed URL while holding its host slot."""
+    scheduler = _get_scheduler("feed", HostLimit(max_concurrent=max(1, per_host_limit), rate_per_sec=0.0))
+    with scheduler.slot(url):
+        return _fetch_rss_entries(url, use_conditional_get=use_conditional_get, feed_url=feed_url)
+
+
+def _fetch_rss_entries(
+    url: str,
+    use_conditional_get: bool = False,
+    feed_url: str | None = None,
+) -> tuple[list[Any], dict[str, Any]]:
+    """Fetch RSS XML and parse entries with resilient fallbacks.
+
+    Returns `(entries, cache_info)`. With conditional GET enabled, stored
+    ETag/Last-Modified validators are sent and a 304 is treated as "no new
+    entries" without parsing; `cache_info` reports hit/miss and savings plus
+    the bytes / seconds actually spent on the request. New validators are
+    staged under `feed_url` (default: `url`) and saved by
+    `feed_state.flush_run()` after the run has stored the feed's items.
+    """
+    cache_info: dict[str, Any] = {
+        "cache": "off",
+        "bytes_saved": 0,
+        "seconds_saved": 0.0,
+        "bytes": 0,
+        "seconds": 0.0,
+    }
+    state = None
+    headers = REQUEST_HEADERS
+    if use_conditional_get:
+        cache_info["cache"] = "miss"
+        state = get_feed_state(url)
+        headers = {**REQUEST_HEADERS, **build_conditional_headers(state)}
+
+    started = time.monotonic()
     try:
-        response = requests.get(
+        response = http_client.get(
             url,
             timeout=15,
-            verify=certifi.where(),
-            headers=REQUEST_HEADERS,
+            headers=headers,
             allow_redirects=True,
         )
+        cache_info["bytes"] = len(response.content)
+        cache_info["seconds"] = time.monotonic() - started
+        if response.status_code == 304 and state:
+            cache_info["cache"] = "hit"
+            cache_info["bytes_saved"] = state["body_bytes"]
+            cache_info["seconds_saved"] = max(0.0, state["fetch_seconds"] - (time.monotonic() - started))
+            return [], cache_info
         if response.status_code != 200:
             print(f"[RSS] Non-200 status for {url}: {response.status_code}")
-            return []
-
-        # Try bytes first (better encoding handling), then text, then URL direct parse.
-        for parser_input in (response.content, response.text, url):
-            parsed = feedparser.parse(parser_input)
-            entries = getattr(parsed, "entries", []) or []
-            if entries:
-                return entries
-
-        print(f"[RSS] Parse error for {url}: no entries parsed")
-        return []
+            return [], cache_info
+
+        # Parse the raw bytes once: feedparser resolves the encoding from the BOM /
+        # XML declaration, and from the header charset when the server sends one.
+        content_type = response.headers.get("Content-Type", "")
+        parsed = feedparser.parse(
+            response.content,
+            response_headers={"content-type": content_type} if charset_from_content_type(content_type) else None,
+        )
+        entries = getattr(parsed, "entries", []) or []
+        if not entries:
+            print(f"[RSS] Parse error for {url}: no entries parsed")
+            return [], cache_info
+        if use_conditional_get:
+            stage_feed_state(
+                feed_url or url,
+                url,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                body_bytes=len(response.content),
+                fetch_seconds=time.monotonic() - started,
+            )
+        return entries, cache_info
     except Exception as exc:
         print(f"[RSS] Request failed for {url}: {exc}")
-        return []
+        return [], cache_info
+
+
+def _extract_embedded_content(entry: Any) -> str:
+    """Return body text shipped inside the feed (`content:encoded` / Atom content)."""
+    blocks = getattr(entry, "content", None) or []
+    texts: list[str] = []
+    for block in blocks:
+        value = block.get("value", "") if hasattr(block, "get") else ""
+        text = _clean_html(value)
+        if text:
+            texts.append(text)
+    if not texts:
+        return ""
+    return max(texts, key=len)
+
+
+def _normalize_entry(entry: Any, feed_name: str) -> dict[str, Any]:
+    """Read the fields the pipeline needs from a raw feedparser entry."""
+    return {
+        "title": _clean_html(getattr(entry, "title", "")),
+        "summary": _clean_html(getattr(entry, "summary", "")),
+        "description": _clean_html(getattr(entry, "description", "")),
+        "embedded_content": _extract_embedded_content(entry),
+        "rss_link": getattr(entry, "link", ""),
+        "source_url": _extract_source_url(entry),
+        "description_url": _extract_url_from_description(entry),
+        "publish_time": _safe_publish_time(entry),
+        "source": feed_name,
+    }
+
+
+def _extract_entry_content(
+    entry: dict[str, Any],
+    timeout: int,
+    scheduler: HostScheduler,
+    early_accept_score: float | None = None,
+) -> dict[str, Any]:
+    """Resolve the article URL of one normalized entry and download its best body.
+
+    Entries whose resolved URL is already in the seen-entry index are returned
+    with `already_seen=True` and nothing is downloaded. Full text embedded in
+    the feed is tried next: when it passes the usability
+    heuristics (and is more than a copy of the summary) no page is downloaded.
+    In tiered mode (`early_accept_score` set) the remaining candidate URLs are
+    skipped as soon as one of them yields a usable body. `download_bytes` and
+    `seconds` report the cost of the entry for the feed ledger.
+    `extraction_degraded` is set when a download gave up (see
+    `extract_full_content`) and no usable body was found elsewhere, i.e. the
+    entry's content is a fallback rather than the article.
+    """
+    started = time.monotonic()
+    downloads: Counter = Counter()
+    title = entry.get("title", "")
+    rss_link = entry.get("rss_link", "")
+    source_url = entry.get("source_url")
+    description_url = entry.get("description_url")
+    preferred_source_url = description_url or source_url
+
+    article_url = resolve_article_url(rss_link, source_url, timeout=timeout, scheduler=scheduler)
+    if not article_url or "news.google.com" in article_url:
+        article_url = preferred_source_url or article_url
+
+    resolved_url = article_url or preferred_source_url or rss_link
+    index_keys = entry.get("index_keys")
+    if index_keys is not None:
+        url_keys = [key for key in build_entry_keys(resolved_url=resolved_url) if key not in index_keys]
+        if is_seen(url_keys):
+            _bump_stat("skipped_seen_index")
+            return {
+                "article_url": resolved_url,
+                "full_content": None,
+                "page_fetch_avoided": False,
+                "already_seen": True,
+                "extraction_degraded": False,
+                "download_bytes": 0,
+                "seconds": time.monotonic() - started,
+            }
+        # Each entry is owned by one worker, so extending its keys here is safe.
+        entry["index_keys"] = index_keys + url_keys
+
+    embedded = entry.get("embedded_content", "")
+    full_candidates: list[str] = []
+    # Extracted body -> URL it was downloaded from, to index the winning page under `resolved_url`.
+    candidate_sources: dict[str, str] = {}
+    # Noise analysis per candidate body, reused by the final pick.
+    analyses: dict[str, TextAnalysis] = {}
+    if embedded and len(embedded) > len(entry.get("summary", "")):
+        analyses[embedded] = _analyze_candidate(embedded)
+        if _is_usable_article_text(embedded, title, analyses[embedded]):
+            return {
+                "article_url": resolved_url,
+                "full_content": embedded,
+                "page_fetch_avoided": True,
+                "already_seen": False,
+                "extraction_degraded": False,
+                "download_bytes": 0,
+                "seconds": time.monotonic() - started,
+            }
+        full_candidates.append(embedded)
+
+    candidate_urls: list[str] = []
+    for maybe_url in [article_url, preferred_source_url, source_url, description_url, rss_link]:
+        maybe = (maybe_url or "").strip()
+        if not maybe or maybe in candidate_urls:
+            continue
+        candidate_urls.append(maybe)
+
+    for index, candidate_url in enumerate(candidate_urls):
+        with scheduler.slot(candidate_url):
+            extracted = extract_full_content(
+                candidate_url,
+                timeout=timeout,
+                title=title,
+                early_accept_score=early_accept_score,
+                download_stats=downloads,
+            )
+        if extracted:
+            full_candidates.append(extracted)
+            candidate_sources.setdefault(extracted, candidate_url)
+            if early_accept_score is not None:
+                analysis = analyses.setdefault(extracted, _analyze_candidate(extracted))
+                if _is_usable_article_text(extracted, title, analysis):
+                    _bump_stat("extract_candidate_urls_skipped", len(candidate_urls) - index - 1)
+                    break
+
+    full_content = _pick_best_candidate(full_candidates, analyses) if full_candidates else None
+    if full_content in candidate_sources and html_store.is_enabled():
+        # reextract looks pages up by news_raw.url, i.e. `resolved_url`.
+        html_store.alias_html(resolved_url, candidate_sources[full_content])
+    degraded = bool(downloads["degraded"]) and not (
+        full_content and _is_usable_article_text(full_content, title, analyses.get(full_content))
+    )
+    return {
+        "article_url": resolved_url,
+        "full_content": full_content,
+        "page_fetch_avoided": False,
+        "already_seen": False,
+        "extraction_degraded": degraded,
+        "download_bytes": downloads["bytes"],
+        "seconds": time.monotonic() - started,
+    }
+
+
+def _entry_extractor(timeout: int, per_domain_limit: int) -> partial[dict[str, Any]]:
+    """Bind `_extract_entry_content` to the shared article scheduler and tiering settings."""
+    cfg = load_config()
+    return partial(
+        _extract_entry_content,
+        timeout=timeout,
+        scheduler=_article_scheduler(per_domain_limit),
+        early_accept_score=cfg.extract_early_accept_score if cfg.extract_tiered else None,
+    )
 
 
-def fetch_rss_items(
+def iter_extract_entries(
+    entries: list[dict[str, Any]],
+    *,
+    max_workers: int = 8,
+    timeout: int = 12,
+    per_domain_limit: int = 2,
+) -> Iterator[dict[str, Any]]:
+    """Run URL resolution + download + extraction for normalized entries.
+
+    Work runs on a bounded thread pool; each request is paced by the per-host
+    scheduler (`per_domain_limit` concurrent, `HOST_RATE_PER_SEC` / `HOST_BURST`,
+    `HOST_LIMIT_OVERRIDES`); `EXTRACT_TIERED` enables cheap-first extraction
+    with early exit. Results are yielded in entry order, each as soon as it and
+    every earlier entry are done, as `{"article_url": str, "full_content": str | None,
+    "page_fetch_avoided": bool, "already_seen": bool, "extraction_degraded": bool,
+    "download_bytes": int, "seconds": float}` dicts.
+    """
+    if not entries:
+        return
+
+    worker = _entry_extractor(timeout, per_domain_limit)
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(entries))),
+        thread_name_prefix="article-extract",
+    ) as pool:
+        yield from pool.map(worker, entries)
+
+
+def extract_entries(
+    entries: list[dict[str, Any]],
+    *,
+    max_workers: int = 8,
+    timeout: int = 12,
+    per_domain_limit: int = 2,
+) -> list[dict[str, Any]]:
+    """List form of `iter_extract_entries`."""
+    return list(
+        iter_extract_entries(
+            entries,
+            max_workers=max_workers,
+            timeout=timeout,
+            per_domain_limit=per_domain_limit,
+        )
+    )
+
+
+@dataclass
+class _FeedRun:
+    """Per-feed counters for one `iter_rss_items` run.
+
+    The planner thread owns the fetch/window fields and `submitted`; the
+    consuming generator owns the extraction fields. `_close_feed_run` reads
+    both once every submitted entry has been drained.
+    """
+
+    name: str
+    url: str
+    since: datetime | None
+    total_entries: int = 0
+    seen_skipped: int = 0
+    fetch_bytes: int = 0
+    fetch_seconds: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    bytes_saved: int = 0
+    seconds_saved: float = 0.0
+    windows_requested: int = 0
+    splits: int = 0
+    saturated_leaves: int = 0
+    leaf_counts: list[tuple[FeedWindow, int]] = field(default_factory=list)
+    submitted: int = 0
+    planned: bool = False
+    done: int = 0
+    already_seen: int = 0
+    extracted: int = 0
+    fetches_avoided: int = 0
+    download_bytes: int = 0
+    download_seconds: float = 0.0
+
+
+def _finish_entry(run: _FeedRun, entry: dict[str, Any], extracted: dict[str, Any]) -> dict[str, Any] | None:
+    """Turn one finished extraction into a pipeline item (None when it is dropped)."""
+    run.download_bytes += extracted["download_bytes"]
+    run.download_seconds += extracted["seconds"]
+    if extracted["page_fetch_avoided"]:
+        run.fetches_avoided += 1
+        _bump_stat("page_fetches_avoided")
+    if extracted["already_seen"]:
+        run.already_seen += 1
+        return None
+    title = entry["title"]
+    content = _select_best_content(
+        title,
+        extracted["full_content"],
+        entry["summary"],
+        entry["description"],
+    )
+    if not title or not content:
+        if extracted["extraction_degraded"]:
+            # Keep the feed's validators unsaved so the entry is fetched again next run.
+            mark_feed_failed(run.url)
+        return None
+
+    run.extracted += 1
+    return {
+        "title": title,
+        "content": content,
+        # Persist canonical article URL for downstream recovery / auditing.
+        "url": extracted["article_url"],
+        "publish_time": entry["publish_time"],
+        "source": entry["source"],
+        # Marked in the seen-entry index once the processor decides the outcome.
+        "index_keys": entry.get("index_keys") or [],
+        # The content is an RSS fallback because the article download gave up.
+        "extraction_degraded": extracted["extraction_degraded"],
+        # Lets the processor credit relevant / inserted items to the feed ledger.
+        "feed_url": run.url,
+    }
+
+
+def _close_feed_run(run: _FeedRun, cfg: PipelineConfig) -> None:
+    """Record a drained feed in the ledger / window planner and print its log line."""
+    seen_skipped = run.seen_skipped + run.already_seen
+    log_suffix = f" | page_fetches_avoided={run.fetches_avoided}" if run.fetches_avoided else ""
+    if seen_skipped:
+        log_suffix += f" | seen_skipped={seen_skipped}"
+    if cfg.feed_conditional_get:
+        log_suffix += (
+            f" | cache hit={run.cache_hits} miss={run.cache_misses} "
+            f"saved={run.bytes_saved / 1024:.0f}KB/{run.seconds_saved:.1f}s"
+        )
+    feed_ledger.record(
+        run.url,
+        run.name,
+        # Only entries that could still reach the processor count towards the feed's yield.
+        fetched=run.submitted - run.already_seen,
+        extracted=run.extracted,
+        bytes=run.fetch_bytes + run.download_bytes,
+        seconds=run.fetch_seconds + run.download_seconds,
+    )
+    if cfg.google_adaptive_windows:
+        record_window_outcome(run.url, run.leaf_counts, run.splits)
+    if run.splits:
+        log_suffix += f" | windows_split={run.splits}"
+    if run.saturated_leaves:
+        log_suffix += f" | windows_saturated={run.saturated_leaves}"
+    if run.windows_requested > 1:
+        print(
+            f"[RSS] {run.name}: {run.total_entries} entries "
+            f"across {run.windows_requested} windows{log_suffix}"
+        )
+    else:
+        print(f"[RSS] {run.name}: {run.total_entries} entries{log_suffix}")
+
+
+def iter_rss_items(
     feed_urls: list[str] | None = None,
     min_publish_time: datetime | None = None,
-) -> list[dict[str, Any]]:
-    """Fetch and normalize RSS news items from all configured feeds.
+) -> Iterator[dict[str, Any]]:
+    """Fetch and normalize RSS news items from all configured feeds, lazily.
 
     - Supports incremental fetch via min_publish_time.
     - Applies per-feed cap to keep runtime manageable.
+    - Polls feeds/windows concurrently with per-host caps
+      (`FETCH_MAX_WORKERS` / `FETCH_PER_HOST_LIMIT`).
+    - Extracts articles from all feeds on one pool (`EXTRACT_MAX_WORKERS`) and
+      yields each item as soon as its extraction finishes, in completion order
+      across feeds. At most a few items per worker wait undrained, so callers
+      can persist work incrementally while extraction keeps running.
+    - Records per-feed counts in the feed ledger once all of a feed's entries
+      are drained; configured feeds with a low
+      relevant yield are polled less often (`FEED_ADAPTIVE_POLLING`), catching
+      up from their previous poll when they are due again.
+
+    Run-level logs are printed once the generator is exhausted.
     """
     cfg = load_config()
 
@@ -567,85 +1118,243 @@ def fetch_rss_items(
     else:
         feeds = get_default_rss_feeds()
 
-    normalized_items: list[dict[str, Any]] = []
     seen_keys: set[str] = set()
 
+    # Poll every feed/window concurrently. Windows are consumed in feed order by
+    # the planner thread, so cross-window dedupe and seen-index checks stay as in
+    # the serial run.
+    pool = ThreadPoolExecutor(
+        max_workers=max(1, cfg.fetch_max_workers),
+        thread_name_prefix="rss-fetch",
+    )
+
+    def submit_window(
+        feed_url: str,
+        window: FeedWindow,
+    ) -> tuple[FeedWindow, Future[tuple[list[Any], dict[str, Any]]]]:
+        future = pool.submit(
+            _fetch_rss_entries_limited,
+            window.url,
+            cfg.fetch_per_host_limit,
+            cfg.feed_conditional_get,
+            feed_url,
+        )
+        return window, future
+
+    feed_plans: list[tuple[_FeedRun, deque[tuple[FeedWindow, Future[tuple[list[Any], dict[str, Any]]]]]]] = []
     for feed in feeds:
         feed_name = feed.get("name", "Unknown")
         feed_url = feed.get("url", "")
-        feed_urls_to_fetch = _build_google_news_windows(
-            feed_url=feed_url,
-            min_publish_time=min_publish_time,
+        feed_since = min_publish_time
+        # Explicitly requested feeds are always polled.
+        if not feed_urls and cfg.feed_ledger_enabled:
+            due, interval_hours = feed_ledger.should_poll(feed_url)
+            if not due:
+                _bump_stat("feeds_skipped_low_yield")
+                print(f"[FEED-SKIP] {feed_name}: low yield, polled every {interval_hours:.0f}h")
+                continue
+            feed_since = feed_ledger.catch_up_since(feed_url, min_publish_time)
+        windows = plan_windows(
+            feed_url,
+            feed_since,
             window_days=cfg.google_window_days,
             max_windows=cfg.max_google_windows,
+            adaptive=cfg.google_adaptive_windows,
+        )
+        feed_plans.append(
+            (
+                _FeedRun(name=feed_name, url=feed_url, since=feed_since),
+                deque(submit_window(feed_url, window) for window in windows),
+            )
         )
 
-        total_entries = 0
-        for current_url in feed_urls_to_fetch:
-            entries = _fetch_rss_entries(current_url)
+    # Article extraction for every feed shares one pool. The planner thread
+    # submits entries as their windows arrive; finished extractions wait in
+    # `results` until this generator drains them. `slots` bounds submitted but
+    # undrained entries, so workers keep going while the caller flushes to the
+    # database without buffering a whole run of article bodies.
+    extract_workers = max(1, cfg.extract_max_workers)
+    extract_pool = ThreadPoolExecutor(max_workers=extract_workers, thread_name_prefix="article-extract")
+    extract_worker = _entry_extractor(cfg.extract_timeout, cfg.extract_per_domain_limit)
+    slots = threading.Semaphore(extract_workers * _EXTRACT_QUEUE_PER_WORKER)
+    results: queue.Queue[tuple[_FeedRun | None, dict[str, Any] | None, Future[dict[str, Any]] | None]] = queue.Queue()
+    stop = threading.Event()
+
+    def plan_feed(run: _FeedRun, pending: deque[tuple[FeedWindow, Future[tuple[list[Any], dict[str, Any]]]]]) -> None:
+        run.windows_requested = len(pending)
+        while pending:
+            window, future = pending.popleft()
+            entries, cache_info = future.result()
+            run.fetch_bytes += cache_info["bytes"]
+            run.fetch_seconds += cache_info["seconds"]
+            if cache_info["cache"] == "hit":
+                run.cache_hits += 1
+                run.bytes_saved += cache_info["bytes_saved"]
+                run.seconds_saved += cache_info["seconds_saved"]
+            elif cache_info["cache"] == "miss":
+                run.cache_misses += 1
+
+            # A saturated window hides older items behind the result cap:
+            # replace it by its two halves (fetched in date order) while
+            # the per-feed request budget allows.
+            if (
+                cfg.google_adaptive_windows
+                and window.can_split()
+                and is_saturated(len(entries))
+                and run.windows_requested + 2 <= max(1, cfg.max_google_windows)
+            ):
+                halves = split_window(run.url, window)
+                pending.extendleft(reversed([submit_window(run.url, half) for half in halves]))
+                run.windows_requested += len(halves)
+                run.splits += 1
+                _bump_stat("google_windows_split")
+                continue
+            if window.start is not None and is_saturated(len(entries)):
+                run.saturated_leaves += 1
+                _bump_stat("google_windows_saturated")
+            run.leaf_counts.append((window, len(entries)))
+
             if cfg.max_entries_per_feed > 0:
                 entries = entries[: cfg.max_entries_per_feed]
-            total_entries += len(entries)
+            run.total_entries += len(entries)
 
             for entry in entries:
-                raw_publish_time = _safe_publish_time(entry)
-                publish_dt = _parse_publish_time(raw_publish_time)
-                if min_publish_time and publish_dt and publish_dt < min_publish_time:
-                    continue
-
-                title = _clean_html(getattr(entry, "title", ""))
-                summary = _clean_html(getattr(entry, "summary", ""))
-                description = _clean_html(getattr(entry, "description", ""))
-                rss_link = getattr(entry, "link", "")
-
-                source_url = _extract_source_url(entry)
-                description_url = _extract_url_from_description(entry)
-                preferred_source_url = description_url or source_url
-                article_url = resolve_article_url(rss_link, source_url)
-                if not article_url or "news.google.com" in article_url:
-                    article_url = preferred_source_url or article_url
-
-                candidate_urls: list[str] = []
-                for maybe_url in [article_url, preferred_source_url, source_url, description_url, rss_link]:
-                    maybe = (maybe_url or "").strip()
-                    if not maybe or maybe in candidate_urls:
-                        continue
-                    candidate_urls.append(maybe)
-
-                full_candidates: list[str] = []
-                for candidate_url in candidate_urls:
-                    extracted = extract_full_content(candidate_url)
-                    if extracted:
-                        full_candidates.append(extracted)
-                full_content = _pick_best_candidate(full_candidates) if full_candidates else None
-                content = _select_best_content(title, full_content, summary, description)
-
-                if not title or not content:
+                publish_dt = _parse_publish_time(_safe_publish_time(entry))
+                if run.since and publish_dt and publish_dt < run.since:
                     continue
+                normalized_entry = _normalize_entry(entry, run.name)
 
-                # Deduplicate cross-window overlaps.
-                dedupe_key = f"{title}|{rss_link}"
+                # Deduplicate cross-window overlaps before any download.
+                dedupe_key = f"{normalized_entry['title']}|{normalized_entry['rss_link']}"
                 if dedupe_key in seen_keys:
+                    _bump_stat("skipped_run_duplicate")
                     continue
                 seen_keys.add(dedupe_key)
 
-                normalized_items.append(
-                    {
-                        "title": title,
-                        "content": content,
-                        # Persist canonical article URL for downstream recovery / auditing.
-                        "url": article_url or preferred_source_url or rss_link,
-                        "publish_time": raw_publish_time,
-                        "source": feed_name,
-                    }
+                if cfg.seen_index_enabled:
+                    normalized_entry["index_keys"] = build_entry_keys(
+                        rss_link=normalized_entry["rss_link"],
+                        title=normalized_entry["title"],
+                    )
+                    if is_seen(normalized_entry["index_keys"]):
+                        _bump_stat("skipped_seen_index")
+                        run.seen_skipped += 1
+                        continue
+
+                while not slots.acquire(timeout=0.5):
+                    if stop.is_set():
+                        return
+                extraction = extract_pool.submit(extract_worker, normalized_entry)
+                run.submitted += 1
+                extraction.add_done_callback(
+                    lambda done, run=run, entry=normalized_entry: results.put((run, entry, done))
                 )
 
-        if len(feed_urls_to_fetch) > 1:
-            print(
-                f"[RSS] {feed_name}: {total_entries} entries "
-                f"across {len(feed_urls_to_fetch)} windows"
-            )
-        else:
-            print(f"[RSS] {feed_name}: {total_entries} entries")
+    def plan_all() -> None:
+        try:
+            for run, pending in feed_plans:
+                if stop.is_set():
+                    return
+                plan_feed(run, pending)
+                # Every entry of this feed is submitted; the feed closes once they drain.
+                results.put((run, None, None))
+        except BaseException as exc:
+            results.put((None, {"error": exc}, None))
+        finally:
+            results.put((None, None, None))
+
+    planner = threading.Thread(target=plan_all, name="rss-plan", daemon=True)
+    planner.start()
+    try:
+        planning = True
+        # Feeds whose entries are all submitted but not all drained yet.
+        open_runs: set[int] = set()
+        while planning or open_runs:
+            run, entry, extraction = results.get()
+            if run is None:
+                if entry is not None:
+                    raise entry["error"]
+                planning = False
+                continue
+            if entry is None:
+                run.planned = True
+                open_runs.add(id(run))
+            else:
+                slots.release()
+                run.done += 1
+                item = _finish_entry(run, entry, extraction.result())
+                if item is not None:
+                    yield item
+            if run.planned and run.done == run.submitted:
+                open_runs.discard(id(run))
+                _close_feed_run(run, cfg)
+    finally:
+        stop.set()
+        pool.shutdown(wait=False, cancel_futures=True)
+        extract_pool.shutdown(wait=False, cancel_futures=True)
+        planner.join()
+        extract_pool.shutdown(wait=True)
+        pool.shutdown(wait=True)
+
+    fetch_stats = get_fetch_stats()
+    url_cache_stats = get_url_cache_stats()
+    print(
+        "[URL-RESOLVE] "
+        f"decoded_local={fetch_stats.get('url_decoded_local', 0)} "
+        f"cache={fetch_stats.get('url_resolved_cache', 0)} "
+        f"network={fetch_stats.get('url_resolved_network', 0)}"
+    )
+    print(
+        "[URL-CACHE] "
+        f"memory_hits={url_cache_stats['memory_hits']} disk_hits={url_cache_stats['disk_hits']} "
+        f"negative_hits={url_cache_stats['negative_hits']} misses={url_cache_stats['misses']}"
+    )
+    if cfg.extract_tiered:
+        print(
+            "[EXTRACT] "
+            f"early_json_ld={fetch_stats.get('extract_early_json_ld', 0)} "
+            f"early_blocks={fetch_stats.get('extract_early_blocks', 0)} "
+            f"full_pass={fetch_stats.get('extract_full_pass', 0)} "
+            f"candidate_urls_skipped={fetch_stats.get('extract_candidate_urls_skipped', 0)}"
+        )
+    aborted = {
+        name[len("download_aborted_") :]: count
+        for name, count in sorted(fetch_stats.items())
+        if name.startswith("download_aborted_")
+    }
+    if aborted:
+        print("[DOWNLOAD] aborted " + " ".join(f"{reason}={count}" for reason, count in aborted.items()))
+    runaways = {
+        name: fetch_stats.get(name, 0)
+        for name in ("extract_runaway_cpu", "extract_runaway_wall", "extract_retried", "extract_worker_failed")
+    }
+    if any(runaways.values()):
+        print(
+            "[EXTRACT-RUNAWAY] "
+            f"cpu_limit={runaways['extract_runaway_cpu']} wall_limit={runaways['extract_runaway_wall']} "
+            f"retried={runaways['extract_retried']} worker_failed={runaways['extract_worker_failed']}"
+        )
+    circuit_stats = circuit_breaker.get_circuit_stats()
+    if any(circuit_stats.values()):
+        print(
+            "[CIRCUIT] "
+            f"short_circuited={circuit_stats['short_circuited']} "
+            f"opened={circuit_stats['opened']} closed={circuit_stats['closed']}"
+        )
+    host_stats = _article_scheduler(cfg.extract_per_domain_limit).stats()
+    busiest = sorted(host_stats.items(), key=lambda item: item[1]["wait_seconds"], reverse=True)
+    for host, host_stat in busiest[:10]:
+        if host_stat["wait_seconds"] <= 0:
+            break
+        print(
+            f"[HOST-WAIT] {host}: {host_stat['requests']} requests, "
+            f"waited {host_stat['wait_seconds']:.1f}s"
+        )
+
 
-    return normalized_items
+def fetch_rss_items(
+    feed_urls: list[str] | None = None,
+    min_publish_time: datetime | None = None,
+) -> list[dict[str, Any]]:
+    """List form of `iter_rss_items`; holds every item in memory at once."""
+    return list(iter_rss_items(feed_urls=feed_urls, min_publish_time=min_publish_time))
@@ -0,0 +1,339 @@
+"""Local Bloom filter of `news_raw.content_hash` values.
+
+Most hashes a run looks up are either brand new or long known, so the
+processor first asks this filter and only sends hashes it *might* contain to
+Supabase. A Bloom filter has no false negatives as long as it holds every
+stored hash, so a miss means "new" without a round-trip; hits are confirmed
+against the database.
+
+The filter lives in `<PIPELINE_CACHE_DIR>/content_hashes.bloom` (a JSON header
+line followed by the bit array). Each run first adds rows created after the
+last synced `(created_at, id)` key; hashes written during the run (inserts,
+recovered bodies) are added directly. Sized for `HASH_FILTER_CAPACITY` hashes
+at `HASH_FILTER_FPR`; rebuild from the whole table with:
+
+    python -m news_pipeline.hash_filter --rebuild
+
+and print fill / false-positive statistics with `--stats`.
+
+Single writer: sync only follows `created_at`, so a `content_hash` rewritten
+by `update_news_content` on another host (another cache directory) never
+reaches this filter. When the filter was last synced more than
+`HASH_FILTER_MAX_AGE_HOURS` ago, the run checks misses in the database too
+and adds any hashes found that way. Without a local filter, one is built
+inline only while news_raw has at most `HASH_FILTER_BOOTSTRAP_MAX_ROWS` rows;
+paging a larger table would cost more requests than the run's lookups, so the
+run checks every hash in the database and `--rebuild` is left to a step whose
+cache directory is kept.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Iterable
+
+from . import local_store
+from .config import load_config
+
+_FILENAME = "content_hashes.bloom"
+_SYNC_PAGE_SIZE = 1000
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over hex digests (double hashing on the md5)."""
+
+    def __init__(self, num_bits: int, num_hashes: int, bits: bytearray | None = None, count: int = 0):
+        self.num_bits = max(8, num_bits)
+        self.num_hashes = max(1, num_hashes)
+        self.bits = bits if bits is not None else bytearray((self.num_bits + 7) // 8)
+        self.count = count
+
+    @classmethod
+    def for_capacity(cls, capacity: int, fpr: float) -> "BloomFilter":
+        capacity = max(1, capacity)
+        fpr = min(max(fpr, 1e-9), 0.5)
+        num_bits = math.ceil(-capacity * math.log(fpr) / (math.log(2) ** 2))
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        return cls(num_bits, num_hashes)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.md5(key.encode("utf-8")).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:], "big") | 1
+        return ((first + i * second) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] >> (position & 7) & 1 for position in self._positions(key))
+
+    def expected_fpr(self) -> float:
+        """False-positive rate predicted from the number of added keys."""
+        return (1.0 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+
+class HashFilter:
+    """The persisted filter plus its sync watermark and per-run lookup stats.
+
+    The watermark is the `(created_at, id)` key of the last synced row;
+    `synced_at` is the wall-clock time of the last successful sync. With
+    `trust_misses` off, `might_contain` returns every hash.
+    """
+
+    def __init__(
+        self,
+        bloom: BloomFilter,
+        watermark: str | None = None,
+        capacity: int = 0,
+        watermark_id: str | None = None,
+        synced_at: float | None = None,
+    ):
+        self.bloom = bloom
+        self.watermark = watermark
+        self.watermark_id = watermark_id
+        self.synced_at = synced_at
+        self.capacity = capacity
+        self.trust_misses = True
+        self.dirty = False
+        self.stats = {"lookups": 0, "filter_hits": 0, "db_confirmed": 0, "misses_verified": 0, "stale_misses": 0}
+
+    def might_contain(self, content_hashes: list[str]) -> list[str]:
+        """Return the hashes that need a database check (filter hits, or all when misses are not trusted)."""
+        hits = [content_hash for content_hash in content_hashes if content_hash in self.bloom]
+        self.stats["lookups"] += len(content_hashes)
+        self.stats["filter_hits"] += len(hits)
+        if self.trust_misses:
+            return hits
+        self.stats["misses_verified"] += len(content_hashes) - len(hits)
+        return list(content_hashes)
+
+    def record_confirmed(self, existing: set[str]) -> None:
+        """Count hashes the database confirmed; ones the filter missed are added to it."""
+        missed = [content_hash for content_hash in existing if content_hash not in self.bloom]
+        self.stats["db_confirmed"] += len(existing) - len(missed)
+        self.stats["stale_misses"] += len(missed)
+        self.add_many(missed)
+
+    def add_many(self, content_hashes: Iterable[str]) -> None:
+        for content_hash in content_hashes:
+            # Re-synced boundary rows and rows added during the run are not counted twice.
+            if content_hash and content_hash not in self.bloom:
+                self.bloom.add(content_hash)
+                self.dirty = True
+
+    def observed_fpr(self) -> float:
+        """Share of lookups of hashes not in the table that the filter still reported."""
+        absent = self.stats["lookups"] - self.stats["db_confirmed"] - self.stats["stale_misses"]
+        false_hits = self.stats["filter_hits"] - self.stats["db_confirmed"]
+        return false_hits / absent if absent > 0 else 0.0
+
+    def sync(self) -> int:
+        """Add hashes of rows created after the watermark; return how many were read."""
+        from .supabase_client import fetch_content_hashes_since
+
+        read = 0
+        while True:
+            rows = fetch_content_hashes_since(self.watermark, self.watermark_id, limit=_SYNC_PAGE_SIZE)
+            self.add_many(row.get("content_hash") or "" for row in rows)
+            read += len(rows)
+            last = rows[-1] if rows else {}
+            if not last.get("created_at") or not last.get("id"):
+                break
+            # Keyset paging: rows sharing one created_at continue by id on the next page.
+            self.watermark = last["created_at"]
+            self.watermark_id = str(last["id"])
+            if len(rows) < _SYNC_PAGE_SIZE:
+                break
+        self.synced_at = time.time()
+        self.dirty = True
+        if self.capacity and self.bloom.count > self.capacity:
+            print(
+                f"[WARN] content hash filter holds {self.bloom.count} hashes (capacity {self.capacity}); "
+                "run `python -m news_pipeline.hash_filter --rebuild`"
+            )
+        return read
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        path = _filter_path()
+        header = {
+            "num_bits": self.bloom.num_bits,
+            "num_hashes": self.bloom.num_hashes,
+            "count": self.bloom.count,
+            "capacity": self.capacity,
+            "watermark": self.watermark,
+            "watermark_id": self.watermark_id,
+            "synced_at": self.synced_at,
+        }
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(json.dumps(header).encode("utf-8") + b"\n" + bytes(self.bloom.bits))
+        os.replace(tmp_path, path)
+        self.dirty = False
+
+
+def _filter_path() -> Path:
+    return local_store.get_cache_dir() / _FILENAME
+
+
+def _new_filter(count_hint: int = 0) -> HashFilter:
+    cfg = load_config()
+    # Leave room to grow: size for twice the current table when it already exceeds the setting.
+    capacity = max(cfg.hash_filter_capacity, 2 * count_hint)
+    return HashFilter(BloomFilter.for_capacity(capacity, cfg.hash_filter_fpr), capacity=capacity)
+
+
+def load_filter() -> HashFilter | None:
+    """Read the persisted filter, or None when there is none yet."""
+    path = _filter_path()
+    if not path.exists():
+        return None
+    data = path.read_bytes()
+    header_line, _, bits = data.partition(b"\n")
+    header = json.loads(header_line)
+    bloom = BloomFilter(
+        int(header["num_bits"]),
+        int(header["num_hashes"]),
+        bytearray(bits),
+        int(header.get("count", 0)),
+    )
+    if len(bloom.bits) != (bloom.num_bits + 7) // 8:
+        raise ValueError(f"{path.name} is truncated")
+    return HashFilter(
+        bloom,
+        header.get("watermark"),
+        int(header.get("capacity", 0)),
+        header.get("watermark_id"),
+        header.get("synced_at"),
+    )
+
+
+def rebuild() -> HashFilter:
+    """Build a fresh filter from every news_raw row and persist it."""
+    try:
+        previous = load_filter()
+    except Exception:
+        previous = None
+    hash_filter = _new_filter(previous.bloom.count if previous else 0)
+    read = hash_filter.sync()
+    hash_filter.dirty = True
+    hash_filter.save()
+    print(f"[HASH-FILTER] rebuilt | rows={read} | hashes={hash_filter.bloom.count} | bits={hash_filter.bloom.num_bits} | k={hash_filter.bloom.num_hashes}")
+    return hash_filter
+
+
+_LOCK = threading.Lock()
+_filter: HashFilter | None = None
+_configured = False
+
+
+def get_filter() -> HashFilter | None:
+    """Return the synced shared filter, or None when disabled or unavailable."""
+    global _filter, _configured
+    with _LOCK:
+        if _configured:
+            return _filter
+        _configured = True
+        cfg = load_config()
+        if not cfg.hash_filter_enabled:
+            return None
+        try:
+            hash_filter = load_filter()
+            if hash_filter is None:
+                from .supabase_client import count_news_raw
+
+                rows = count_news_raw()
+                if rows > cfg.hash_filter_bootstrap_max_rows:
+                    print(
+                        f"[HASH-FILTER] no local filter and news_raw has {rows} rows; checking every hash in the "
+                        "database (build with `python -m news_pipeline.hash_filter --rebuild`)"
+                    )
+                    return None
+                print(f"[HASH-FILTER] no local filter yet, building from news_raw | rows={rows}")
+                _filter = rebuild()
+            else:
+                age_hours = (time.time() - hash_filter.synced_at) / 3600.0 if hash_filter.synced_at else None
+                if age_hours is None or age_hours > cfg.hash_filter_max_age_hours:
+                    # Hashes rewritten elsewhere since then are invisible to a created_at sync.
+                    hash_filter.trust_misses = False
+                    age = f"{age_hours:.0f}h ago" if age_hours is not None else "at an unknown time"
+                    print(f"[HASH-FILTER] last synced {age}; verifying misses in the database this run")
+                read = hash_filter.sync()
+                hash_filter.save()
+                print(f"[HASH-FILTER] synced | new_rows={read} | hashes={hash_filter.bloom.count}")
+                _filter = hash_filter
+        except Exception as exc:
+            print(f"[WARN] content hash filter unavailable, checking every hash in the database | error={exc}")
+            _filter = None
+        return _filter
+
+
+def add_hashes(content_hashes: Iterable[str]) -> None:
+    """Record hashes just written to news_raw (no-op when the filter is not in use)."""
+    with _LOCK:
+        hash_filter = _filter
+    if hash_filter is None:
+        return
+    hash_filter.add_many(content_hashes)
+
+
+def flush_run() -> None:
+    """Persist hashes added during the run and print the run's lookup stats."""
+    with _LOCK:
+        hash_filter = _filter
+    if hash_filter is None:
+        return
+    try:
+        hash_filter.save()
+    except Exception as exc:
+        print(f"[WARN] content hash filter save failed | error={exc}")
+    stats = hash_filter.stats
+    if stats["lookups"]:
+        print(
+            "[HASH-FILTER] "
+            f"lookups={stats['lookups']} filter_hits={stats['filter_hits']} "
+            f"db_confirmed={stats['db_confirmed']} "
+            f"db_queries_saved={stats['lookups'] - stats['filter_hits'] - stats['misses_verified']} "
+            f"observed_fpr={hash_filter.observed_fpr():.4f} expected_fpr={hash_filter.bloom.expected_fpr():.4f}"
+            + (
+                f" misses_verified={stats['misses_verified']} stale_misses={stats['stale_misses']}"
+                if stats["misses_verified"]
+                else ""
+            )
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Manage the local content_hash Bloom filter.")
+    parser.add_argument("--rebuild", action="store_true", help="rebuild from every news_raw row")
+    parser.add_argument("--stats", action="store_true", help="print size, fill ratio and expected false-positive rate")
+    args = parser.parse_args(argv)
+
+    hash_filter = rebuild() if args.rebuild else load_filter()
+    if hash_filter is None:
+        print("No content hash filter yet; run with --rebuild.")
+        return 1
+    if args.stats or not args.rebuild:
+        bloom = hash_filter.bloom
+        filled = sum(bin(byte).count("1") for byte in bloom.bits) / bloom.num_bits
+        print(
+            f"hashes={bloom.count} capacity={hash_filter.capacity} bits={bloom.num_bits} k={bloom.num_hashes} "
+            f"size={len(bloom.bits) / 1024:.0f}KB fill={filled:.3f} "
+            f"expected_fpr={bloom.expected_fpr():.5f} watermark={hash_filter.watermark}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""Per-host politeness scheduler for outbound requests.
+
+Each host gets a concurrency cap plus a token bucket (`rate_per_sec`, `burst`),
+so a burst of entries from one publisher is paced while other hosts proceed in
+parallel. Time spent waiting for a slot or a token is tracked per host.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
+from urllib.parse import urlparse
+
+
+@dataclass(frozen=True)
+class HostLimit:
+    """Limits for one host. `rate_per_sec <= 0` disables rate limiting."""
+
+    max_concurrent: int
+    rate_per_sec: float
+    burst: int = 1
+
+
+class _HostState:
+    def __init__(self, limit: HostLimit) -> None:
+        self.limit = limit
+        self.semaphore = threading.BoundedSemaphore(max(1, limit.max_concurrent))
+        self.lock = threading.Lock()
+        self.tokens = float(max(1, limit.burst))
+        self.updated_at = time.monotonic()
+        self.requests = 0
+        self.wait_seconds = 0.0
+
+    def reserve_token(self) -> float:
+        """Take one token and return how long the caller must sleep for it."""
+        rate = self.limit.rate_per_sec
+        if rate <= 0:
+            return 0.0
+        with self.lock:
+            now = time.monotonic()
+            capacity = float(max(1, self.limit.burst))
+            self.tokens = min(capacity, self.tokens + (now - self.updated_at) * rate)
+            self.updated_at = now
+            self.tokens -= 1.0
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / rate
+
+
+def host_of(url: str) -> str:
+    """Return the lowercase host of a URL ("" when unparsable)."""
+    try:
+        return (urlparse(url).hostname or "").lower()
+    except Exception:
+        return ""
+
+
+def parse_host_limits(raw: str, default: HostLimit) -> dict[str, HostLimit]:
+    """Parse `host=concurrent/rate[/burst],...` overrides.
+
+    Example: `retaildive.com=1/0.5,pymnts.com=2/1/3`.
+    """
+    overrides: dict[str, HostLimit] = {}
+    for part in (raw or "").split(","):
+        host, _, spec = part.partition("=")
+        host = host.strip().lower()
+        if not host or not spec.strip():
+            continue
+        fields = [field.strip() for field in spec.split("/")]
+        try:
+            overrides[host] = HostLimit(
+                max_concurrent=int(fields[0]) if fields[0] else default.max_concurrent,
+                rate_per_sec=float(fields[1]) if len(fields) > 1 and fields[1] else default.rate_per_sec,
+                burst=int(fields[2]) if len(fields) > 2 and fields[2] else default.burst,
+            )
+        except ValueError:
+            print(f"[WARN] Invalid host limit override: {part}")
+    return overrides
+
+
+class HostScheduler:
+    """Thread-safe per-host concurrency + rate limiter."""
+
+    def __init__(self, default: HostLimit, overrides: dict[str, HostLimit] | None = None) -> None:
+        self._default = default
+        self._overrides = overrides or {}
+        self._lock = threading.Lock()
+        self._hosts: dict[str, _HostState] = {}
+
+    def _limit_for(self, host: str) -> HostLimit:
+        # Overrides match the host itself or any parent domain (www.pymnts.com -> pymnts.com).
+        labels = host.split(".")
+        for index in range(len(labels) - 1):
+            candidate = ".".join(labels[index:])
+            if candidate in self._overrides:
+                return self._overrides[candidate]
+        return self._default
+
+    def _state(self, host: str) -> _HostState:
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = _HostState(self._limit_for(host))
+                self._hosts[host] = state
+            return state
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        """Block until the URL's host has a free slot and a token, then yield."""
+        state = self._state(host_of(url))
+        started = time.monotonic()
+        state.semaphore.acquire()
+        try:
+            delay = state.reserve_token()
+            if delay > 0:
+                time.sleep(delay)
+            waited = time.monotonic() - started
+            with state.lock:
+                state.requests += 1
+                state.wait_seconds += waited
+            yield
+        finally:
+            state.semaphore.release()
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Return `{host: {"requests": n, "wait_seconds": s}}`."""
+        with self._lock:
+            states = dict(self._hosts)
+        result: dict[str, dict[str, float]] = {}
+        for host, state in states.items():
+            with state.lock:
+                result[host] = {"requests": state.requests, "wait_seconds": round(state.wait_seconds, 3)}
+        return result
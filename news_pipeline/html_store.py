@@ -0,0 +1,161 @@
+"""Content-addressed store of downloaded article HTML.
+
+Pages are compressed (zstd when `zstandard` is installed, gzip otherwise) and
+written once per distinct body under `<PIPELINE_CACHE_DIR>/html/`, named by the
+sha256 of the raw bytes. A SQLite index maps `(url, fetch_date)` to that digest
+so the same page fetched on several days is stored once, and re-extraction
+(`python -m news_pipeline.reextract`) can run offline on the latest copy.
+
+Enabled with `HTML_CACHE_ENABLED=true`; write failures are logged and ignored.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from . import local_store
+from .charset import decode_body
+from .config import load_config
+
+try:  # Optional dependency: faster, smaller compression.
+    import zstandard
+except ImportError:  # pragma: no cover - depends on environment
+    zstandard = None
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS html_pages (
+    url TEXT NOT NULL,
+    fetch_date TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    encoding TEXT NOT NULL DEFAULT '',
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (url, fetch_date)
+);
+"""
+
+_enabled: bool | None = None
+
+
+def is_enabled() -> bool:
+    """Return whether downloaded pages should be stored (HTML_CACHE_ENABLED)."""
+    global _enabled
+    if _enabled is None:
+        _enabled = load_config().html_cache_enabled
+    return _enabled
+
+
+def _ensure_schema() -> None:
+    local_store.ensure_schema("html_pages", _SCHEMA)
+
+
+def _blob_path(digest: str, suffix: str) -> Path:
+    return local_store.get_cache_dir() / "html" / digest[:2] / f"{digest}{suffix}"
+
+
+def _compress(body: bytes) -> tuple[bytes, str]:
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=10).compress(body), ".html.zst"
+    return gzip.compress(body, compresslevel=6), ".html.gz"
+
+
+def _find_blob(digest: str) -> Path | None:
+    for suffix in (".html.zst", ".html.gz"):
+        path = _blob_path(digest, suffix)
+        if path.exists():
+            return path
+    return None
+
+
+def _read_blob(path: Path) -> bytes:
+    data = path.read_bytes()
+    if path.suffix == ".zst":
+        if zstandard is None:
+            raise RuntimeError(f"{path.name} needs the zstandard package")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+def save_html(url: str, body: bytes, encoding: str | None = None, fetched_at: datetime | None = None) -> None:
+    """Store a downloaded page under its content digest and index it by URL + date."""
+    if not url or not body:
+        return
+    try:
+        _ensure_schema()
+        digest = hashlib.sha256(body).hexdigest()
+        if _find_blob(digest) is None:
+            compressed, suffix = _compress(body)
+            path = _blob_path(digest, suffix)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so concurrent readers never see a partial blob.
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(compressed)
+            tmp_path.replace(path)
+        fetch_date = (fetched_at or datetime.now(timezone.utc)).date().isoformat()
+        local_store.execute(
+            "INSERT OR REPLACE INTO html_pages (url, fetch_date, digest, encoding, stored_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (url, fetch_date, digest, encoding or "", time.time()),
+        )
+    except Exception as exc:
+        print(f"[WARN] html_store save failed | url={url} | error={exc}")
+
+
+def alias_html(url: str, source_url: str, fetched_at: datetime | None = None) -> None:
+    """Index `url` to the latest page stored for `source_url` (the URL it was downloaded from).
+
+    Pages are saved under the URL actually downloaded; rows in news_raw keep the
+    entry's article URL, which can differ when a fallback candidate won.
+    """
+    if not url or not source_url or url == source_url:
+        return
+    try:
+        _ensure_schema()
+        row = local_store.fetch_one(
+            "SELECT digest, encoding FROM html_pages WHERE url = ? ORDER BY fetch_date DESC LIMIT 1",
+            (source_url,),
+        )
+        if not row:
+            return
+        fetch_date = (fetched_at or datetime.now(timezone.utc)).date().isoformat()
+        local_store.execute(
+            "INSERT OR REPLACE INTO html_pages (url, fetch_date, digest, encoding, stored_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (url, fetch_date, row[0], row[1], time.time()),
+        )
+    except Exception as exc:
+        print(f"[WARN] html_store alias failed | url={url} | error={exc}")
+
+
+def load_html(url: str, fetch_date: str | None = None) -> tuple[bytes, str] | None:
+    """Return `(raw_bytes, encoding)` for the latest (or given-date) copy of a URL."""
+    try:
+        _ensure_schema()
+        if fetch_date:
+            row = local_store.fetch_one(
+                "SELECT digest, encoding FROM html_pages WHERE url = ? AND fetch_date = ?",
+                (url, fetch_date),
+            )
+        else:
+            row = local_store.fetch_one(
+                "SELECT digest, encoding FROM html_pages WHERE url = ? ORDER BY fetch_date DESC LIMIT 1",
+                (url,),
+            )
+        if not row:
+            return None
+        path = _find_blob(row[0])
+        if path is None:
+            return None
+        return _read_blob(path), row[1]
+    except Exception as exc:
+        print(f"[WARN] html_store load failed | url={url} | error={exc}")
+        return None
+
+
+def decode_html(body: bytes, encoding: str = "") -> str:
+    """Decode stored bytes with the header charset recorded at fetch time."""
+    return decode_body(body, encoding or None)
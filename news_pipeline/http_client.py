@@ -0,0 +1,320 @@
+"""Shared pooled HTTP client for the news pipeline.
+
+`fetcher` and `ai_client` go through one keep-alive `requests.Session` so
+repeated calls to the same host reuse TCP/TLS connections:
+- connection pools are sized per host (`HTTP_POOL_SIZE_PER_HOST`, with
+  `HTTP_POOL_SIZE_OVERRIDES=host=size,...` for hot hosts like news.google.com)
+- idempotent GETs retry on connect errors / 429 / 5xx (`HTTP_RETRIES`);
+  a `Retry-After` header is honoured up to `_MAX_RETRY_AFTER_SEC` only. Calls
+  made with `retry=False` (article downloads and link resolution, which the
+  per-host circuit breaker already covers) use a second pool that never retries
+- hosts listed in `HTTP2_HOSTS` use an HTTP/2 `httpx` client when `httpx[http2]`
+  is installed; otherwise they silently stay on the pooled HTTP/1.1 session
+- `get_bounded` streams a page and stops early on non-HTML content types or
+  bodies over `DOWNLOAD_MAX_BYTES` / `DOWNLOAD_MAX_DECOMPRESSED_BYTES`
+"""
+
+from __future__ import annotations
+
+import ssl
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlparse
+
+import certifi
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+from .charset import charset_from_content_type, decode_body
+from .config import load_config
+
+try:  # Optional dependency: HTTP/2 support.
+    import h2  # noqa: F401
+    import httpx
+except ImportError:  # pragma: no cover - depends on environment
+    httpx = None
+
+_RETRY_STATUS = (429, 500, 502, 503, 504)
+# A 429 with `Retry-After: 3600` must not park a worker past the workflow timeout.
+_MAX_RETRY_AFTER_SEC = 5.0
+_STREAM_CHUNK_BYTES = 64 * 1024
+# Content types worth handing to the HTML extractors; a missing header is sniffed.
+_MARKUP_TYPES = ("text/html", "application/xhtml+xml", "text/xml", "application/xml", "text/plain")
+_BINARY_SIGNATURES = (b"%PDF", b"PK\x03\x04", b"\x89PNG", b"GIF8", b"\xff\xd8\xff", b"\x1f\x8b", b"ID3", b"OggS")
+
+_LOCK = threading.Lock()
+# Keyed by "retries enabled".
+_sessions: dict[bool, requests.Session] = {}
+_http2_clients: dict[bool, Any] = {}
+_http2_hosts: set[str] = set()
+_request_counts = {"http1": 0, "http2": 0}
+
+
+def _parse_pool_overrides(raw: str) -> dict[str, int]:
+    """Parse `host=size,host=size` pool overrides."""
+    overrides: dict[str, int] = {}
+    for part in (raw or "").split(","):
+        host, _, size = part.partition("=")
+        host = host.strip().lower()
+        if not host or not size.strip():
+            continue
+        try:
+            overrides[host] = max(1, int(size))
+        except ValueError:
+            print(f"[WARN] Invalid HTTP_POOL_SIZE_OVERRIDES entry: {part}")
+    return overrides
+
+
+class _CappedRetry(Retry):
+    """urllib3 `Retry` whose `Retry-After` sleep is capped at `_MAX_RETRY_AFTER_SEC`."""
+
+    def get_retry_after(self, response: Any) -> float | None:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, _MAX_RETRY_AFTER_SEC)
+
+
+def _build_adapter(pool_size: int, retries: int, backoff: float) -> HTTPAdapter:
+    if retries <= 0:
+        return HTTPAdapter(pool_connections=64, pool_maxsize=pool_size, max_retries=0)
+    retry = _CappedRetry(
+        total=retries,
+        connect=retries,
+        read=0,
+        status=retries,
+        backoff_factor=backoff,
+        status_forcelist=_RETRY_STATUS,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    return HTTPAdapter(pool_connections=64, pool_maxsize=pool_size, max_retries=retry)
+
+
+def _build_session(retries: int) -> requests.Session:
+    cfg = load_config()
+    session = requests.Session()
+    session.verify = certifi.where()
+    default_adapter = _build_adapter(cfg.http_pool_size_per_host, retries, cfg.http_backoff_sec)
+    session.mount("https://", default_adapter)
+    session.mount("http://", default_adapter)
+    # requests picks the longest matching mount prefix, so host adapters win.
+    for host, size in _parse_pool_overrides(cfg.http_pool_size_overrides).items():
+        host_adapter = _build_adapter(size, retries, cfg.http_backoff_sec)
+        session.mount(f"https://{host}", host_adapter)
+        session.mount(f"http://{host}", host_adapter)
+    return session
+
+
+def _init_clients(retry: bool = True) -> requests.Session:
+    """Create the shared sessions (and optional HTTP/2 clients) once."""
+    global _http2_hosts
+    with _LOCK:
+        if _sessions:
+            return _sessions[retry]
+
+        cfg = load_config()
+        hosts = {h.strip().lower() for h in (cfg.http2_hosts or "").split(",") if h.strip()}
+        if hosts and httpx is None:
+            print("[WARN] HTTP2_HOSTS set but httpx[http2] is not installed; using HTTP/1.1.")
+        elif hosts:
+            for retried in (True, False):
+                transport = httpx.HTTPTransport(
+                    http2=True,
+                    retries=cfg.http_retries if retried else 0,
+                    verify=ssl.create_default_context(cafile=certifi.where()),
+                    limits=httpx.Limits(max_connections=cfg.http_pool_size_per_host * 2),
+                )
+                _http2_clients[retried] = httpx.Client(http2=True, transport=transport)
+            _http2_hosts = hosts
+
+        _sessions[True] = _build_session(cfg.http_retries)
+        _sessions[False] = _build_session(0)
+        return _sessions[retry]
+
+
+def _use_http2(url: str) -> bool:
+    if not _http2_clients:
+        return False
+    try:
+        host = (urlparse(url).hostname or "").lower()
+    except Exception:
+        return False
+    return host in _http2_hosts
+
+
+def _count(kind: str) -> None:
+    with _LOCK:
+        _request_counts[kind] += 1
+
+
+def get(
+    url: str,
+    *,
+    headers: dict[str, str] | None = None,
+    timeout: float = 15,
+    allow_redirects: bool = True,
+    stream: bool = False,
+    retry: bool = True,
+) -> Any:
+    """GET through the shared pool; returns a requests/httpx response object.
+
+    Both response types expose `status_code`, `headers`, `content`, `text`
+    and `url`. Streaming always uses the requests session. `retry=False`
+    makes a single attempt.
+    """
+    session = _init_clients(retry)
+    if not stream and _use_http2(url):
+        _count("http2")
+        return _http2_clients[retry].get(url, headers=headers, timeout=timeout, follow_redirects=allow_redirects)
+
+    _count("http1")
+    return session.get(
+        url,
+        headers=headers,
+        timeout=timeout,
+        allow_redirects=allow_redirects,
+        stream=stream,
+    )
+
+
+@dataclass
+class BoundedResponse:
+    """Result of `get_bounded`: the (possibly partial) body and why it stopped.
+
+    `aborted` is "" for a complete download, otherwise one of "content_type",
+    "binary", "too_large", "decompressed_too_large"; `content` is then empty.
+    """
+
+    status_code: int
+    url: str
+    headers: CaseInsensitiveDict = field(default_factory=CaseInsensitiveDict)
+    content: bytes = b""
+    aborted: str = ""
+    wire_bytes: int = 0
+
+    @property
+    def encoding(self) -> str | None:
+        """Charset declared in the Content-Type header (None when absent)."""
+        return charset_from_content_type(self.headers.get("Content-Type"))
+
+    @property
+    def text(self) -> str:
+        # Header charset, then in-document declaration; never full-body detection.
+        return decode_body(self.content, self.encoding)
+
+
+def _is_markup_type(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return not media_type or media_type in _MARKUP_TYPES or media_type.endswith("+xml")
+
+
+def get_bounded(
+    url: str,
+    *,
+    headers: dict[str, str] | None = None,
+    timeout: float = 15,
+    max_bytes: int | None = None,
+    max_decompressed_bytes: int | None = None,
+    retry: bool = True,
+) -> BoundedResponse:
+    """Stream an HTML page through the shared session with size / type limits.
+
+    `max_bytes` caps bytes on the wire (checked against Content-Length first),
+    `max_decompressed_bytes` caps the decoded body so a small gzip bomb cannot
+    expand unbounded. Defaults come from `DOWNLOAD_MAX_BYTES` /
+    `DOWNLOAD_MAX_DECOMPRESSED_BYTES`; 0 disables a cap.
+    """
+    cfg = load_config()
+    if max_bytes is None:
+        max_bytes = cfg.download_max_bytes
+    if max_decompressed_bytes is None:
+        max_decompressed_bytes = cfg.download_max_decompressed_bytes
+
+    response = get(url, headers=headers, timeout=timeout, stream=True, retry=retry)
+    result = BoundedResponse(status_code=response.status_code, url=response.url, headers=response.headers)
+    try:
+        if response.status_code != 200:
+            return result
+        if not _is_markup_type(response.headers.get("Content-Type", "")):
+            result.aborted = "content_type"
+            return result
+        try:
+            declared = int(response.headers.get("Content-Length") or 0)
+        except ValueError:
+            declared = 0
+        if max_bytes and declared > max_bytes:
+            result.aborted = "too_large"
+            return result
+
+        chunks: list[bytes] = []
+        decoded_bytes = 0
+        for chunk in response.raw.stream(_STREAM_CHUNK_BYTES, decode_content=True):
+            result.wire_bytes = response.raw.tell()
+            if not chunks and chunk.lstrip()[:8].startswith(_BINARY_SIGNATURES):
+                result.aborted = "binary"
+                break
+            chunks.append(chunk)
+            decoded_bytes += len(chunk)
+            if max_bytes and result.wire_bytes > max_bytes:
+                result.aborted = "too_large"
+                break
+            if max_decompressed_bytes and decoded_bytes > max_decompressed_bytes:
+                result.aborted = "decompressed_too_large"
+                break
+        if not result.aborted:
+            result.content = b"".join(chunks)
+        return result
+    finally:
+        # Closing an unfinished stream drops the connection instead of draining it.
+        response.close()
+
+
+def post(
+    url: str,
+    *,
+    headers: dict[str, str] | None = None,
+    json: Any = None,
+    timeout: float = 60,
+) -> requests.Response:
+    """POST through the shared pool (never retried: calls may not be idempotent)."""
+    session = _init_clients()
+    _count("http1")
+    return session.post(url, headers=headers, json=json, timeout=timeout)
+
+
+def get_connection_stats() -> dict[str, int]:
+    """Return request and connection counts for the shared HTTP/1.1 pools.
+
+    `reused` is the number of HTTP/1.1 requests that did not need a new
+    connection (retries count as requests).
+    """
+    with _LOCK:
+        counts = dict(_request_counts)
+        sessions = list(_sessions.values())
+
+    pooled_requests = 0
+    connections = 0
+    hosts = 0
+    adapters = {id(adapter): adapter for session in sessions for adapter in session.adapters.values()}
+    for adapter in adapters.values():
+        pools = adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            hosts += 1
+            pooled_requests += getattr(pool, "num_requests", 0)
+            connections += getattr(pool, "num_connections", 0)
+
+    return {
+        "requests": counts["http1"] + counts["http2"],
+        "http2_requests": counts["http2"],
+        "pooled_hosts": hosts,
+        "connections_opened": connections,
+        "reused": max(0, pooled_requests - connections),
+    }
@@ -0,0 +1,69 @@
+"""Keyword categories compiled once for the processor's relevance filter.
+
+`KeywordMatcher` holds every category's terms, ordered shortest first since
+short terms like `ai` or `tax` are the likeliest substring hits.
+`KeywordMatcher.scan(text)` returns a `KeywordScan` that answers per
+category:
+
+- `has(category)`: stops at the first hit; a term shared by several
+  categories (`platform`, `payment`, `tariff`, ...) is searched at most once
+  per scan;
+- `terms(category)` / `hits()`: the full matched-term sets, for debugging and
+  reports.
+
+Substring semantics match the previous `any(keyword in text ...)` checks, so
+decisions are unchanged. `scripts/bench_relevance.py` compares this against
+the old per-set scans and a single full pass.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Mapping
+
+
+class KeywordScan:
+    """Lazy, memoized keyword lookups over one normalized text."""
+
+    def __init__(self, matcher: "KeywordMatcher", normalized: str):
+        self._matcher = matcher
+        self._text = normalized
+        self._found: dict[str, bool] = {}
+
+    def _contains(self, term: str) -> bool:
+        found = self._found.get(term)
+        if found is None:
+            found = term in self._text
+            self._found[term] = found
+        return found
+
+    def has(self, category: str) -> bool:
+        """True when any term of the category occurs in the text."""
+        return any(self._contains(term) for term in self._matcher.category_terms(category))
+
+    def terms(self, category: str) -> frozenset[str]:
+        """All terms of the category that occur in the text."""
+        return frozenset(term for term in self._matcher.category_terms(category) if self._contains(term))
+
+    def hits(self) -> dict[str, frozenset[str]]:
+        """Matched terms for every category."""
+        return {category: self.terms(category) for category in self._matcher.categories}
+
+
+class KeywordMatcher:
+    """Named keyword categories matched by substring against normalized text."""
+
+    def __init__(self, categories: Mapping[str, Iterable[str]]):
+        self._categories = {
+            name: tuple(sorted({term for term in terms if term}, key=lambda term: (len(term), term)))
+            for name, terms in categories.items()
+        }
+
+    @property
+    def categories(self) -> tuple[str, ...]:
+        return tuple(self._categories)
+
+    def category_terms(self, category: str) -> tuple[str, ...]:
+        return self._categories[category]
+
+    def scan(self, normalized: str) -> KeywordScan:
+        return KeywordScan(self, normalized or "")
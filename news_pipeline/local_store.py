@@ -0,0 +1,82 @@
+"""Local SQLite state shared by the pipeline's on-disk caches.
+
+All callers treat this store as a best-effort optimization: if the cache
+directory is not writable the pipeline simply runs uncached.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+from .config import load_config
+
+_DB_FILENAME = "pipeline_state.sqlite3"
+
+_LOCK = threading.RLock()
+_connection: sqlite3.Connection | None = None
+_ready_schemas: set[str] = set()
+
+
+def get_cache_dir() -> Path:
+    """Return the configured cache directory, creating it when missing."""
+    cache_dir = Path(load_config().cache_dir).expanduser()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def get_connection() -> sqlite3.Connection:
+    """Return the process-wide SQLite connection (opened lazily)."""
+    global _connection
+    with _LOCK:
+        if _connection is None:
+            path = get_cache_dir() / _DB_FILENAME
+            conn = sqlite3.connect(str(path), timeout=30, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            _connection = conn
+        return _connection
+
+
+def ensure_schema(name: str, ddl: str) -> None:
+    """Run a feature's CREATE statements once per process."""
+    with _LOCK:
+        if name in _ready_schemas:
+            return
+        get_connection().executescript(ddl)
+        _ready_schemas.add(name)
+
+
+def execute(sql: str, params: tuple[Any, ...] = ()) -> None:
+    """Execute one write statement under the store lock."""
+    with _LOCK:
+        get_connection().execute(sql, params)
+
+
+def executemany(sql: str, rows: list[tuple[Any, ...]]) -> None:
+    """Execute one write statement for many rows inside a transaction."""
+    if not rows:
+        return
+    with _LOCK:
+        conn = get_connection()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(sql, rows)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+
+def fetch_one(sql: str, params: tuple[Any, ...] = ()) -> tuple[Any, ...] | None:
+    """Return the first row of a query, or None."""
+    with _LOCK:
+        return get_connection().execute(sql, params).fetchone()
+
+
+def fetch_all(sql: str, params: tuple[Any, ...] = ()) -> list[tuple[Any, ...]]:
+    """Return all rows of a query."""
+    with _LOCK:
+        return get_connection().execute(sql, params).fetchall()
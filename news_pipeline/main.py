@@ -4,12 +4,17 @@ from datetime import datetime, timedelta, timezone
 
 from .ai_client import generate_summary
 from .config import load_config
-from .fetcher import fetch_rss_items, recover_full_content
+from .feed_ledger import flush_run as flush_feed_ledger
+from .feed_state import flush_run as flush_feed_state
+from .hash_filter import add_hashes as add_content_hashes
+from .hash_filter import flush_run as flush_hash_filter
+from .fetcher import get_fetch_stats, iter_rss_items, recover_full_content
+from .http_client import get_connection_stats
 from .processor import (
     generate_content_hash,
     is_low_quality_content,
     is_relevant_news,
-    process_news_items,
+    process_news_items_stream,
 )
 from .supabase_client import (
     delete_news_by_ids,
@@ -156,11 +161,13 @@ def _run_summary_generation(inserted_records: list[dict[str, str]], enable_summa
             if is_low_confidence_summary(summary):
                 recovered = recover_full_content(record.get("url", ""), title, content)
                 if recovered and recovered != content:
-                    update_news_content(
+                    recovered_hash = generate_content_hash(recovered)
+                    if update_news_content(
                         news_id=record["id"],
                         content=recovered,
-                        content_hash=generate_content_hash(recovered),
-                    )
+                        content_hash=recovered_hash,
+                    ):
+                        add_content_hashes([recovered_hash])
                     summary = generate_summary(title, recovered)
                     print(f"[SUMMARY] Recovered body and regenerated | id={record['id']}")
 
@@ -196,13 +203,17 @@ def main() -> None:
         print(f"[RUN] Incremental fetch since: {incremental_start.isoformat()}")
 
     print("Fetching RSS...")
-    items = fetch_rss_items(min_publish_time=incremental_start)
-
-    print(f"Fetched {len(items)} items")
-
-    result = process_news_items(items)
+    # Items are inserted as they are extracted; nothing is buffered per run.
+    result = process_news_items_stream(iter_rss_items(min_publish_time=incremental_start))
+    flush_feed_ledger()
+    # Validators are saved only after the feeds' items were stored (or skipped).
+    flush_feed_state()
+    print(f"Fetched {result['stats']['received']} items")
+    result["stats"]["fetch"] = get_fetch_stats()
     _run_summary_generation(result["inserted_records"], cfg.enable_summary)
+    flush_hash_filter()
 
+    print(f"[HTTP] {get_connection_stats()}")
     print("---- RESULT ----")
     print(result["stats"])
 
@@ -0,0 +1,238 @@
+"""Near-duplicate detection for syndicated stories.
+
+`content_hash` only catches byte-identical bodies; the same wire story on
+several publishers differs in boilerplate, bylines and a sentence or two.
+Each item gets a 64-bit SimHash over shingles (3-token windows; every CJK
+character is a token) of its normalized title + body. Two items are near
+duplicates when their fingerprints agree on at least `NEAR_DUP_THRESHOLD` of
+the 64 bits.
+
+Fingerprints of recent `news_raw` rows (`NEAR_DUP_LOOKBACK_DAYS`) are kept in
+the local SQLite store, split into 8 bands of 8 bits that are indexed
+separately (LSH banding): any fingerprint within Hamming distance 7 shares at
+least one band, so lookups only compare against rows in matching buckets.
+That guarantee only covers thresholds of at least 57/64 (~0.89); at distance
+8 two fingerprints can differ in every band and never be compared, so a lower
+`NEAR_DUP_THRESHOLD` is raised to `MIN_THRESHOLD`. Each run pulls only rows
+created since the last sync.
+
+`NEAR_DUP_MODE=skip` (default) drops near duplicates at ingest; `mark` inserts
+them like any other item (summary included) and records the earlier row in
+`news_raw.duplicate_of`; `off` disables the check. Inserted rows carry their
+fingerprint in `news_raw.simhash`, so syncing never reads article bodies
+(both columns come from the `news_raw_near_duplicates` migration).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+
+from . import local_store
+from .config import load_config
+
+_BANDS = 8
+_BAND_BITS = 64 // _BANDS
+_SHINGLE_TOKENS = 3
+_SYNC_PAGE_SIZE = 1000
+# Lowest threshold the banding finds every match for: Hamming distance <= _BANDS - 1.
+MIN_THRESHOLD = (64 - (_BANDS - 1)) / 64
+
+_SCHEMA = (
+    """
+CREATE TABLE IF NOT EXISTS near_dup_docs (
+    news_id TEXT PRIMARY KEY,
+    simhash INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+"""
+    + ",\n".join(f"    b{band} INTEGER NOT NULL" for band in range(_BANDS))
+    + """
+);
+CREATE INDEX IF NOT EXISTS idx_near_dup_docs_created ON near_dup_docs (created_at);
+"""
+    + "".join(f"CREATE INDEX IF NOT EXISTS idx_near_dup_docs_b{band} ON near_dup_docs (b{band});\n" for band in range(_BANDS))
+    + """
+CREATE TABLE IF NOT EXISTS near_dup_links (
+    news_id TEXT PRIMARY KEY,
+    duplicate_of TEXT NOT NULL,
+    similarity REAL NOT NULL,
+    linked_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS near_dup_sync (
+    name TEXT PRIMARY KEY,
+    watermark TEXT NOT NULL
+);
+"""
+)
+
+# _BIT_TABLES[bit] maps each byte to 1 if that bit is set, else 0.
+_BIT_TABLES = [bytes(byte >> bit & 1 for byte in range(256)) for bit in range(8)]
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+|[\u4e00-\u9fff]")
+
+
+def _tokens(text: str) -> list[str]:
+    return _TOKEN_PATTERN.findall((text or "").lower())
+
+
+def fingerprint(title: str, content: str) -> int:
+    """Return the unsigned 64-bit SimHash of an item's title + body."""
+    tokens = _tokens(f"{title} {content}")
+    if len(tokens) > _SHINGLE_TOKENS:
+        shingles = {" ".join(tokens[i : i + _SHINGLE_TOKENS]) for i in range(len(tokens) - _SHINGLE_TOKENS + 1)}
+    else:
+        shingles = {" ".join(tokens)} if tokens else set()
+    if not shingles:
+        return 0
+    digests = b"".join(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest() for shingle in shingles)
+    # Majority vote per bit; translate/count keeps the counting in C.
+    value = 0
+    for column in range(8):
+        bytes_in_column = digests[column::8]
+        for bit in range(8):
+            if bytes_in_column.translate(_BIT_TABLES[bit]).count(1) * 2 > len(shingles):
+                value |= 1 << (column * 8 + bit)
+    return value
+
+
+def similarity(a: int, b: int) -> float:
+    """Fraction of the 64 fingerprint bits two items agree on."""
+    return 1.0 - bin(a ^ b).count("1") / 64.0
+
+
+def _bands(value: int) -> list[int]:
+    mask = (1 << _BAND_BITS) - 1
+    return [value >> (band * _BAND_BITS) & mask for band in range(_BANDS)]
+
+
+def signed64(value: int) -> int:
+    """Fingerprint as stored in SQLite and in `news_raw.simhash` (signed 64-bit)."""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def unsigned64(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+class NearDuplicateIndex:
+    """SimHash fingerprints of recent news_raw rows, banded in SQLite."""
+
+    def __init__(self, threshold: float, lookback_days: int):
+        self.threshold = threshold
+        self.lookback_days = lookback_days
+        local_store.ensure_schema("near_duplicate", _SCHEMA)
+
+    def find(self, value: int, extra: dict[str, int] | None = None) -> tuple[str, float] | None:
+        """Return `(news_id, similarity)` of the closest indexed item at/above the threshold.
+
+        `extra` maps ids to fingerprints not in the index yet (the current batch).
+        """
+        bands = _bands(value)
+        where = " OR ".join(f"b{band} = ?" for band in range(_BANDS))
+        rows = local_store.fetch_all(f"SELECT news_id, simhash FROM near_dup_docs WHERE {where}", tuple(bands))
+        candidates = [(str(news_id), unsigned64(int(simhash))) for news_id, simhash in rows]
+        candidates.extend((extra or {}).items())
+        best: tuple[str, float] | None = None
+        for news_id, other in candidates:
+            score = similarity(value, other)
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (news_id, score)
+        return best
+
+    def add(self, news_id: str, value: int, created_at: str | None = None) -> None:
+        self.add_many([(news_id, value, created_at)])
+
+    def add_many(self, rows: list[tuple[str, int, str | None]]) -> None:
+        now = datetime.now(timezone.utc).isoformat()
+        placeholders = ", ".join("?" for _ in range(_BANDS + 3))
+        local_store.executemany(
+            f"INSERT OR REPLACE INTO near_dup_docs (news_id, simhash, created_at, "
+            f"{', '.join(f'b{band}' for band in range(_BANDS))}) VALUES ({placeholders})",
+            [
+                (str(news_id), signed64(value), created_at or now, *_bands(value))
+                for news_id, value, created_at in rows
+            ],
+        )
+
+    def link(self, news_id: str, duplicate_of: str, score: float) -> None:
+        """Remember that an inserted row is a near duplicate of an earlier one."""
+        local_store.execute(
+            "INSERT OR REPLACE INTO near_dup_links (news_id, duplicate_of, similarity, linked_at) VALUES (?, ?, ?, ?)",
+            (str(news_id), str(duplicate_of), score, datetime.now(timezone.utc).isoformat()),
+        )
+
+    def sync(self) -> int:
+        """Index news_raw rows created since the last sync; prune rows past the lookback.
+
+        Only `(id, created_at, simhash)` is read; bodies are fetched just for
+        rows without a stored simhash (inserted before the column existed).
+        """
+        from .supabase_client import fetch_news_raw_bodies, fetch_simhashes_since
+
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=self.lookback_days)).isoformat()
+        local_store.execute("DELETE FROM near_dup_docs WHERE created_at < ?", (cutoff,))
+        marks = dict(local_store.fetch_all("SELECT name, watermark FROM near_dup_sync"))
+        since = marks.get("news_raw")
+        after_id = marks.get("news_raw_id")
+        if not since or since < cutoff:
+            since, after_id = cutoff, None
+
+        indexed = 0
+        while True:
+            rows = fetch_simhashes_since(since, after_id, limit=_SYNC_PAGE_SIZE)
+            stored = [row for row in rows if row.get("id") and row.get("simhash") is not None]
+            self.add_many([(row["id"], unsigned64(int(row["simhash"])), row.get("created_at")) for row in stored])
+            legacy_ids = [row["id"] for row in rows if row.get("id") and row.get("simhash") is None]
+            if legacy_ids:
+                self.add_many(
+                    [
+                        (row["id"], fingerprint(row.get("title", ""), row.get("content", "")), row.get("created_at"))
+                        for row in fetch_news_raw_bodies(legacy_ids)
+                    ]
+                )
+            indexed += len(rows)
+            last = rows[-1] if rows else {}
+            if not last.get("created_at") or not last.get("id"):
+                break
+            # Keyset paging: rows sharing one created_at continue by id on the next page.
+            since, after_id = last["created_at"], str(last["id"])
+            local_store.executemany(
+                "INSERT OR REPLACE INTO near_dup_sync (name, watermark) VALUES (?, ?)",
+                [("news_raw", since), ("news_raw_id", after_id)],
+            )
+            if len(rows) < _SYNC_PAGE_SIZE:
+                break
+        return indexed
+
+
+_LOCK = threading.Lock()
+_index: NearDuplicateIndex | None = None
+_configured = False
+
+
+def get_index() -> NearDuplicateIndex | None:
+    """Return the synced shared index, or None when `NEAR_DUP_MODE=off` or it is unavailable."""
+    global _index, _configured
+    with _LOCK:
+        if _configured:
+            return _index
+        _configured = True
+        cfg = load_config()
+        if cfg.near_dup_mode not in {"skip", "mark"}:
+            return None
+        threshold = cfg.near_dup_threshold
+        if threshold < MIN_THRESHOLD:
+            print(
+                f"[WARN] NEAR_DUP_THRESHOLD={threshold} is below what the {_BANDS}-band index finds reliably; "
+                f"using {MIN_THRESHOLD:.4f}"
+            )
+            threshold = MIN_THRESHOLD
+        try:
+            index = NearDuplicateIndex(threshold, cfg.near_dup_lookback_days)
+            indexed = index.sync()
+            print(f"[NEAR-DUP] index synced | new_rows={indexed} | mode={cfg.near_dup_mode}")
+            _index = index
+        except Exception as exc:
+            print(f"[WARN] near-duplicate index unavailable | error={exc}")
+        return _index
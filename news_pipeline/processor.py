@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import hashlib
 import re
-from difflib import SequenceMatcher
 from datetime import date, datetime, timezone
 from email.utils import parsedate_to_datetime
-from typing import Any
+from typing import Any, Iterable
 
-from .supabase_client import get_news_by_hash, insert_news_raw
+from . import feed_ledger, feed_state, hash_filter, near_duplicate
+from .config import load_config
+from .keyword_matcher import KeywordMatcher
+from .seen_index import mark_seen
+from .similarity import similar
+from .supabase_client import get_existing_hashes, insert_news_raw_batch, mark_news_duplicate
 
 TARGET_START_DATE = date(2026, 1, 1)
 
@@ -141,21 +145,20 @@ BUSINESS_SIGNAL_KEYWORDS = {
 }
 
 
-def _normalize_text(text: str) -> str:
-    normalized = re.sub(r"\s+", " ", (text or "")).strip().lower()
-    # Remove common noisy separators/suffix patterns.
-    normalized = re.sub(r"\s+\|\s+.*$", "", normalized)
-    normalized = re.sub(r"\s+-\s+.*$", "", normalized)
-    normalized = re.sub(r"[^a-z0-9\u4e00-\u9fff\s]", "", normalized)
-    return re.sub(r"\s+", " ", normalized).strip()
+_NON_WORD_CHARS = re.compile(r"[^a-z0-9\u4e00-\u9fff\s]")
 
 
-def _title_similarity(title: str, content: str) -> float:
-    t = _normalize_text(title)
-    c = _normalize_text(content)
-    if not t or not c:
-        return 0.0
-    return SequenceMatcher(None, t, c).ratio()
+def _normalize_text(text: str) -> str:
+    # str.split() splits on exactly the characters `\s` matches; join/split
+    # collapses whitespace much faster than re.sub on long bodies.
+    normalized = " ".join((text or "").split()).lower()
+    # Remove common noisy separators/suffix patterns (" | Site", " - Site").
+    for separator in (" | ", " - "):
+        cut = normalized.find(separator)
+        if cut >= 0:
+            normalized = normalized[:cut]
+    normalized = _NON_WORD_CHARS.sub("", normalized)
+    return " ".join(normalized.split())
 
 
 def _is_low_quality_content(title: str, content: str) -> bool:
@@ -169,7 +172,7 @@ def _is_low_quality_content(title: str, content: str) -> bool:
     if c.startswith(t) and len(c) <= len(t) + 20:
         return True
     # Catch near-duplicates even with small source suffix/punctuation differences.
-    if _title_similarity(title, content) >= 0.90:
+    if t and similar(t, c, 0.90):
         return True
     # Extremely short content is usually snippet/noise, not article body.
     if len(c) < 60:
@@ -180,8 +183,20 @@ def _is_low_quality_content(title: str, content: str) -> bool:
     return False
 
 
-def _contains_any(text: str, keywords: set[str]) -> bool:
-    return any(keyword in text for keyword in keywords)
+_RELEVANCE_MATCHER = KeywordMatcher(
+    {
+        "cross_border": CROSS_BORDER_KEYWORDS,
+        "ecommerce": ECOMMERCE_KEYWORDS,
+        "impact": IMPACT_KEYWORDS,
+        "business_signal": BUSINESS_SIGNAL_KEYWORDS,
+        "irrelevant": IRRELEVANT_KEYWORDS,
+    }
+)
+
+
+def relevance_keyword_hits(title: str, content: str) -> dict[str, frozenset[str]]:
+    """Matched keywords per category, for debugging relevance decisions."""
+    return _RELEVANCE_MATCHER.scan(_normalize_text(f"{title} {content}")).hits()
 
 
 def _is_relevant_news(title: str, content: str) -> bool:
@@ -189,27 +204,24 @@ def _is_relevant_news(title: str, content: str) -> bool:
     text = _normalize_text(f"{title} {content}")
     if not text:
         return False
+    scan = _RELEVANCE_MATCHER.scan(text)
 
-    has_cross_border = _contains_any(text, CROSS_BORDER_KEYWORDS)
-    has_ecommerce = _contains_any(text, ECOMMERCE_KEYWORDS)
-    has_impact = _contains_any(text, IMPACT_KEYWORDS)
-    has_business_signal = _contains_any(text, BUSINESS_SIGNAL_KEYWORDS)
-    has_irrelevant_signal = _contains_any(text, IRRELEVANT_KEYWORDS)
+    has_ecommerce = scan.has("ecommerce")
+    has_business_signal = scan.has("business_signal")
 
-    # Drop generic geo/political/security stories unless they also contain
-    # explicit ecommerce/business platform signals.
-    if has_irrelevant_signal and not (has_ecommerce or has_business_signal):
+    # Both keep rules below need an ecommerce or business signal. Without one
+    # the story is dropped, so generic geo/political/security stories
+    # ("irrelevant" terms) are dropped without scanning for those terms; with
+    # one, "irrelevant" terms do not matter.
+    if not (has_ecommerce or has_business_signal):
         return False
 
     # Primary: cross-border + business/ecommerce context.
-    if has_cross_border and (has_ecommerce or has_business_signal):
+    if scan.has("cross_border"):
         return True
 
     # Secondary: ecommerce + strategic impact signals.
-    if has_ecommerce and (has_impact or has_business_signal):
-        return True
-
-    return False
+    return has_ecommerce and (has_business_signal or scan.has("impact"))
 
 
 def is_relevant_news(title: str, content: str) -> bool:
@@ -254,81 +266,224 @@ def process_news_items(items: list[dict[str, Any]]) -> dict[str, Any]:
 
     Returns:
     {
-      "stats": {"inserted": int, "skipped": int, "filtered": int, "errors": int},
+      "stats": {"received": int, "inserted": int, "skipped": int, "near_duplicates": int, "filtered": int, "errors": int},
       "inserted_records": [{"id": str, "title": str, "content": str, "url": str, "source": str}, ...]
     }
     """
+    return process_news_items_stream(items)
+
+
+def process_news_items_stream(items: Iterable[dict[str, Any]], batch_size: int | None = None) -> dict[str, Any]:
+    """Streaming form of `process_news_items`.
+
+    Consumes `items` one at a time (e.g. from `fetcher.iter_rss_items`) and
+    filters them locally; survivors are written in batches of `batch_size`
+    (`INGEST_BATCH_SIZE`): one chunked `content_hash` lookup plus one chunked
+    bulk insert per batch instead of two Supabase round-trips per item. Only
+    `inserted_records` (needed for summary generation) is kept in memory.
+
+    Hashes are first checked against the local `hash_filter`; only possible
+    matches are looked up in Supabase. Near duplicates of recent rows or of
+    earlier items in the run are skipped, or inserted with `duplicate_of`
+    set, depending on `NEAR_DUP_MODE`.
+    """
+    if batch_size is None:
+        batch_size = load_config().ingest_batch_size
+    batch_size = max(1, batch_size)
 
-    inserted_count = 0
-    skipped_count = 0
-    filtered_count = 0
-    error_count = 0
+    stats = {"received": 0, "inserted": 0, "skipped": 0, "near_duplicates": 0, "filtered": 0, "errors": 0}
     inserted_records: list[dict[str, str]] = []
+    # (item, payload) pairs waiting for the next hash lookup + insert.
+    pending: list[tuple[dict[str, Any], dict[str, Any]]] = []
 
     for item in items:
+        stats["received"] += 1
         try:
-            title = item.get("title", "")
-            content = item.get("content", "")
-            url = item.get("url", "")
-
-            publish_time = parse_publish_time(item.get("publish_time"))
-
-            if not is_target_date(publish_time, TARGET_START_DATE):
-                filtered_count += 1
-                continue
-
-            if not _is_relevant_news(title, content):
-                filtered_count += 1
-                print(f"[FILTER] Irrelevant to cross-border intelligence | title={title}")
-                continue
-
-            if _is_low_quality_content(title, content):
-                filtered_count += 1
-                print(f"[FILTER] Low-quality content skipped | title={title}")
-                continue
-
-            content_hash = generate_content_hash(content)
-            existed = get_news_by_hash(content_hash)
-
-            if existed:
-                skipped_count += 1
-                print(f"[SKIP] Existing hash: {content_hash}")
-                continue
-
-            payload = {
-                "title": title,
-                "content": content,
-                "source": item.get("source", "Google News"),
-                "url": url,
-                "publish_time": publish_time.isoformat() if publish_time else None,
-                "content_hash": content_hash,
-            }
-
-            inserted = insert_news_raw(payload)
-            inserted_count += 1
-            print(f"[NEW] Inserted | source={payload['source']} | title={title}")
-
-            if inserted.get("id"):
-                inserted_records.append(
-                    {
-                        "id": inserted["id"],
-                        "title": inserted.get("title", title),
-                        "content": inserted.get("content", content),
-                        "url": inserted.get("url", url),
-                        "source": inserted.get("source", payload["source"]),
-                    }
-                )
-
+            payload = _prepare_payload(item, stats)
         except Exception as exc:
-            error_count += 1
+            stats["errors"] += 1
+            feed_state.mark_feed_failed(item.get("feed_url"))
             print(f"[ERROR] title={item.get('title', '')} | error={exc}")
+            continue
+        if payload is None:
+            continue
+        pending.append((item, payload))
+        if len(pending) >= batch_size:
+            _flush_batch(pending, stats, inserted_records)
+            pending = []
+
+    if pending:
+        _flush_batch(pending, stats, inserted_records)
+
+    return {"stats": stats, "inserted_records": inserted_records}
+
+
+def _prepare_payload(item: dict[str, Any], stats: dict[str, int]) -> dict[str, Any] | None:
+    """Apply the local filters; return the news_raw row, or None if filtered."""
+    title = item.get("title", "")
+    content = item.get("content", "")
+
+    publish_time = parse_publish_time(item.get("publish_time"))
+
+    if not is_target_date(publish_time, TARGET_START_DATE):
+        stats["filtered"] += 1
+        mark_seen(item.get("index_keys"))
+        return None
+
+    if not _is_relevant_news(title, content):
+        stats["filtered"] += 1
+        print(f"[FILTER] Irrelevant to cross-border intelligence | title={title}")
+        if item.get("extraction_degraded"):
+            # Judged on an RSS fallback: retry next run with the article body.
+            feed_state.mark_feed_failed(item.get("feed_url"))
+        else:
+            mark_seen(item.get("index_keys"))
+        return None
+
+    feed_ledger.record(item.get("feed_url"), relevant=1)
+
+    if _is_low_quality_content(title, content):
+        stats["filtered"] += 1
+        # Not marked as seen: a later run may extract a better body.
+        print(f"[FILTER] Low-quality content skipped | title={title}")
+        return None
 
     return {
-        "stats": {
-            "inserted": inserted_count,
-            "skipped": skipped_count,
-            "filtered": filtered_count,
-            "errors": error_count,
-        },
-        "inserted_records": inserted_records,
+        "title": title,
+        "content": content,
+        "source": item.get("source", "Google News"),
+        "url": item.get("url", ""),
+        "publish_time": publish_time.isoformat() if publish_time else None,
+        "content_hash": generate_content_hash(content),
     }
+
+
+def _mark_feeds_failed(items: Iterable[dict[str, Any]]) -> None:
+    """Keep the conditional GET validators of these items' feeds unsaved so they are fetched again."""
+    for item in items:
+        feed_state.mark_feed_failed(item.get("feed_url"))
+
+
+def _flush_batch(
+    pending: list[tuple[dict[str, Any], dict[str, Any]]],
+    stats: dict[str, int],
+    inserted_records: list[dict[str, str]],
+) -> None:
+    """Skip existing / repeated hashes, bulk insert the rest and record each item."""
+    content_hashes = [payload["content_hash"] for _, payload in pending]
+    content_filter = hash_filter.get_filter()
+    try:
+        # Hashes the local filter has never seen are new; only filter hits need the database.
+        candidates = content_filter.might_contain(content_hashes) if content_filter else content_hashes
+        existing = get_existing_hashes(candidates) if candidates else set()
+    except Exception as exc:
+        stats["errors"] += len(pending)
+        _mark_feeds_failed(item for item, _ in pending)
+        print(f"[ERROR] hash lookup failed | items={len(pending)} | error={exc}")
+        return
+    if content_filter is not None:
+        content_filter.record_confirmed(existing)
+
+    index = near_duplicate.get_index()
+    skip_near_duplicates = load_config().near_dup_mode == "skip"
+    # content_hash -> fingerprint / (matched news_id or content_hash, similarity)
+    fingerprints: dict[str, int] = {}
+    near_matches: dict[str, tuple[str, float]] = {}
+
+    to_insert: list[tuple[dict[str, Any], dict[str, Any]]] = []
+    for item, payload in pending:
+        content_hash = payload["content_hash"]
+        if content_hash in existing:
+            stats["skipped"] += 1
+            print(f"[SKIP] Existing hash: {content_hash}")
+            mark_seen(item.get("index_keys"))
+            continue
+        # Later items with the same body in this batch are duplicates too.
+        existing.add(content_hash)
+
+        if index is not None:
+            value = near_duplicate.fingerprint(payload["title"], payload["content"])
+            match = _find_near_duplicate(index, value, fingerprints)
+            if match is not None:
+                stats["near_duplicates"] += 1
+                if skip_near_duplicates:
+                    stats["skipped"] += 1
+                    print(f"[NEAR-DUP] Skipped | similarity={match[1]:.2f} | title={payload['title']}")
+                    mark_seen(item.get("index_keys"))
+                    continue
+                near_matches[content_hash] = match
+            fingerprints[content_hash] = value
+            # Lets every host's index sync without reading bodies (see near_duplicate.sync).
+            payload["simhash"] = near_duplicate.signed64(value)
+        to_insert.append((item, payload))
+    if not to_insert:
+        return
+
+    try:
+        rows = insert_news_raw_batch([payload for _, payload in to_insert])
+    except Exception as exc:
+        stats["errors"] += len(to_insert)
+        _mark_feeds_failed(item for item, _ in to_insert)
+        print(f"[ERROR] batch insert failed | items={len(to_insert)} | error={exc}")
+        return
+    inserted_by_hash = {row.get("content_hash"): row for row in rows}
+    hash_filter.add_hashes(inserted_by_hash)
+
+    indexed: list[tuple[str, int, str | None]] = []
+    for item, payload in to_insert:
+        title = payload["title"]
+        content_hash = payload["content_hash"]
+        inserted = inserted_by_hash.get(content_hash)
+        if inserted is None:
+            stats["errors"] += 1
+            feed_state.mark_feed_failed(item.get("feed_url"))
+            print(f"[ERROR] title={title} | error=insert returned no row")
+            continue
+        stats["inserted"] += 1
+        mark_seen(item.get("index_keys"))
+        feed_ledger.record(item.get("feed_url"), inserted=1)
+        print(f"[NEW] Inserted | source={payload['source']} | title={title}")
+
+        if not inserted.get("id"):
+            continue
+        if content_hash in fingerprints:
+            indexed.append((inserted["id"], fingerprints[content_hash], inserted.get("created_at")))
+
+        match = near_matches.get(content_hash)
+        if match is not None:
+            # Matches within this batch point at a content_hash until it has an id.
+            duplicate_of = inserted_by_hash.get(match[0], {}).get("id", match[0])
+            try:
+                index.link(inserted["id"], duplicate_of, match[1])
+            except Exception as exc:
+                print(f"[WARN] near-duplicate link failed | id={inserted['id']} | error={exc}")
+            mark_news_duplicate(inserted["id"], duplicate_of)
+            print(f"[NEAR-DUP] Marked | duplicate_of={duplicate_of} | title={title}")
+
+        inserted_records.append(
+            {
+                "id": inserted["id"],
+                "title": inserted.get("title", title),
+                "content": inserted.get("content", payload["content"]),
+                "url": inserted.get("url", payload["url"]),
+                "source": inserted.get("source", payload["source"]),
+            }
+        )
+
+    if index is not None and indexed:
+        try:
+            index.add_many(indexed)
+        except Exception as exc:
+            print(f"[WARN] near-duplicate index update failed | error={exc}")
+
+
+def _find_near_duplicate(
+    index: near_duplicate.NearDuplicateIndex,
+    value: int,
+    batch_fingerprints: dict[str, int],
+) -> tuple[str, float] | None:
+    try:
+        return index.find(value, extra=batch_fingerprints)
+    except Exception as exc:
+        print(f"[WARN] near-duplicate lookup failed | error={exc}")
+        return None
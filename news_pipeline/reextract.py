@@ -0,0 +1,127 @@
+"""Offline re-extraction of stored articles from the local HTML cache.
+
+After tuning the extraction heuristics in `fetcher.py`, run:
+
+    python -m news_pipeline.reextract [--limit 5000] [--workers N] [--dry-run]
+
+Recent `news_raw` rows are matched by URL against pages kept by `html_store`
+(`HTML_CACHE_ENABLED=true` at fetch time); a page downloaded from a fallback
+candidate URL is also indexed under the row's article URL. Each cached page is re-extracted on a
+process pool without any network access; `news_raw.content` is updated via
+`update_news_content` only when the new body is usable and scores higher than
+the stored one.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from . import hash_filter
+from .fetcher import (
+    _analyze_candidate,
+    _clean_html,
+    _is_usable_article_text,
+    _score_content_candidate,
+    extract_content_from_html,
+)
+from .html_store import decode_html, load_html
+from .processor import generate_content_hash
+from .supabase_client import fetch_news_raw_for_cleanup, update_news_content
+
+
+def _reextract_page(job: tuple[bytes, str, str]) -> str | None:
+    """Process-pool worker: run the full (non-tiered) extraction on one cached page."""
+    body, encoding, title = job
+    try:
+        extracted = extract_content_from_html(decode_html(body, encoding), title)
+    except Exception:
+        return None
+    return _clean_html(extracted).strip() if extracted else None
+
+
+def _is_improvement(title: str, current: str, candidate: str | None, min_gain: float) -> bool:
+    if not candidate or candidate == current:
+        return False
+    analysis = _analyze_candidate(candidate)
+    if not _is_usable_article_text(candidate, title, analysis):
+        return False
+    return _score_content_candidate(candidate, analysis) > _score_content_candidate(current) + min_gain
+
+
+def reextract_cached_articles(
+    *,
+    limit: int = 5000,
+    workers: int | None = None,
+    dry_run: bool = False,
+    min_gain: float = 0.0,
+) -> dict[str, int]:
+    """Re-extract cached pages for recent rows and update bodies that improve."""
+    rows = fetch_news_raw_for_cleanup(limit=limit)
+    workers = max(1, workers or os.cpu_count() or 1)
+    stats = {"scanned": len(rows), "cached": 0, "improved": 0, "unchanged": 0, "updated": 0}
+    if not dry_run:
+        # Loaded so rewritten hashes reach the ingest-side content hash filter.
+        hash_filter.get_filter()
+
+    # Bounded batches keep at most a few pages per worker in memory at once.
+    batch_size = workers * 8
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for start in range(0, len(rows), batch_size):
+            batch: list[tuple[dict[str, Any], tuple[bytes, str, str]]] = []
+            for row in rows[start : start + batch_size]:
+                cached = load_html(row.get("url") or "")
+                if cached is None:
+                    continue
+                body, encoding = cached
+                batch.append((row, (body, encoding, row.get("title") or "")))
+            stats["cached"] += len(batch)
+
+            results = pool.map(_reextract_page, [job for _, job in batch])
+            for (row, _), candidate in zip(batch, results):
+                title = row.get("title") or ""
+                current = (row.get("content") or "").strip()
+                if not _is_improvement(title, current, candidate, min_gain):
+                    stats["unchanged"] += 1
+                    continue
+                stats["improved"] += 1
+                print(
+                    f"[REEXTRACT] improved | id={row['id']} | len {len(current)} -> {len(candidate)} "
+                    f"| title={title}"
+                )
+                if not dry_run:
+                    content_hash = generate_content_hash(candidate)
+                    if update_news_content(
+                        news_id=row["id"],
+                        content=candidate,
+                        content_hash=content_hash,
+                    ):
+                        hash_filter.add_hashes([content_hash])
+                        stats["updated"] += 1
+    hash_filter.flush_run()
+    return stats
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Re-extract news_raw bodies from the local HTML cache.")
+    parser.add_argument("--limit", type=int, default=5000, help="most recent news_raw rows to scan")
+    parser.add_argument("--workers", type=int, default=None, help="extraction processes (default: CPU count)")
+    parser.add_argument("--min-gain", type=float, default=0.0, help="required quality-score improvement")
+    parser.add_argument("--dry-run", action="store_true", help="report improvements without updating rows")
+    args = parser.parse_args(argv)
+
+    stats = reextract_cached_articles(
+        limit=args.limit,
+        workers=args.workers,
+        dry_run=args.dry_run,
+        min_gain=args.min_gain,
+    )
+    print(f"[REEXTRACT] {stats}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
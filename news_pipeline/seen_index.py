@@ -0,0 +1,123 @@
+"""Cross-run index of RSS entries that already went through the pipeline.
+
+Entries are keyed by normalized RSS link, resolved article URL and a title
+fingerprint. The fetcher consults the index before any article download;
+the processor marks entries once their outcome (inserted / existing /
+filtered) is known, so a crashed run does not hide unprocessed entries.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import time
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from . import local_store
+from .config import load_config
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen_entries (
+    entry_key TEXT PRIMARY KEY,
+    seen_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_seen_entries_seen_at ON seen_entries (seen_at);
+"""
+
+# Short or generic titles ("Weekly roundup") are not distinctive enough to key on.
+_MIN_TITLE_FINGERPRINT_CHARS = 24
+_TRACKING_PARAM_PREFIXES = ("utm_", "fbclid", "gclid", "mc_")
+
+_pruned = False
+
+
+def normalize_link(url: str | None) -> str:
+    """Normalize a URL for identity checks (host case, tracking params, fragment, trailing slash)."""
+    raw = (url or "").strip()
+    if not raw:
+        return ""
+    try:
+        parsed = urlparse(raw)
+    except Exception:
+        return raw
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not key.lower().startswith(_TRACKING_PARAM_PREFIXES)
+    ]
+    path = parsed.path.rstrip("/") or "/"
+    return urlunparse(
+        (parsed.scheme.lower(), parsed.netloc.lower(), path, "", urlencode(query), "")
+    )
+
+
+def title_fingerprint(title: str | None) -> str:
+    """Return a stable hash of the normalized title, or "" for short titles."""
+    normalized = re.sub(r"[^a-z0-9\u4e00-\u9fff]+", " ", (title or "").lower()).strip()
+    if len(normalized) < _MIN_TITLE_FINGERPRINT_CHARS:
+        return ""
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+def build_entry_keys(
+    rss_link: str | None = None,
+    title: str | None = None,
+    resolved_url: str | None = None,
+) -> list[str]:
+    """Return all index keys describing one entry."""
+    keys: list[str] = []
+    # RSS links and resolved URLs share one namespace, so a publisher feed link
+    # also matches the same article reached through a Google News redirect.
+    for url in (normalize_link(rss_link), normalize_link(resolved_url)):
+        if url and f"url:{url}" not in keys:
+            keys.append(f"url:{url}")
+    fingerprint = title_fingerprint(title)
+    if fingerprint:
+        keys.append(f"title:{fingerprint}")
+    return keys
+
+
+def _prune_once() -> None:
+    """Drop keys older than SEEN_INDEX_RETENTION_DAYS (once per process)."""
+    global _pruned
+    if _pruned:
+        return
+    _pruned = True
+    retention_days = load_config().seen_index_retention_days
+    if retention_days <= 0:
+        return
+    cutoff = time.time() - retention_days * 86400
+    local_store.execute("DELETE FROM seen_entries WHERE seen_at < ?", (cutoff,))
+
+
+def is_seen(keys: list[str]) -> bool:
+    """Return True when any key was marked in an earlier run."""
+    if not keys:
+        return False
+    try:
+        local_store.ensure_schema("seen_entries", _SCHEMA)
+        _prune_once()
+        placeholders = ",".join("?" for _ in keys)
+        row = local_store.fetch_one(
+            f"SELECT 1 FROM seen_entries WHERE entry_key IN ({placeholders}) LIMIT 1",
+            tuple(keys),
+        )
+        return row is not None
+    except Exception as exc:
+        print(f"[WARN] seen_index lookup failed | error={exc}")
+        return False
+
+
+def mark_seen(keys: list[str] | None) -> None:
+    """Record entry keys as processed."""
+    if not keys:
+        return
+    now = time.time()
+    try:
+        local_store.ensure_schema("seen_entries", _SCHEMA)
+        local_store.executemany(
+            "INSERT OR REPLACE INTO seen_entries (entry_key, seen_at) VALUES (?, ?)",
+            [(key, now) for key in keys],
+        )
+    except Exception as exc:
+        print(f"[WARN] seen_index mark failed | error={exc}")
@@ -0,0 +1,49 @@
+"""String similarity for the quality filter and the daily-brief dedupe.
+
+Callers only need "is the ratio at least X" decisions, so `similar()` answers
+that instead of always computing the full `difflib.SequenceMatcher` ratio.
+Decisions are exactly `SequenceMatcher(None, a, b).ratio() >= threshold`;
+difflib's upper bounds are checked first where they pay off:
+
+- the length bound (`real_quick_ratio`, 2 * min / total) costs nothing and
+  always runs. A title against a whole article body fails it immediately.
+- the character multiset bound (`quick_ratio`) only runs for short strings
+  at high thresholds. Two short titles rarely share 75% of their characters
+  by chance, so it rejects most pairs there. Long texts and low thresholds
+  almost always pass it, so it only adds cost.
+
+`scripts/bench_similarity.py` times this against plain difflib at the
+thresholds in use (0.90, 0.78, 0.72, 0.62) and checks that every decision
+matches.
+"""
+
+from __future__ import annotations
+
+from difflib import SequenceMatcher
+
+# `quick_ratio` pre-check only below this length and at/above this threshold.
+_QUICK_RATIO_MAX_CHARS = 200
+_QUICK_RATIO_MIN_THRESHOLD = 0.75
+
+
+def sequence_ratio(a: str, b: str) -> float:
+    """The plain difflib ratio (what `similar` compares against its threshold)."""
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def similar(a: str, b: str, threshold: float) -> bool:
+    """True when `SequenceMatcher(None, a, b).ratio() >= threshold`."""
+    total = len(a) + len(b)
+    if total == 0 or a == b:
+        return 1.0 >= threshold
+    # Same arithmetic as difflib's real_quick_ratio, so the bound is exact.
+    if 2.0 * min(len(a), len(b)) / total < threshold:
+        return False
+    matcher = SequenceMatcher(None, a, b)
+    if (
+        threshold >= _QUICK_RATIO_MIN_THRESHOLD
+        and max(len(a), len(b)) < _QUICK_RATIO_MAX_CHARS
+        and matcher.quick_ratio() < threshold
+    ):
+        return False
+    return matcher.ratio() >= threshold
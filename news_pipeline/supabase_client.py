@@ -49,6 +49,46 @@ def insert_news_raw(data: dict[str, Any]) -> dict[str, Any]:
 
 
 
+def get_existing_hashes(content_hashes: list[str], chunk_size: int = 200) -> set[str]:
+    """Return the subset of `content_hashes` already present in news_raw."""
+    unique = list(dict.fromkeys(h for h in content_hashes if h))
+    existing: set[str] = set()
+    # Batch to avoid oversized query.
+    for i in range(0, len(unique), chunk_size):
+        batch = unique[i : i + chunk_size]
+        response = _client.table(_TABLE).select("content_hash").in_("content_hash", batch).execute()
+        existing.update(row["content_hash"] for row in (response.data or []) if row.get("content_hash"))
+    return existing
+
+
+
+def insert_news_raw_batch(rows: list[dict[str, Any]], chunk_size: int = 100) -> list[dict[str, Any]]:
+    """Bulk insert records into news_raw and return the inserted rows.
+
+    A chunk whose bulk insert fails is retried row by row, so one bad row only
+    loses itself; rows that still fail are left out of the result.
+    """
+    inserted: list[dict[str, Any]] = []
+    for i in range(0, len(rows), chunk_size):
+        batch = rows[i : i + chunk_size]
+        try:
+            response = _client.table(_TABLE).insert(batch).execute()
+            inserted.extend(response.data or [])
+            continue
+        except Exception as exc:
+            print(f"[WARN] insert_news_raw_batch chunk failed, retrying per row | rows={len(batch)} | error={exc}")
+        for row in batch:
+            try:
+                result = insert_news_raw(row)
+            except Exception as exc:
+                print(f"[WARN] insert_news_raw failed | title={row.get('title', '')} | error={exc}")
+                continue
+            if result:
+                inserted.append(result)
+    return inserted
+
+
+
 def update_summary(news_id: str, summary: dict[str, Any] | str) -> None:
     """Update summary JSONB and denormalized fields for a news_raw record.
 
@@ -90,16 +130,18 @@ def update_summary(news_id: str, summary: dict[str, Any] | str) -> None:
         print(f"[WARN] update_summary failed | id={news_id} | error={exc}")
 
 
-def update_news_content(news_id: str, content: str, content_hash: str) -> None:
-    """Update raw content and hash after successful body recovery."""
+def update_news_content(news_id: str, content: str, content_hash: str) -> bool:
+    """Update raw content and hash after successful body recovery; return whether it succeeded."""
     try:
         payload = {
             "content": (content or "").strip(),
             "content_hash": content_hash,
         }
         _client.table(_TABLE).update(payload).eq("id", news_id).execute()
+        return True
     except Exception as exc:
         print(f"[WARN] update_news_content failed | id={news_id} | error={exc}")
+        return False
 
 
 def get_news_without_summary() -> list[dict[str, Any]]:
@@ -182,6 +224,73 @@ def fetch_news_raw_for_cleanup(limit: int = 5000) -> list[dict[str, Any]]:
         return []
 
 
+def fetch_simhashes_since(
+    created_after_iso: str,
+    after_id: str | None = None,
+    limit: int = 1000,
+) -> list[dict[str, Any]]:
+    """Fetch up to `limit` (id, created_at, simhash) rows after a `(created_at, id)` key, oldest first."""
+    query = _client.table(_TABLE).select("id,created_at,simhash")
+    if after_id:
+        query = query.or_(
+            f'created_at.gt."{created_after_iso}",'
+            f'and(created_at.eq."{created_after_iso}",id.gt."{after_id}")'
+        )
+    else:
+        query = query.gte("created_at", created_after_iso)
+    response = query.order("created_at").order("id").limit(limit).execute()
+    return response.data or []
+
+
+def fetch_news_raw_bodies(news_ids: list[str], chunk_size: int = 100) -> list[dict[str, Any]]:
+    """Fetch (id, title, content, created_at) for the given ids."""
+    rows: list[dict[str, Any]] = []
+    for i in range(0, len(news_ids), chunk_size):
+        batch = news_ids[i : i + chunk_size]
+        response = _client.table(_TABLE).select("id,title,content,created_at").in_("id", batch).execute()
+        rows.extend(response.data or [])
+    return rows
+
+
+def mark_news_duplicate(news_id: str, duplicate_of: str) -> bool:
+    """Record on a row which earlier row it is a near duplicate of; return whether it succeeded."""
+    try:
+        _client.table(_TABLE).update({"duplicate_of": str(duplicate_of)}).eq("id", news_id).execute()
+        return True
+    except Exception as exc:
+        print(f"[WARN] mark_news_duplicate failed | id={news_id} | error={exc}")
+        return False
+
+
+def fetch_content_hashes_since(
+    created_after_iso: str | None,
+    after_id: str | None = None,
+    limit: int = 1000,
+) -> list[dict[str, Any]]:
+    """Fetch up to `limit` (id, content_hash, created_at) rows after a `(created_at, id)` key, oldest first.
+
+    Rows sharing the boundary `created_at` are paged by id, so a bulk insert
+    with one timestamp is read completely. Without `after_id` every row at
+    `created_after_iso` is included.
+    """
+    query = _client.table(_TABLE).select("id,content_hash,created_at")
+    if created_after_iso and after_id:
+        query = query.or_(
+            f'created_at.gt."{created_after_iso}",'
+            f'and(created_at.eq."{created_after_iso}",id.gt."{after_id}")'
+        )
+    elif created_after_iso:
+        query = query.gte("created_at", created_after_iso)
+    response = query.order("created_at").order("id").limit(limit).execute()
+    return response.data or []
+
+
+def count_news_raw() -> int:
+    """Return the number of rows in news_raw (one request, no rows transferred)."""
+    response = _client.table(_TABLE).select("id", count="exact").limit(1).execute()
+    return int(response.count or 0)
+
+
 def delete_news_by_ids(news_ids: list[str]) -> int:
     """Delete rows by id and return attempted delete count."""
     if not news_ids:
@@ -0,0 +1,66 @@
+"""Shared phrase analysis for the text-quality heuristics.
+
+A candidate body is normalized once and matched once against the union of
+all phrase families (navigation, language menu, market dashboard, promo);
+each heuristic then reads its family's hit count from the same
+`TextAnalysis` instead of re-normalizing and re-scanning the text.
+
+Matching tests each distinct phrase with `str.__contains__` on the
+normalized text. For a few dozen phrases this C-level substring search is
+faster in CPython than one compiled alternation regex (which needs a
+lookahead to report overlapping phrases); `scripts/bench_text_analysis.py`
+measures both.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, Mapping
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace and lowercase (the form all phrase lists are written in)."""
+    if not text:
+        return ""
+    return re.sub(r"\s+", " ", text).strip().lower()
+
+
+@dataclass(frozen=True)
+class TextAnalysis:
+    """Normalized text plus the phrases / per-family hit counts found in it."""
+
+    normalized: str
+    phrases: frozenset[str]
+    counts: Mapping[str, int]
+
+    def count(self, family: str) -> int:
+        return self.counts.get(family, 0)
+
+
+class PhraseMatcher:
+    """Match several named phrase families against a text in one pass."""
+
+    def __init__(self, families: Mapping[str, Iterable[str]]):
+        self._families = {name: tuple(phrase for phrase in phrases if phrase) for name, phrases in families.items()}
+        # Phrases shared by several families ("log in") are searched only once.
+        self._phrases = tuple(dict.fromkeys(phrase for family in self._families.values() for phrase in family))
+
+    @property
+    def phrases(self) -> tuple[str, ...]:
+        return self._phrases
+
+    def find(self, normalized: str) -> frozenset[str]:
+        """Return the phrases occurring in already-normalized text."""
+        if not normalized:
+            return frozenset()
+        return frozenset(phrase for phrase in self._phrases if phrase in normalized)
+
+    def analyze(self, text: str) -> TextAnalysis:
+        """Normalize `text` once and count phrase hits per family."""
+        normalized = normalize_text(text)
+        phrases = self.find(normalized)
+        counts = {
+            name: sum(1 for phrase in family if phrase in phrases) for name, family in self._families.items()
+        }
+        return TextAnalysis(normalized=normalized, phrases=phrases, counts=counts)
@@ -0,0 +1,142 @@
+"""Resolved-URL cache for redirect-style RSS links (Google News).
+
+Maps an RSS link to its final article URL. Failed resolutions are stored as an
+empty string with a shorter TTL so known-bad links are not retried every run.
+An in-memory LRU sits in front of the SQLite table; expired rows are deleted
+once per process.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+
+from . import local_store
+from .config import load_config
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resolved_urls (
+    rss_link TEXT PRIMARY KEY,
+    final_url TEXT NOT NULL DEFAULT '',
+    resolved_at REAL NOT NULL
+);
+"""
+
+_LOCK = threading.Lock()
+# rss_link -> (final_url, expires_at)
+_memory: OrderedDict[str, tuple[str, float]] = OrderedDict()
+_settings: tuple[float, float, int] | None = None
+_stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "negative_hits": 0}
+_pruned = False
+
+
+def _get_settings() -> tuple[float, float, int]:
+    """Return (positive_ttl_sec, negative_ttl_sec, memory_size)."""
+    global _settings
+    if _settings is None:
+        cfg = load_config()
+        _settings = (
+            max(0, cfg.url_cache_ttl_hours) * 3600.0,
+            max(0, cfg.url_cache_negative_ttl_hours) * 3600.0,
+            max(1, cfg.url_cache_memory_size),
+        )
+    return _settings
+
+
+def _prune_once() -> None:
+    """Delete rows past their TTL (once per process)."""
+    global _pruned
+    if _pruned:
+        return
+    _pruned = True
+    positive_ttl, negative_ttl, _ = _get_settings()
+    now = time.time()
+    local_store.execute(
+        """
+        DELETE FROM resolved_urls
+        WHERE (final_url != '' AND resolved_at < ?) OR (final_url = '' AND resolved_at < ?)
+        """,
+        (now - positive_ttl, now - negative_ttl),
+    )
+
+
+def _remember_in_memory(rss_link: str, final_url: str, expires_at: float) -> None:
+    _, _, memory_size = _get_settings()
+    with _LOCK:
+        _memory[rss_link] = (final_url, expires_at)
+        _memory.move_to_end(rss_link)
+        while len(_memory) > memory_size:
+            _memory.popitem(last=False)
+
+
+def get_cached_url(rss_link: str) -> str | None:
+    """Return cached final URL, "" for a cached failure, or None on cache miss."""
+    now = time.time()
+    with _LOCK:
+        cached = _memory.get(rss_link)
+        if cached and cached[1] > now:
+            _memory.move_to_end(rss_link)
+            _stats["memory_hits"] += 1
+            if not cached[0]:
+                _stats["negative_hits"] += 1
+            return cached[0]
+        if cached:
+            _memory.pop(rss_link, None)
+
+    positive_ttl, negative_ttl, _ = _get_settings()
+    try:
+        local_store.ensure_schema("resolved_urls", _SCHEMA)
+        _prune_once()
+        row = local_store.fetch_one(
+            "SELECT final_url, resolved_at FROM resolved_urls WHERE rss_link = ?",
+            (rss_link,),
+        )
+    except Exception as exc:
+        print(f"[WARN] get_cached_url failed | error={exc}")
+        row = None
+
+    if row:
+        final_url = row[0] or ""
+        expires_at = float(row[1]) + (positive_ttl if final_url else negative_ttl)
+        if expires_at > now:
+            _remember_in_memory(rss_link, final_url, expires_at)
+            with _LOCK:
+                _stats["disk_hits"] += 1
+                if not final_url:
+                    _stats["negative_hits"] += 1
+            return final_url
+
+    with _LOCK:
+        _stats["misses"] += 1
+    return None
+
+
+def remember_url(rss_link: str, final_url: str | None) -> None:
+    """Store a resolution result; pass None/"" to record a failed resolution."""
+    if not rss_link:
+        return
+    positive_ttl, negative_ttl, _ = _get_settings()
+    value = (final_url or "").strip()
+    now = time.time()
+    _remember_in_memory(rss_link, value, now + (positive_ttl if value else negative_ttl))
+    try:
+        local_store.ensure_schema("resolved_urls", _SCHEMA)
+        _prune_once()
+        local_store.execute(
+            """
+            INSERT INTO resolved_urls (rss_link, final_url, resolved_at) VALUES (?, ?, ?)
+            ON CONFLICT(rss_link) DO UPDATE SET
+                final_url = excluded.final_url,
+                resolved_at = excluded.resolved_at
+            """,
+            (rss_link, value, now),
+        )
+    except Exception as exc:
+        print(f"[WARN] remember_url failed | error={exc}")
+
+
+def get_url_cache_stats() -> dict[str, int]:
+    """Return cache counters for this process."""
+    with _LOCK:
+        return dict(_stats)
@@ -0,0 +1,175 @@
+"""Date-window planning for Google News search feeds.
+
+Google News RSS returns at most ~100 items per query, so long backfills are
+split into `after:` / `before:` date windows. The adaptive planner starts with
+one wide window (or the size learned for that query on earlier runs) and the
+fetcher splits a window in half only when it comes back saturated
+(`GOOGLE_SATURATION_THRESHOLD` entries). The smallest window a query needed is
+persisted per query, so busy queries start narrow next time and quiet `site:`
+queries stay at a single request.
+
+`GOOGLE_ADAPTIVE_WINDOWS=false` restores fixed `GOOGLE_WINDOW_DAYS` windows.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+
+from . import local_store
+from .config import load_config
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS google_window_sizes (
+    query TEXT PRIMARY KEY,
+    window_days INTEGER NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+# Learned sizes never grow past this, so a long-quiet query still gets
+# re-probed in reasonably sized pieces on a full backfill.
+_MAX_LEARNED_DAYS = 180
+
+
+@dataclass(frozen=True)
+class FeedWindow:
+    """One feed request; `start` / `end` are set for Google News date windows."""
+
+    url: str
+    start: date | None = None
+    end: date | None = None
+
+    @property
+    def days(self) -> int:
+        if self.start is None or self.end is None:
+            return 0
+        return (self.end - self.start).days
+
+    def can_split(self) -> bool:
+        # `after:` / `before:` have day granularity, so one day is the floor.
+        return self.days >= 2
+
+
+def google_query(feed_url: str) -> str | None:
+    """Return the `q=` of a Google News search feed, or None for other feeds."""
+    if "news.google.com/rss/search" not in feed_url:
+        return None
+    params = parse_qs(urlparse(feed_url).query, keep_blank_values=True)
+    return (params.get("q", [""])[0] or "").strip() or None
+
+
+def build_window_url(feed_url: str, start: date, end: date) -> str:
+    """Add `after:start before:end` to a Google News search feed URL."""
+    parsed = urlparse(feed_url)
+    params = parse_qs(parsed.query, keep_blank_values=True)
+    base_q = (params.get("q", [""])[0] or "").strip()
+    params["q"] = [f"{base_q} after:{start.strftime('%Y-%m-%d')} before:{end.strftime('%Y-%m-%d')}"]
+    query = urlencode(params, doseq=True)
+    return urlunparse((parsed.scheme, parsed.netloc, parsed.path, parsed.params, query, parsed.fragment))
+
+
+def _make_window(feed_url: str, start: date, end: date) -> FeedWindow:
+    return FeedWindow(url=build_window_url(feed_url, start, end), start=start, end=end)
+
+
+def get_learned_window_days(query: str) -> int | None:
+    """Return the window size learned for a query on earlier runs."""
+    try:
+        local_store.ensure_schema("google_window_sizes", _SCHEMA)
+        row = local_store.fetch_one("SELECT window_days FROM google_window_sizes WHERE query = ?", (query,))
+    except Exception as exc:
+        print(f"[WARN] window size lookup failed | query={query} | error={exc}")
+        return None
+    return int(row[0]) if row else None
+
+
+def save_learned_window_days(query: str, window_days: int) -> None:
+    try:
+        local_store.ensure_schema("google_window_sizes", _SCHEMA)
+        local_store.execute(
+            "INSERT OR REPLACE INTO google_window_sizes (query, window_days, updated_at) VALUES (?, ?, ?)",
+            (query, int(window_days), time.time()),
+        )
+    except Exception as exc:
+        print(f"[WARN] window size save failed | query={query} | error={exc}")
+
+
+def plan_windows(
+    feed_url: str,
+    min_publish_time: datetime | None,
+    *,
+    window_days: int,
+    max_windows: int,
+    adaptive: bool = True,
+) -> list[FeedWindow]:
+    """Return the initial windows to request for one feed."""
+    query = google_query(feed_url)
+    if query is None or not min_publish_time:
+        return [FeedWindow(url=feed_url)]
+
+    now_utc = datetime.now(timezone.utc)
+    start_dt = min_publish_time.astimezone(timezone.utc)
+    if start_dt > now_utc:
+        return [FeedWindow(url=feed_url)]
+
+    start = start_dt.date()
+    end = (now_utc + timedelta(days=1)).date()
+    span_days = max(1, (end - start).days)
+    max_windows = max(1, max_windows)
+
+    if adaptive:
+        step = get_learned_window_days(query) or span_days
+        # Leave room in the request budget for splitting saturated windows.
+        step = max(step, math.ceil(span_days / max_windows))
+    else:
+        step = max(1, window_days)
+
+    windows: list[FeedWindow] = []
+    cursor = start
+    while cursor < end and len(windows) < max_windows:
+        window_end = min(cursor + timedelta(days=step), end)
+        windows.append(_make_window(feed_url, cursor, window_end))
+        cursor = window_end
+    return windows or [FeedWindow(url=feed_url)]
+
+
+def split_window(feed_url: str, window: FeedWindow) -> list[FeedWindow]:
+    """Split a saturated window into two halves by date."""
+    if not window.can_split():
+        return [window]
+    middle = window.start + timedelta(days=window.days // 2)
+    return [_make_window(feed_url, window.start, middle), _make_window(feed_url, middle, window.end)]
+
+
+def is_saturated(entry_count: int) -> bool:
+    """Whether a window likely hit Google News' per-query result cap."""
+    return entry_count >= max(1, load_config().google_saturation_threshold)
+
+
+def record_window_outcome(feed_url: str, leaf_counts: list[tuple[FeedWindow, int]], splits: int) -> None:
+    """Learn the window size a query needs from the windows actually consumed.
+
+    After a split the smallest leaf becomes the starting size; when every
+    window stayed well below the cap the learned size doubles so the query
+    drifts back toward a single request.
+    """
+    query = google_query(feed_url)
+    sized = [(window, count) for window, count in leaf_counts if window.days > 0]
+    if query is None or not sized:
+        return
+
+    current = get_learned_window_days(query)
+    if splits:
+        learned = min(window.days for window, _ in sized)
+    elif all(count * 2 < max(1, load_config().google_saturation_threshold) for _, count in sized):
+        if current is None:
+            return
+        learned = min(current * 2, _MAX_LEARNED_DAYS)
+    else:
+        return
+    if learned != current:
+        save_learned_window_days(query, max(1, learned))
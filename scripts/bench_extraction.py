@@ -0,0 +1,140 @@
+"""Benchmark per-page CPU time of article extraction on a saved HTML corpus.
+
+Compares the legacy path (trafilatura on the raw string + two separate
+BeautifulSoup `html.parser` trees) with `fetcher.extract_content_from_html`,
+which parses each page once into an lxml tree shared by all extractors.
+
+Usage:
+    python -m scripts.bench_extraction <corpus_dir> [--repeat 3] [--early-accept-score 200]
+
+`corpus_dir` is scanned recursively for *.html / *.htm files.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import trafilatura
+from bs4 import BeautifulSoup
+
+from news_pipeline.fetcher import (
+    ARTICLE_BLOCK_SELECTORS,
+    _clean_html,
+    _pick_best_candidate,
+    extract_content_from_html,
+)
+
+
+def _legacy_json_ld(html: str) -> str | None:
+    soup = BeautifulSoup(html, "html.parser")
+    candidates: list[str] = []
+    for script in soup.find_all("script", attrs={"type": "application/ld+json"}):
+        text = script.string or script.get_text() or ""
+        if "articleBody" not in text:
+            continue
+        for match in re.findall(r'"articleBody"\s*:\s*"(.+?)"', text, flags=re.DOTALL):
+            cleaned = _clean_html(match.replace('\\"', '"'))
+            if cleaned:
+                candidates.append(cleaned)
+    if not candidates:
+        return None
+    candidates.sort(key=len, reverse=True)
+    return candidates[0]
+
+
+def _legacy_blocks(html: str) -> str | None:
+    soup = BeautifulSoup(html, "html.parser")
+    candidates: list[str] = []
+    for selector in ARTICLE_BLOCK_SELECTORS:
+        for node in soup.select(selector):
+            paragraphs = [_clean_html(p.get_text(" ", strip=True)) for p in node.find_all("p")]
+            paragraphs = [p for p in paragraphs if len(p) > 40]
+            if paragraphs:
+                merged = " ".join(paragraphs).strip()
+                if merged:
+                    candidates.append(merged)
+        if candidates:
+            break
+    return _pick_best_candidate(candidates) if candidates else None
+
+
+def legacy_extract(html: str) -> str | None:
+    """Pre-refactor extraction: three independent parses of the same page."""
+    candidates: list[str] = []
+    primary = trafilatura.extract(html)
+    if primary:
+        candidates.append(_clean_html(primary))
+    json_ld_body = _legacy_json_ld(html)
+    if json_ld_body:
+        candidates.append(_clean_html(json_ld_body))
+    block_body = _legacy_blocks(html)
+    if block_body:
+        candidates.append(_clean_html(block_body))
+    candidates = [c for c in candidates if c]
+    return _pick_best_candidate(candidates) if candidates else None
+
+
+def _cpu_ms(func, html: str, repeat: int) -> tuple[float, str | None]:
+    result = None
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.process_time()
+        result = func(html)
+        best = min(best, time.process_time() - started)
+    return best * 1000.0, result
+
+
+def _describe(label: str, samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (
+        f"{label:<12} total={sum(samples):9.1f}ms  mean={statistics.mean(samples):7.2f}ms  "
+        f"median={statistics.median(samples):7.2f}ms  p95={p95:7.2f}ms"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("corpus_dir", type=Path)
+    parser.add_argument("--repeat", type=int, default=3, help="runs per page; best CPU time is kept")
+    parser.add_argument(
+        "--early-accept-score",
+        type=float,
+        default=None,
+        help="benchmark tiered (cheap-first) extraction with this early-exit score",
+    )
+    args = parser.parse_args(argv)
+
+    def shared_extract(html: str) -> str | None:
+        return extract_content_from_html(html, early_accept_score=args.early_accept_score)
+
+    files = sorted(p for p in args.corpus_dir.rglob("*") if p.suffix.lower() in {".html", ".htm"})
+    if not files:
+        print(f"No .html files under {args.corpus_dir}")
+        return 1
+
+    legacy_ms: list[float] = []
+    shared_ms: list[float] = []
+    same_output = 0
+    for path in files:
+        html = path.read_text(encoding="utf-8", errors="replace")
+        before, before_text = _cpu_ms(legacy_extract, html, args.repeat)
+        after, after_text = _cpu_ms(shared_extract, html, args.repeat)
+        legacy_ms.append(before)
+        shared_ms.append(after)
+        same_output += int(before_text == after_text)
+
+    print(f"pages={len(files)} repeat={args.repeat}")
+    print(_describe("legacy", legacy_ms))
+    print(_describe("single-parse", shared_ms))
+    print(f"speedup={sum(legacy_ms) / max(sum(shared_ms), 1e-9):.2f}x  identical_output={same_output}/{len(files)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""Benchmark the processor's keyword relevance filter on stored articles.
+
+Four implementations of `_is_relevant_news`'s keyword checks are timed on the
+same normalized texts; `processor._normalize_text` itself is timed separately:
+
+- legacy:  one `any(keyword in text)` scan per keyword set, all five sets
+- regex:   one compiled alternation over every keyword, `findall` once
+- single:  one substring pass over every distinct keyword (all hit sets)
+- matcher: `processor._is_relevant_news` (`keyword_matcher.KeywordMatcher`,
+           lazy per-category checks that skip sets the decision cannot use)
+
+Usage:
+    python -m scripts.bench_relevance [--limit 3000] [--repeat 3]
+    python -m scripts.bench_relevance --corpus <dir> [--repeat 3]
+
+Without `--corpus` the latest `--limit` news_raw rows are read from Supabase
+(needs SUPABASE_URL / SUPABASE_SERVICE_ROLE_KEY); `--corpus` scans a directory
+recursively for *.txt bodies and *.html pages.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+from news_pipeline import processor
+from news_pipeline.text_analysis import PhraseMatcher
+
+_SETS = {
+    "cross_border": processor.CROSS_BORDER_KEYWORDS,
+    "ecommerce": processor.ECOMMERCE_KEYWORDS,
+    "impact": processor.IMPACT_KEYWORDS,
+    "business_signal": processor.BUSINESS_SIGNAL_KEYWORDS,
+    "irrelevant": processor.IRRELEVANT_KEYWORDS,
+}
+
+
+def _decide(flags: dict[str, bool]) -> bool:
+    """The pre-refactor decision rules over per-set flags."""
+    business = flags["ecommerce"] or flags["business_signal"]
+    if flags["irrelevant"] and not business:
+        return False
+    if flags["cross_border"] and business:
+        return True
+    return flags["ecommerce"] and (flags["impact"] or flags["business_signal"])
+
+
+def _legacy(text: str) -> bool:
+    return _decide({name: any(keyword in text for keyword in keywords) for name, keywords in _SETS.items()})
+
+
+_PHRASES = PhraseMatcher(_SETS)
+_ALL_TERMS = sorted(_PHRASES.phrases, key=lambda term: (-len(term), term))
+_REGEX = re.compile("(?=(" + "|".join(re.escape(term) for term in _ALL_TERMS) + "))")
+# Terms contained in a matched term also occur in the text (overlaps the regex cannot report).
+_CLOSURE = {term: {other for other in _ALL_TERMS if other in term} for term in _ALL_TERMS}
+
+
+def _regex(text: str) -> bool:
+    found: set[str] = set()
+    for match in set(_REGEX.findall(text)):
+        found |= _CLOSURE[match]
+    return _decide({name: bool(found & keywords) for name, keywords in _SETS.items()})
+
+
+def _single(text: str) -> bool:
+    found = _PHRASES.find(text)
+    return _decide({name: bool(found & keywords) for name, keywords in _SETS.items()})
+
+
+def _load_from_db(limit: int) -> list[tuple[str, str]]:
+    from news_pipeline.supabase_client import fetch_news_raw_for_cleanup
+
+    return [(row.get("title") or "", row.get("content") or "") for row in fetch_news_raw_for_cleanup(limit=limit)]
+
+
+def _load_from_corpus(corpus_dir: Path) -> list[tuple[str, str]]:
+    from news_pipeline.fetcher import extract_content_from_html
+
+    articles: list[tuple[str, str]] = []
+    for path in sorted(corpus_dir.rglob("*")):
+        suffix = path.suffix.lower()
+        if suffix == ".txt":
+            articles.append((path.stem, path.read_text(encoding="utf-8", errors="replace")))
+        elif suffix in {".html", ".htm"}:
+            body = extract_content_from_html(path.read_text(encoding="utf-8", errors="replace"))
+            if body:
+                articles.append((path.stem, body))
+    return articles
+
+
+def _time_ms(func, inputs: list, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for value in inputs:
+            func(*value) if isinstance(value, tuple) else func(value)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000.0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, default=None, help="read *.txt / *.html instead of news_raw")
+    parser.add_argument("--limit", type=int, default=3000, help="news_raw rows to read")
+    parser.add_argument("--repeat", type=int, default=3, help="passes over the articles; best time is kept")
+    args = parser.parse_args(argv)
+
+    articles = _load_from_corpus(args.corpus) if args.corpus else _load_from_db(args.limit)
+    if not articles:
+        print("No articles to benchmark.")
+        return 1
+    texts = [processor._normalize_text(f"{title} {content}") for title, content in articles]
+
+    normalize_ms = _time_ms(lambda title, content: processor._normalize_text(f"{title} {content}"), articles, args.repeat)
+    # Time `_is_relevant_news` on the pre-normalized texts (normalizing them again is not free).
+    normalize = processor._normalize_text
+    processor._normalize_text = lambda text: text.strip()
+    try:
+        matcher_ms = _time_ms(lambda text: processor._is_relevant_news(text, ""), texts, args.repeat)
+    finally:
+        processor._normalize_text = normalize
+    timings = {
+        "legacy": _time_ms(_legacy, texts, args.repeat),
+        "regex": _time_ms(_regex, texts, args.repeat),
+        "single": _time_ms(_single, texts, args.repeat),
+        "matcher": matcher_ms,
+    }
+
+    decisions = [processor._is_relevant_news(title, content) for title, content in articles]
+    agree = sum(
+        int(_legacy(text) == _regex(text) == _single(text) == decision) for text, decision in zip(texts, decisions)
+    )
+    mean_chars = sum(len(text) for text in texts) / len(texts)
+    print(f"articles={len(articles)} relevant={sum(decisions)} mean_chars={mean_chars:.0f} repeat={args.repeat}")
+    print(f"{'normalize':<9} total={normalize_ms:8.1f}ms  per_article={normalize_ms / len(texts) * 1000:7.1f}us")
+    for label, total in timings.items():
+        print(f"{label:<9} total={total:8.1f}ms  per_article={total / len(texts) * 1000:7.1f}us")
+    print(
+        f"speedup_vs_legacy={timings['legacy'] / max(timings['matcher'], 1e-9):.2f}x  "
+        f"identical_decisions={agree}/{len(texts)}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
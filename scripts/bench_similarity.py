@@ -0,0 +1,124 @@
+"""Benchmark `news_pipeline.similarity` and report agreement with plain difflib.
+
+Pairs are built the way the three call sites build them:
+
+- quality  (0.90): normalized title vs normalized body (`processor._is_low_quality_content`)
+- title    (0.78): every pair of titles in the first `--pairs-from` rows (`daily_brief._is_duplicate_candidate`)
+- summary  (0.72): every pair of "title + summary" texts, same rows (`daily_brief._is_duplicate_candidate`)
+- headline (0.62): the title pairs again, at the headline threshold (`daily_brief._headline_too_close_to_news`,
+  which keeps the plain ratio: the bounds barely reject anything at 0.62)
+
+For each set the script times plain `SequenceMatcher.ratio() >= t` against
+`similarity.similar` (best of `--repeat` passes) and counts decisions that
+differ; any difference is a bug, `similar` must reproduce difflib exactly.
+
+Usage:
+    python -m scripts.bench_similarity [--limit 3000] [--pairs-from 120] [--repeat 3]
+    python -m scripts.bench_similarity --corpus <dir>
+
+Without `--corpus` rows come from news_raw (needs SUPABASE_URL /
+SUPABASE_SERVICE_ROLE_KEY); `--corpus` reads *.html pages (title from
+`<title>`, body from the extractor) and *.txt files (first line is the title).
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from news_pipeline.daily_brief import _norm_for_similarity
+from news_pipeline.processor import _normalize_text
+from news_pipeline.similarity import sequence_ratio, similar
+
+_TITLE_TAG = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+
+def _summary_text(row: dict[str, Any]) -> str:
+    summary = row.get("summary")
+    tldr = summary.get("tldr") if isinstance(summary, dict) else None
+    return str(tldr or row.get("content") or "")[:380]
+
+
+def _load_from_db(limit: int) -> list[dict[str, Any]]:
+    from news_pipeline.supabase_client import fetch_news_raw_for_cleanup
+
+    return fetch_news_raw_for_cleanup(limit=limit)
+
+
+def _load_from_corpus(corpus_dir: Path) -> list[dict[str, Any]]:
+    from news_pipeline.fetcher import extract_content_from_html
+
+    rows: list[dict[str, Any]] = []
+    for path in sorted(corpus_dir.rglob("*")):
+        suffix = path.suffix.lower()
+        text = path.read_text(encoding="utf-8", errors="replace") if suffix in {".txt", ".html", ".htm"} else ""
+        if suffix == ".txt":
+            title, _, body = text.partition("\n")
+            rows.append({"title": title, "content": body})
+        elif suffix in {".html", ".htm"}:
+            match = _TITLE_TAG.search(text)
+            rows.append({"title": match.group(1).strip() if match else "", "content": extract_content_from_html(text) or ""})
+    return rows
+
+
+def _pair_sets(rows: list[dict[str, Any]], pairs_from: int) -> dict[str, tuple[float, list[tuple[str, str]]]]:
+    quality = [(_normalize_text(row.get("title") or ""), _normalize_text(row.get("content") or "")) for row in rows]
+    sample = rows[:pairs_from]
+    titles = [_norm_for_similarity(row.get("title") or "") for row in sample]
+    summaries = [_norm_for_similarity(f"{row.get('title') or ''} {_summary_text(row)}") for row in sample]
+    title_pairs = [(a, b) for a, b in itertools.combinations(titles, 2) if a and b]
+    return {
+        "quality": (0.90, [(t, c) for t, c in quality if t and c]),
+        "title": (0.78, title_pairs),
+        "summary": (0.72, [(a, b) for a, b in itertools.combinations(summaries, 2) if a and b]),
+        "headline": (0.62, title_pairs),
+    }
+
+
+def _timed(decide, pairs: list[tuple[str, str]], repeat: int) -> tuple[float, list[bool]]:
+    best = float("inf")
+    decisions: list[bool] = []
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        decisions = [decide(a, b) for a, b in pairs]
+        best = min(best, time.perf_counter() - started)
+    return best * 1000.0, decisions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, default=None, help="read *.html / *.txt instead of news_raw")
+    parser.add_argument("--limit", type=int, default=3000, help="news_raw rows to read")
+    parser.add_argument("--pairs-from", type=int, default=120, help="rows used for the pairwise title/summary sets")
+    parser.add_argument("--repeat", type=int, default=3, help="passes per set; best time is kept")
+    args = parser.parse_args(argv)
+
+    rows = _load_from_corpus(args.corpus) if args.corpus else _load_from_db(args.limit)
+    if not rows:
+        print("No rows to benchmark.")
+        return 1
+
+    print(f"rows={len(rows)}")
+    mismatches = 0
+    for name, (threshold, pairs) in _pair_sets(rows, args.pairs_from).items():
+        if not pairs:
+            continue
+        legacy_ms, legacy = _timed(lambda a, b: sequence_ratio(a, b) >= threshold, pairs, args.repeat)
+        bounded_ms, bounded = _timed(lambda a, b: similar(a, b, threshold), pairs, args.repeat)
+        agree = sum(map(bool.__eq__, legacy, bounded))
+        mismatches += len(pairs) - agree
+        print(
+            f"{name:<8} t={threshold:.2f} pairs={len(pairs):<6} positives={sum(legacy):<4} "
+            f"difflib={legacy_ms:8.1f}ms similar={bounded_ms:8.1f}ms "
+            f"speedup={legacy_ms / max(bounded_ms, 1e-9):6.2f}x | agree={agree}/{len(pairs)}"
+        )
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
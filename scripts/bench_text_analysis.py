@@ -0,0 +1,139 @@
+"""Benchmark the fetcher's text-quality heuristics on realistic article bodies.
+
+Each body runs the noise checks one candidate goes through during extraction
+(`_is_usable_article_text`, `_is_minimally_usable_text`,
+`_score_content_candidate`). Three implementations are compared:
+
+- legacy: every heuristic re-normalizes the text and scans its own phrase list
+- regex:  one normalization + one `(?=(p1|p2|...))` alternation regex scan
+- shared: `fetcher._analyze_candidate` (`text_analysis.PhraseMatcher`), one
+  normalization + one substring scan, built once per candidate and passed
+  to every heuristic
+
+Usage:
+    python -m scripts.bench_text_analysis <corpus_dir> [--repeat 5]
+
+`corpus_dir` is scanned recursively for *.txt bodies and *.html pages (bodies
+are extracted first with `fetcher.extract_content_from_html`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+from news_pipeline import fetcher
+from news_pipeline.fetcher import (
+    LANGUAGE_MENU_TOKENS,
+    MARKET_DASHBOARD_PHRASES,
+    NAVIGATION_NOISE_PHRASES,
+    PROMO_NOISE_PHRASES,
+    extract_content_from_html,
+)
+from news_pipeline.text_analysis import normalize_text
+
+_FAMILIES = {
+    "navigation": NAVIGATION_NOISE_PHRASES,
+    "language": LANGUAGE_MENU_TOKENS,
+    "dashboard": MARKET_DASHBOARD_PHRASES,
+    "promo": PROMO_NOISE_PHRASES,
+}
+
+
+def _legacy_family_hits(text: str, family: str) -> int:
+    """Pre-refactor behaviour: each heuristic re-normalizes and scans its own list."""
+    lowered = normalize_text(text)
+    return sum(1 for p in _FAMILIES[family] if p in lowered)
+
+
+def _legacy_candidate(text: str) -> tuple[bool, bool, int]:
+    # _is_usable_article_text and _is_minimally_usable_text: dashboard + navigation;
+    # _score_content_candidate: promo + navigation.
+    for _ in range(2):
+        dashboard = _legacy_family_hits(text, "dashboard") >= 2
+        nav = _legacy_family_hits(text, "navigation") >= 3 or _legacy_family_hits(text, "language") >= 3
+    promo = _legacy_family_hits(text, "promo")
+    nav = _legacy_family_hits(text, "navigation") >= 3 or _legacy_family_hits(text, "language") >= 3
+    return nav, dashboard, promo
+
+
+_ALL_PHRASES = sorted({p for phrases in _FAMILIES.values() for p in phrases}, key=lambda p: (-len(p), p))
+_REGEX = re.compile("(?=(" + "|".join(re.escape(p) for p in _ALL_PHRASES) + "))")
+_CLOSURE = {p: {q for q in _ALL_PHRASES if q in p} for p in _ALL_PHRASES}
+
+
+def _regex_candidate(text: str) -> tuple[bool, bool, int]:
+    """One normalization + one lookahead-alternation scan per candidate."""
+    found: set[str] = set()
+    for match in set(_REGEX.findall(normalize_text(text))):
+        found |= _CLOSURE[match]
+    counts = {name: sum(1 for p in phrases if p in found) for name, phrases in _FAMILIES.items()}
+    nav = counts["navigation"] >= 3 or counts["language"] >= 3
+    return nav, counts["dashboard"] >= 2, counts["promo"]
+
+
+def _shared_candidate(text: str) -> tuple[bool, bool, int]:
+    # Same call sequence as `_legacy_candidate`, all reading one analysis.
+    analysis = fetcher._analyze_candidate(text)
+    for _ in range(2):
+        dashboard = fetcher._looks_like_market_dashboard_noise(text, analysis)
+        nav = fetcher._looks_like_navigation_noise(text, analysis)
+    promo = fetcher._promo_noise_hits(text, analysis)
+    nav = fetcher._looks_like_navigation_noise(text, analysis)
+    return nav, dashboard, promo
+
+
+def _load_bodies(corpus_dir: Path) -> list[str]:
+    bodies: list[str] = []
+    for path in sorted(corpus_dir.rglob("*")):
+        suffix = path.suffix.lower()
+        if suffix == ".txt":
+            bodies.append(path.read_text(encoding="utf-8", errors="replace"))
+        elif suffix in {".html", ".htm"}:
+            body = extract_content_from_html(path.read_text(encoding="utf-8", errors="replace"))
+            if body:
+                bodies.append(body)
+    return bodies
+
+
+def _time_ms(func, bodies: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for body in bodies:
+            func(body)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000.0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("corpus_dir", type=Path)
+    parser.add_argument("--repeat", type=int, default=5, help="passes over the corpus; best time is kept")
+    args = parser.parse_args(argv)
+
+    bodies = _load_bodies(args.corpus_dir)
+    if not bodies:
+        print(f"No .txt / .html bodies under {args.corpus_dir}")
+        return 1
+
+    legacy_ms = _time_ms(_legacy_candidate, bodies, args.repeat)
+    regex_ms = _time_ms(_regex_candidate, bodies, args.repeat)
+    shared_ms = _time_ms(_shared_candidate, bodies, args.repeat)
+
+    agree = sum(
+        int(_legacy_candidate(body) == _regex_candidate(body) == _shared_candidate(body)) for body in bodies
+    )
+    mean_chars = sum(len(body) for body in bodies) / len(bodies)
+    print(f"bodies={len(bodies)} mean_chars={mean_chars:.0f} repeat={args.repeat}")
+    for label, total in (("legacy", legacy_ms), ("regex", regex_ms), ("shared", shared_ms)):
+        print(f"{label:<7} total={total:8.1f}ms  per_body={total / len(bodies):6.3f}ms")
+    print(f"speedup_vs_legacy={legacy_ms / max(shared_ms, 1e-9):.2f}x  identical_decisions={agree}/{len(bodies)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,9 @@
+-- Near-duplicate detection (news_pipeline/near_duplicate.py).
+-- simhash: signed 64-bit SimHash of title + body, written at insert so the
+--   pipeline's local index can sync without reading article bodies.
+-- duplicate_of: id of the earlier row this one syndicates (NEAR_DUP_MODE=mark).
+alter table public.news_raw add column if not exists simhash bigint;
+alter table public.news_raw add column if not exists duplicate_of text;
+
+create index if not exists news_raw_created_at_id_idx
+  on public.news_raw (created_at, id);
@@ -0,0 +1,29 @@
+import codecs
+import unittest
+
+from news_pipeline.charset import charset_from_content_type, decode_body, sniff_encoding
+
+
+class TestCharset(unittest.TestCase):
+    def test_header_charset(self):
+        self.assertEqual(charset_from_content_type('text/html; charset="GBK"'), "gbk")
+        self.assertIsNone(charset_from_content_type("text/html"))
+
+    def test_meta_declaration_without_header(self):
+        body = '<html><head><meta charset="gb2312"></head><body>跨境电商</body></html>'.encode("gb18030")
+        self.assertEqual(sniff_encoding(body), "gb2312")
+        self.assertIn("跨境电商", decode_body(body))
+
+    def test_header_wins_over_meta_and_bom_wins_over_header(self):
+        body = '<meta http-equiv="Content-Type" content="text/html; charset=gbk">café'.encode("latin-1")
+        self.assertEqual(decode_body(body, "iso-8859-1")[-4:], "café")
+        self.assertEqual(sniff_encoding(codecs.BOM_UTF8 + b"<html>", "iso-8859-1"), "utf-8-sig")
+
+    def test_utf8_without_declaration_and_truncated_tail(self):
+        body = "<p>Shopify 跨境</p>".encode("utf-8")
+        self.assertEqual(sniff_encoding(body), "utf-8")
+        self.assertEqual(sniff_encoding(body[:-6]), "utf-8")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import base64
+import unittest
+
+from news_pipeline.google_news import decode_google_news_url
+
+
+def _encode(payload: bytes) -> str:
+    length = len(payload)
+    varint = bytearray()
+    while True:
+        byte = length & 0x7F
+        length >>= 7
+        if length:
+            varint.append(byte | 0x80)
+        else:
+            varint.append(byte)
+            break
+    message = b"\x08\x13\x22" + bytes(varint) + payload + b"\xd2\x01\x00"
+    return base64.urlsafe_b64encode(message).decode("ascii").rstrip("=")
+
+
+class TestGoogleNewsDecoder(unittest.TestCase):
+    def test_decode_short_url(self):
+        url = "https://www.retaildive.com/news/tariffs-retail/700001/"
+        link = f"https://news.google.com/rss/articles/{_encode(url.encode())}?oc=5"
+        self.assertEqual(decode_google_news_url(link), url)
+
+    def test_decode_long_url_with_multibyte_length(self):
+        url = "https://www.pymnts.com/news/ecommerce/2026/" + "cross-border-" * 12 + "payments/"
+        self.assertGreater(len(url), 127)
+        link = f"https://news.google.com/rss/articles/{_encode(url.encode())}"
+        self.assertEqual(decode_google_news_url(link), url)
+
+    def test_opaque_token_needs_network(self):
+        link = f"https://news.google.com/rss/articles/{_encode(b'AU_yqLOpaqueIdentifier123')}"
+        self.assertIsNone(decode_google_news_url(link))
+
+    def test_non_google_and_garbage_links(self):
+        self.assertIsNone(decode_google_news_url("https://techcrunch.com/2026/01/01/story/"))
+        self.assertIsNone(decode_google_news_url("https://news.google.com/rss/articles/%%%not-base64"))
+        self.assertIsNone(decode_google_news_url("https://news.google.com/rss/search?q=shopify"))
+
+
+if __name__ == "__main__":
+    unittest.main()
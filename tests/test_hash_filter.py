@@ -0,0 +1,61 @@
+import hashlib
+import types
+import unittest
+from unittest import mock
+
+from news_pipeline.hash_filter import BloomFilter, HashFilter
+
+
+def _hash(value: int) -> str:
+    return hashlib.md5(str(value).encode("utf-8")).hexdigest()
+
+
+class TestBloomFilter(unittest.TestCase):
+    def test_no_false_negatives(self):
+        bloom = BloomFilter.for_capacity(1000, 0.01)
+        for value in range(1000):
+            bloom.add(_hash(value))
+        self.assertTrue(all(_hash(value) in bloom for value in range(1000)))
+        self.assertEqual(bloom.count, 1000)
+
+    def test_false_positive_rate_near_target(self):
+        bloom = BloomFilter.for_capacity(1000, 0.01)
+        for value in range(1000):
+            bloom.add(_hash(value))
+        false_hits = sum(_hash(value) in bloom for value in range(1000, 11000))
+        self.assertLess(false_hits / 10000, 0.03)
+        self.assertAlmostEqual(bloom.expected_fpr(), 0.01, delta=0.005)
+
+
+class TestHashFilter(unittest.TestCase):
+    def test_sync_pages_rows_sharing_one_created_at(self):
+        created_at = "2026-03-01T00:00:00+00:00"
+        rows = [{"id": f"{i:04d}", "content_hash": _hash(i), "created_at": created_at} for i in range(25)]
+
+        def fetch(created_after, after_id=None, limit=1000):
+            remaining = [row for row in rows if after_id is None or row["id"] > after_id]
+            return remaining[:limit]
+
+        hash_filter = HashFilter(BloomFilter.for_capacity(100, 0.01))
+        client = types.SimpleNamespace(fetch_content_hashes_since=fetch)
+        with mock.patch("news_pipeline.hash_filter._SYNC_PAGE_SIZE", 10), mock.patch.dict(
+            "sys.modules", {"news_pipeline.supabase_client": client}
+        ):
+            self.assertEqual(hash_filter.sync(), 25)
+        self.assertTrue(all(_hash(i) in hash_filter.bloom for i in range(25)))
+        self.assertEqual(hash_filter.watermark_id, "0024")
+
+    def test_untrusted_misses_are_verified_and_learned(self):
+        hash_filter = HashFilter(BloomFilter.for_capacity(100, 0.01))
+        hash_filter.add_many([_hash(1)])
+        hash_filter.trust_misses = False
+        self.assertEqual(hash_filter.might_contain([_hash(1), _hash(2)]), [_hash(1), _hash(2)])
+        # _hash(2) was rewritten elsewhere: the database knows it, the filter did not.
+        hash_filter.record_confirmed({_hash(1), _hash(2)})
+        self.assertIn(_hash(2), hash_filter.bloom)
+        self.assertEqual(hash_filter.stats["stale_misses"], 1)
+        self.assertEqual(hash_filter.stats["db_confirmed"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
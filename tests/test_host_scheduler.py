@@ -0,0 +1,38 @@
+import time
+import unittest
+
+from news_pipeline.host_scheduler import HostLimit, HostScheduler, parse_host_limits
+
+
+class TestHostScheduler(unittest.TestCase):
+    def test_parse_overrides(self):
+        default = HostLimit(max_concurrent=2, rate_per_sec=1.0, burst=2)
+        limits = parse_host_limits("retaildive.com=1/0.5, pymnts.com=3/2/4,bad=x", default)
+        self.assertEqual(limits["retaildive.com"], HostLimit(1, 0.5, 2))
+        self.assertEqual(limits["pymnts.com"], HostLimit(3, 2.0, 4))
+        self.assertNotIn("bad", limits)
+
+    def test_token_bucket_paces_one_host(self):
+        scheduler = HostScheduler(HostLimit(max_concurrent=4, rate_per_sec=20.0, burst=1))
+        started = time.monotonic()
+        for _ in range(5):
+            with scheduler.slot("https://www.retaildive.com/news/a"):
+                pass
+        elapsed = time.monotonic() - started
+        # First request uses the burst token; the next four wait ~50ms each.
+        self.assertGreaterEqual(elapsed, 0.18)
+        stats = scheduler.stats()["www.retaildive.com"]
+        self.assertEqual(stats["requests"], 5)
+        self.assertGreater(stats["wait_seconds"], 0)
+
+    def test_override_matches_parent_domain(self):
+        scheduler = HostScheduler(
+            HostLimit(max_concurrent=2, rate_per_sec=0.0),
+            {"pymnts.com": HostLimit(max_concurrent=1, rate_per_sec=0.0)},
+        )
+        self.assertEqual(scheduler._limit_for("www.pymnts.com").max_concurrent, 1)
+        self.assertEqual(scheduler._limit_for("techcrunch.com").max_concurrent, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
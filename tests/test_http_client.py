@@ -0,0 +1,22 @@
+import unittest
+
+from urllib3 import HTTPResponse
+
+from news_pipeline.http_client import _MAX_RETRY_AFTER_SEC, _build_adapter
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_retry_after_is_capped(self):
+        retry = _build_adapter(4, retries=2, backoff=0.5).max_retries
+        response = HTTPResponse(status=429, headers={"Retry-After": "3600"})
+        self.assertEqual(retry.get_retry_after(response), _MAX_RETRY_AFTER_SEC)
+        # urllib3 copies the policy on every attempt; the cap must survive.
+        self.assertEqual(retry.increment("GET", "/", response).get_retry_after(response), _MAX_RETRY_AFTER_SEC)
+
+    def test_no_retries_adapter(self):
+        retry = _build_adapter(4, retries=0, backoff=0.5).max_retries
+        self.assertEqual(retry.total, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
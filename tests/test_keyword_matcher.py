@@ -0,0 +1,33 @@
+import unittest
+
+from news_pipeline.keyword_matcher import KeywordMatcher
+
+MATCHER = KeywordMatcher(
+    {
+        "ecommerce": {"ecommerce", "seller", "电商"},
+        "impact": {"tariff", "ai", "platform"},
+        "business_signal": {"platform", "seller"},
+    }
+)
+
+
+class TestKeywordMatcher(unittest.TestCase):
+    def test_hits_per_category_use_substring_semantics(self):
+        scan = MATCHER.scan("amazon sellers said the new platform fee starts monday")
+        self.assertEqual(
+            scan.hits(),
+            {
+                "ecommerce": frozenset({"seller"}),
+                "impact": frozenset({"ai", "platform"}),
+                "business_signal": frozenset({"platform", "seller"}),
+            },
+        )
+
+    def test_has_matches_any_term(self):
+        scan = MATCHER.scan("跨境电商 出口 增长")
+        self.assertTrue(scan.has("ecommerce"))
+        self.assertFalse(scan.has("business_signal"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+from news_pipeline.near_duplicate import fingerprint, similarity
+
+STORY = (
+    "Amazon will raise fulfillment fees for third-party sellers shipping cross-border orders "
+    "from China to the United States starting in March, the company told merchants on Tuesday. "
+    "The change follows new customs rules on low-value parcels and is expected to push more "
+    "sellers toward regional warehouses ahead of the peak season. Analysts said the higher "
+    "fees could add two to four percent to landed costs for small merchants, who already face "
+    "rising advertising prices on the marketplace. Amazon said the adjustment reflects higher "
+    "transportation and labor costs and that most sellers using its global logistics service "
+    "would see smaller increases. The company also plans to expand its Send to Amazon tool to "
+    "more exporters in Southeast Asia later this year, according to a notice posted on Seller Central."
+)
+
+
+class TestNearDuplicate(unittest.TestCase):
+    def test_syndicated_copy_is_similar(self):
+        copy = STORY.replace("on Tuesday", "this week") + " Read more on PYMNTS."
+        title = "Amazon raises cross-border fees"
+        self.assertGreaterEqual(similarity(fingerprint(title, STORY), fingerprint(title, copy)), 0.9)
+
+    def test_different_story_is_not_similar(self):
+        other = (
+            "Shopify reported stronger quarterly revenue as merchants adopted its payments product, "
+            "while TikTok Shop expanded its logistics program to European markets and cut commissions."
+        )
+        self.assertLess(similarity(fingerprint("", STORY), fingerprint("", other)), 0.9)
+
+    def test_fingerprint_is_stable_64_bit(self):
+        value = fingerprint("跨境电商", STORY)
+        self.assertEqual(value, fingerprint("跨境电商", STORY))
+        self.assertLess(value, 1 << 64)
+
+
+if __name__ == "__main__":
+    unittest.main()
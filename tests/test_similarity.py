@@ -0,0 +1,25 @@
+import random
+import unittest
+
+from news_pipeline.similarity import sequence_ratio, similar
+
+
+class TestSimilarity(unittest.TestCase):
+    def test_matches_difflib(self):
+        rng = random.Random(7)
+        words = ["amazon", "tariff", "seller", "fee", "temu", "shein", "eu", "vat", "跨境", "电商"]
+        # Short titles and long (>= 200 chars) summaries take different bound checks.
+        texts = [" ".join(rng.choice(words) for _ in range(rng.randint(1, 12))) for _ in range(60)]
+        texts += [" ".join(rng.choice(words) for _ in range(rng.randint(30, 60))) for _ in range(20)]
+        texts += ["", "amazon"]
+        for a in texts:
+            for b in texts[::4]:
+                for threshold in (0.62, 0.72, 0.78, 0.90):
+                    self.assertEqual(similar(a, b, threshold), sequence_ratio(a, b) >= threshold, (a, b, threshold))
+
+    def test_length_bound_rejects_title_against_body(self):
+        self.assertFalse(similar("amazon fees", "amazon fees " * 50, 0.9))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+
+from news_pipeline.text_analysis import PhraseMatcher
+
+
+class TestPhraseMatcher(unittest.TestCase):
+    def test_counts_match_substring_semantics(self):
+        families = {
+            "promo": ["注册", "注册送", "log in", "sign up"],
+            "navigation": ["log in", "menu", "privacy policy"],
+        }
+        matcher = PhraseMatcher(families)
+        text = "Main  MENU\n注册送 100 USDT, then LOG   IN to read the Privacy Policy."
+        analysis = matcher.analyze(text)
+        self.assertEqual(analysis.normalized, "main menu 注册送 100 usdt, then log in to read the privacy policy.")
+        for name, phrases in families.items():
+            expected = sum(1 for phrase in phrases if phrase in analysis.normalized)
+            self.assertEqual(analysis.count(name), expected)
+        self.assertEqual(analysis.count("promo"), 3)
+        self.assertEqual(analysis.count("navigation"), 3)
+
+    def test_empty_text(self):
+        analysis = PhraseMatcher({"promo": ["bonus"]}).analyze("   ")
+        self.assertEqual(analysis.normalized, "")
+        self.assertEqual(analysis.count("promo"), 0)
+        self.assertEqual(analysis.count("missing"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from urllib.parse import unquote_plus
+
+from news_pipeline.window_planner import FeedWindow, plan_windows, split_window
+
+FEED = "https://news.google.com/rss/search?q=site:retaildive.com&hl=en-US"
+
+
+class TestWindowPlanner(unittest.TestCase):
+    def test_non_google_feed_is_single_window(self):
+        windows = plan_windows(
+            "https://techcrunch.com/feed/",
+            datetime.now(timezone.utc) - timedelta(days=30),
+            window_days=7,
+            max_windows=24,
+        )
+        self.assertEqual(windows, [FeedWindow(url="https://techcrunch.com/feed/")])
+
+    def test_fixed_windows_cover_range(self):
+        start = datetime.now(timezone.utc) - timedelta(days=20)
+        windows = plan_windows(FEED, start, window_days=7, max_windows=24, adaptive=False)
+        self.assertEqual(len(windows), 3)
+        self.assertEqual(windows[0].start, start.date())
+        for left, right in zip(windows, windows[1:]):
+            self.assertEqual(left.end, right.start)
+        self.assertIn("after:", unquote_plus(windows[0].url))
+
+    def test_split_halves_by_date(self):
+        window = FeedWindow(url=FEED, start=date(2026, 1, 1), end=date(2026, 1, 11))
+        left, right = split_window(FEED, window)
+        self.assertEqual((left.start, left.end), (date(2026, 1, 1), date(2026, 1, 6)))
+        self.assertEqual((right.start, right.end), (date(2026, 1, 6), date(2026, 1, 11)))
+        self.assertIn("after:2026-01-06 before:2026-01-11", unquote_plus(right.url))
+
+    def test_one_day_window_is_not_split(self):
+        window = FeedWindow(url=FEED, start=date(2026, 1, 1), end=date(2026, 1, 2))
+        self.assertFalse(window.can_split())
+        self.assertEqual(split_window(FEED, window), [window])
+
+
+if __name__ == "__main__":
+    unittest.main()